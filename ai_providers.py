@@ -0,0 +1,187 @@
+"""
+Shared AI provider plumbing for the comment responders
+- Per-provider concurrency limits, so parallel reply generation never sends
+  more simultaneous requests to one API than it allows
+- The ChatGPT → Claude → Grok → Gemini fallback cascade, run under those limits
+- Hedged cascade: if a provider has not answered within its rolling p95 latency,
+  the next provider gets the same prompt and the first good answer wins
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+# Maximum simultaneous in-flight requests per provider
+PROVIDER_LIMITS = {
+    "ChatGPT": 4,
+    "Claude": 4,
+    "Grok": 2,
+    "Gemini": 2,
+}
+DEFAULT_PROVIDER_LIMIT = 2
+
+# Comments generated in parallel by process_new_comments_only
+REPLY_WORKERS = 8
+
+# Hedging: wait this long for a provider with too few latency samples,
+# and never hedge sooner than MIN_HEDGE_AFTER
+HEDGE_ENABLED = True
+DEFAULT_HEDGE_AFTER = 8.0
+MIN_HEDGE_AFTER = 1.0
+
+
+class ProviderLimiter:
+    """One semaphore per provider name"""
+
+    def __init__(self, limits=None, default=DEFAULT_PROVIDER_LIMIT):
+        self.limits = dict(PROVIDER_LIMITS if limits is None else limits)
+        self.default = default
+        self.semaphores = {}
+        self.lock = threading.Lock()
+
+    def _semaphore(self, name):
+        with self.lock:
+            if name not in self.semaphores:
+                self.semaphores[name] = threading.BoundedSemaphore(self.limits.get(name, self.default))
+            return self.semaphores[name]
+
+    @contextmanager
+    def slot(self, name):
+        """Hold one of the provider's request slots for the duration of a call"""
+        semaphore = self._semaphore(name)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+def cascade(providers, prompt, limiter=None):
+    """
+    Try providers in order until one returns a non-empty response.
+    providers is a list of (name, call) where call(prompt) returns text or None.
+    Returns (response, name), or (None, None) if every provider failed.
+    """
+    for name, call in providers:
+        if limiter is None:
+            response = call(prompt)
+        else:
+            with limiter.slot(name):
+                response = call(prompt)
+        if response:
+            return response, name
+    return None, None
+
+
+def hedge_delay(latency, name):
+    """Seconds to wait on a provider before hedging to the next one"""
+    p95 = latency.p95(name) if latency is not None else None
+    if p95 is None:
+        return DEFAULT_HEDGE_AFTER
+    return max(MIN_HEDGE_AFTER, p95)
+
+
+def hedged_cascade(providers, prompt, limiter=None, latency=None, on_attempt=None):
+    """
+    Like cascade(), but a provider that is slower than its p95 does not stall the chain.
+
+    The first provider starts immediately. The next one starts when the previous
+    one fails, or when it has been running longer than its hedge_delay(); time spent
+    waiting for a limiter slot does not count, so a saturated provider is not
+    hedged before its call has even started. The first
+    non-empty response wins; hedges that have not started their HTTP call yet are
+    cancelled, and calls already in flight are abandoned (their result is ignored
+    but their latency is still recorded).
+    on_attempt(name) is called as each provider is tried.
+    Returns (response, name), or (None, None) if every provider failed.
+    """
+    providers = list(providers)
+    if not providers:
+        return None, None
+
+    order = {name: index for index, (name, _) in enumerate(providers)}
+    cancelled = threading.Event()
+
+    def attempt(name, call, started):
+        if limiter is None:
+            return timed(name, call, started)
+        with limiter.slot(name):
+            return timed(name, call, started)
+
+    def timed(name, call, started):
+        if cancelled.is_set():
+            return None
+        started.set_result(time.monotonic())     # the hedge clock starts once the slot is held
+        start = time.perf_counter()
+        response = call(prompt)
+        if latency is not None:
+            latency.record(name, time.perf_counter() - start, ok=bool(response))
+        return response
+
+    pool = ThreadPoolExecutor(max_workers=len(providers))
+    running = {}           # future -> provider name
+    started = {}           # provider name -> Future resolved with its start time
+    next_index = 0
+
+    def launch_next():
+        nonlocal next_index
+        name, call = providers[next_index]
+        next_index += 1
+        if on_attempt:
+            on_attempt(name)
+        started[name] = Future()
+        running[pool.submit(attempt, name, call, started[name])] = name
+
+    try:
+        launch_next()
+        while running:
+            timeout = None
+            waiting = set(running)
+            if next_index < len(providers):
+                newest = started[providers[next_index - 1][0]]
+                if newest.done():
+                    elapsed = time.monotonic() - newest.result()
+                    timeout = max(0.0, hedge_delay(latency, providers[next_index - 1][0]) - elapsed)
+                else:
+                    waiting.add(newest)    # still queued for a limiter slot: wait for it to start
+
+            done, _ = wait(waiting, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                launch_next()          # hedge: the newest provider is slower than its p95
+                continue
+            finished = [future for future in done if future in running]
+            if not finished:
+                continue               # the newest provider got its slot; its hedge clock is running
+
+            # If several finish together, provider order decides
+            for future in sorted(finished, key=lambda f: order[running[f]]):
+                name = running.pop(future)
+                response = None if future.exception() else future.result()
+                if response:
+                    return response, name
+
+            if next_index < len(providers):
+                launch_next()          # plain fallback after a failure
+        return None, None
+    finally:
+        cancelled.set()
+        for future in running:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def generate_reply(providers, prompt, limiter=None, latency=None, on_attempt=None, hedge=HEDGE_ENABLED):
+    """Entry point shared by the CLI responder and the GUI"""
+    if hedge:
+        return hedged_cascade(providers, prompt, limiter, latency, on_attempt)
+    if on_attempt:
+        providers = [(name, _announce(name, call, on_attempt)) for name, call in providers]
+    return cascade(providers, prompt, limiter)
+
+
+def _announce(name, call, on_attempt):
+    def wrapped(prompt):
+        on_attempt(name)
+        return call(prompt)
+    return wrapped
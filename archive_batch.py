@@ -0,0 +1,223 @@
+"""
+Batched archiving of posted NEWS IN articles to ARCHIVE3
+- Posted articles are queued and committed together: one append_rows to
+  ARCHIVE3 plus one batch_update deleting their NEWS IN rows
+- Queued entries are kept in a local pending file until committed, so a
+  crash between posting and archiving is finished by the next run
+- With a job journal, an article's journal entry is dropped once its row is
+  archived, so the same link checked again later is processed from scratch
+"""
+
+import json
+import os
+from datetime import datetime
+
+# Archive sheet for fully processed articles
+ARCHIVE3_SHEET = 'ARCHIVE3'
+ARCHIVE3_HEADERS = ['x', 'SCORE', 'Date', 'Title', 'Link', 'Publisher', 'Author',
+                    'GPT Score', 'Claude Score', 'Gemini Score', 'Grok Score', 'Perplexity Score',
+                    'AI Avg', 'Source Score', 'GPT POV', 'Claude POV', 'Gemini POV', 'Grok POV',
+                    'Perplexity POV', 'Source', 'Bit.ly Link', 'LinkedIn URL', 'Gamma URL', 'Topic', 'Posted Date']
+ARCHIVE3_LINKEDIN_COL = ARCHIVE3_HEADERS.index('LinkedIn URL')
+
+# Archiving is batched: one append + one grouped delete every N articles (and at the end of a run)
+ARCHIVE_COMMIT_EVERY = 5
+
+SOURCE_SHEET = 'NEWS IN'
+
+
+def is_worksheet_not_found(error):
+    """True for gspread's WorksheetNotFound (checked by name so gspread isn't needed here)"""
+    return type(error).__name__ == 'WorksheetNotFound'
+
+
+def build_archive_row(row, short_link, short_linkedin_url, gamma_url, topic_display='', posted_date=None):
+    """Original NEWS IN data + completion columns, in ARCHIVE3 column order"""
+    archive_row = list(row)
+    # Pad to ensure we have enough columns
+    while len(archive_row) < 20:
+        archive_row.append('')
+
+    # Add completion data including topic
+    archive_row.append(short_link)           # Bit.ly Link (article)
+    archive_row.append(short_linkedin_url)   # LinkedIn URL
+    archive_row.append(gamma_url)            # Gamma URL
+    archive_row.append(topic_display)        # Topic (e.g., "41 Artificial Intelligence")
+    archive_row.append(posted_date or datetime.now().strftime('%Y-%m-%d %H:%M'))  # Posted Date
+    return archive_row
+
+
+def group_row_ranges(row_nums):
+    """Group 1-based row numbers into contiguous (start, end) ranges, highest first"""
+    ranges = []
+    for row_num in sorted(set(row_nums), reverse=True):
+        if ranges and ranges[-1][0] == row_num + 1:
+            ranges[-1] = (row_num, ranges[-1][1])
+        else:
+            ranges.append((row_num, row_num))
+    return ranges
+
+
+class Archive3Batch:
+    """
+    Collects processed articles and commits them together:
+    one append_rows to ARCHIVE3 plus one batch_update deleting the NEWS IN rows.
+
+    Crash safety: every entry is written to pending_file before its
+    LinkedIn post is considered archived, and its state is advanced
+    (pending -> appended) after each sheet call. Leftovers from a crashed run
+    are finished by recover() before NEWS IN is read again, checking ARCHIVE3
+    for rows that were appended before the crash so nothing is archived twice.
+    """
+
+    def __init__(self, sm, link_col, commit_every=ARCHIVE_COMMIT_EVERY, pending_file=None, journal=None):
+        self.sm = sm
+        self.link_col = link_col        # 0-based NEWS IN column holding the article link
+        self.commit_every = commit_every
+        self.pending_file = pending_file
+        self.journal = journal
+        self.entries = []
+        self.archive_sheet = None
+        self.source_sheet = None
+
+    # ---------- local pending file ----------
+
+    def _save(self):
+        if not self.pending_file:
+            return
+        if not self.entries:
+            if os.path.exists(self.pending_file):
+                os.remove(self.pending_file)
+            return
+        tmp_path = self.pending_file + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.pending_file)
+
+    def _load(self):
+        try:
+            with open(self.pending_file) as f:
+                return json.load(f)
+        except (OSError, ValueError, TypeError):
+            return []
+
+    # ---------- sheets ----------
+
+    def _get_archive_sheet(self):
+        """Get or create ARCHIVE3 (looked up once per batch)"""
+        if self.archive_sheet is not None:
+            return self.archive_sheet
+
+        try:
+            archive_sheet = self.sm.spreadsheet.worksheet(ARCHIVE3_SHEET)
+            # Ensure headers exist
+            if archive_sheet.row_count == 0 or not archive_sheet.cell(1, 1).value:
+                archive_sheet.append_row(ARCHIVE3_HEADERS)
+        except Exception as e:
+            if not is_worksheet_not_found(e):
+                raise
+            archive_sheet = self.sm.spreadsheet.add_worksheet(ARCHIVE3_SHEET, rows=1000, cols=30)
+            archive_sheet.append_row(ARCHIVE3_HEADERS)
+
+        self.archive_sheet = archive_sheet
+        return archive_sheet
+
+    def _get_source_sheet(self):
+        if self.source_sheet is None:
+            self.source_sheet = self.sm.spreadsheet.worksheet(SOURCE_SHEET)
+        return self.source_sheet
+
+    # ---------- public API ----------
+
+    def add(self, row, row_num, short_link, short_linkedin_url, gamma_url, topic_display='', key=None):
+        """
+        Queue a posted article; commits automatically every `commit_every` articles.
+        key is the article's journal key: marked 'archive' once queued, forgotten once committed.
+        """
+        self.entries.append({
+            'row_num': row_num,
+            'link': row[self.link_col] if self.link_col < len(row) else '',
+            'archive_row': build_archive_row(row, short_link, short_linkedin_url, gamma_url, topic_display),
+            'state': 'pending',
+            'key': key,
+        })
+        self._save()
+        if self.journal and key:
+            self.journal.record(key, 'archive', 'queued')
+
+        if self.commit_every and len(self.entries) >= self.commit_every:
+            return self.commit()
+        return True
+
+    def recover(self, commit=True):
+        """
+        Finish a commit interrupted by a crash in a previous run.
+        With commit=False the leftovers are only queued (row numbers resolved
+        against the current sheet) and go out with the next commit, so row
+        numbers the caller read before this call stay valid.
+        """
+        leftovers = self._load()
+        if not leftovers:
+            return True
+
+        print(f"♻️  Recovering {len(leftovers)} article(s) left unarchived by a previous run")
+        self.entries = leftovers + self.entries
+
+        # Rows appended before the crash but not yet marked as such
+        if any(e['state'] == 'pending' for e in leftovers):
+            archived_urls = set(self._get_archive_sheet().col_values(ARCHIVE3_LINKEDIN_COL + 1))
+            for entry in leftovers:
+                if entry['state'] == 'pending' and entry['archive_row'][ARCHIVE3_LINKEDIN_COL] in archived_urls:
+                    entry['state'] = 'appended'
+
+        # Row numbers may have moved since the crash - locate rows by article link
+        links = self._get_source_sheet().col_values(self.link_col + 1)
+        for entry in leftovers:
+            row_num = entry['row_num']
+            if row_num and row_num <= len(links) and links[row_num - 1] == entry['link']:
+                continue
+            matches = [i for i, value in enumerate(links, start=1) if value and value == entry['link']]
+            entry['row_num'] = matches[0] if matches else None  # None = already deleted
+
+        return self.commit() if commit else True
+
+    def commit(self):
+        """Append queued rows to ARCHIVE3 and delete them from NEWS IN in two calls"""
+        if not self.entries:
+            return True
+
+        try:
+            pending = [e for e in self.entries if e['state'] == 'pending']
+            if pending:
+                self._get_archive_sheet().append_rows([e['archive_row'] for e in pending])
+                for entry in pending:
+                    entry['state'] = 'appended'
+                self._save()
+
+            row_nums = [e['row_num'] for e in self.entries if e.get('row_num')]
+            if row_nums:
+                source_sheet = self._get_source_sheet()
+                requests_body = [{
+                    'deleteDimension': {
+                        'range': {
+                            'sheetId': source_sheet.id,
+                            'dimension': 'ROWS',
+                            'startIndex': start - 1,
+                            'endIndex': end,
+                        }
+                    }
+                } for start, end in group_row_ranges(row_nums)]
+                self.sm.spreadsheet.batch_update({'requests': requests_body})
+
+            print(f"✓ Archived {len(self.entries)} article(s) to {ARCHIVE3_SHEET} and removed from NEWS IN")
+            if self.journal:
+                for entry in self.entries:
+                    if entry.get('key'):
+                        self.journal.forget(entry['key'])
+            self.entries = []
+            self._save()
+            return True
+
+        except Exception as e:
+            print(f"Archive error: {e} (kept in {self.pending_file} for the next run)")
+            return False
@@ -0,0 +1,3 @@
+"""
+Microbenchmarks for News Intelligence hot paths
+"""
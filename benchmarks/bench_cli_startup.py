@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: news-intel startup - `--help` wall time and `-X importtime` for each subcommand module
+
+`news-intel --help` must not import any subcommand module; the import table
+shows which modules dominate when a subcommand does load (a new top-level
+import in cli.py shows up here first).
+
+Usage: python -m benchmarks.bench_cli_startup [--repeat 10] [--top 8] [--budget-ms 100]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:  self [us] | cumulative | imported package"
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def wall_time(args, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def import_times(code, skip=()):
+    """[(cumulative_us, self_us, name)] for every module imported by code, slowest first"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=REPO_ROOT, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match and match.group(3) not in skip:
+            rows.append((int(match.group(2)), int(match.group(1)), match.group(3)))
+    error = proc.stderr.strip().splitlines()[-1] if proc.returncode else None
+    return sorted(rows, reverse=True), error
+
+
+def main():
+    from cli import COMMANDS
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=8, help='imports to list per module')
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='target for news-intel --help')
+    args = parser.parse_args()
+
+    bare = wall_time(['-c', 'pass'], args.repeat)
+    help_time = wall_time(['-m', 'cli', '--help'], args.repeat)
+    print(f"interpreter only          {bare * 1000:7.1f} ms")
+    print(f"news-intel --help         {help_time * 1000:7.1f} ms   "
+          f"({'within' if help_time * 1000 <= args.budget_ms else 'OVER'} {args.budget_ms:.0f} ms budget)")
+
+    # modules every interpreter imports at startup are not the subcommand's cost
+    startup = {name for _, _, name in import_times('pass')[0]}
+    modules = ['cli'] + sorted({target.split(':')[0] for target, _ in COMMANDS.values()})
+    for module in modules:
+        rows, error = import_times(f'import {module}', skip=startup)
+        total = next((cumulative for cumulative, _, name in rows if name == module), 0)
+        print(f"\nimport {module}: {total / 1000:.1f} ms" + (f"   (failed: {error})" if error else ""))
+        for cumulative, own, name in rows[:args.top]:
+            print(f"  {cumulative / 1000:8.1f} ms cumulative {own / 1000:8.1f} ms self   {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GUI logo loading at startup - PIL resize on every launch vs the thumbnail cache
+
+Each scenario runs in a fresh interpreter so import costs (PIL in particular)
+are included. Logos are decoded into Tk PhotoImages when a display is available.
+
+Usage: python -m benchmarks.bench_gui_startup [--logos 7] [--source-size 1024] [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+OLD_STARTUP = """
+import os, sys
+from PIL import Image, ImageTk
+sources = {name[:-4]: os.path.join(SRC, name) for name in sorted(os.listdir(SRC))}
+images = []
+for key, path in sources.items():
+    img = Image.open(path)
+    img = img.resize((50, 50), Image.Resampling.LANCZOS)
+    images.append(ImageTk.PhotoImage(img, master=ROOT) if ROOT else img)
+print('PIL' in sys.modules)
+"""
+
+NEW_STARTUP = """
+import os, sys
+from logo_cache import LogoCache
+sources = {name[:-4]: os.path.join(SRC, name) for name in sorted(os.listdir(SRC))}
+cache = LogoCache(sources, CACHE)
+images = []
+for key in sources:
+    path = cache.path(key)
+    images.append(tk.PhotoImage(file=path, master=ROOT) if ROOT else path)
+print('PIL' in sys.modules)
+"""
+
+PRELUDE = """
+import tkinter as tk
+SRC, CACHE, USE_TK = {src!r}, {cache!r}, {use_tk!r}
+ROOT = tk.Tk() if USE_TK else None
+"""
+
+
+def has_display():
+    if sys.platform in ('darwin', 'win32'):
+        return True
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
+def make_logos(directory, count, size):
+    """Synthetic full-size source logos (what LOGOS points at in ~/Downloads)"""
+    from PIL import Image
+
+    for i in range(count):
+        img = Image.new('RGBA', (size, size))
+        img.putdata([((x * 7 + i) % 256, (x * 3) % 256, (x * 11) % 256, 255) for x in range(size * size)])
+        img.save(os.path.join(directory, f"logo{i}.png"))
+
+
+def run(script, src, cache, use_tk):
+    """Wall time of a fresh interpreter running script; returns (seconds, pil_imported)"""
+    code = PRELUDE.format(src=src, cache=cache, use_tk=use_tk) + script
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return time.perf_counter() - start, out.strip().endswith('True')
+
+
+def measure(label, script, src, cache, use_tk, repeat, reset_cache=False):
+    best, pil = float('inf'), False
+    for _ in range(repeat):
+        if reset_cache:
+            for name in os.listdir(cache):
+                os.remove(os.path.join(cache, name))
+        seconds, pil = run(script, src, cache, use_tk)
+        best = min(best, seconds)
+    print(f"  {label:<34} {best * 1000:8.1f} ms   PIL imported: {'yes' if pil else 'no'}")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--logos', type=int, default=7, help='number of logos (the GUI has 7)')
+    parser.add_argument('--source-size', type=int, default=1024, help='source logo width/height in px')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow is required to build the benchmark logos: pip3 install Pillow")
+        return
+
+    use_tk = has_display()
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as cache:
+        make_logos(src, args.logos, args.source_size)
+        print(f"{args.logos} logos at {args.source_size}x{args.source_size}, "
+              f"{'decoded into Tk PhotoImages' if use_tk else 'no display: Tk decode skipped'}")
+        baseline = measure("interpreter + tkinter only", "", src, cache, use_tk, args.repeat)
+        old = measure("PIL resize every launch (old)", OLD_STARTUP, src, cache, use_tk, args.repeat)
+        cold = measure("thumbnail cache, cold", NEW_STARTUP, src, cache, use_tk, args.repeat, reset_cache=True)
+        warm = measure("thumbnail cache, warm", NEW_STARTUP, src, cache, use_tk, args.repeat)
+        print(f"  logo cost over baseline: old {(old - baseline) * 1000:.1f} ms, "
+              f"cold {(cold - baseline) * 1000:.1f} ms, warm {(warm - baseline) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
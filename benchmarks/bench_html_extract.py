@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: html_extract.html_to_text vs the old regex clean_html
+
+Usage: python -m benchmarks.bench_html_extract [--docs 500] [--size 200000]
+"""
+
+import argparse
+import re
+import time
+
+from html_extract import extract_many, html_to_text
+
+PARAGRAPH = (
+    "<p>Researchers at a major AI lab have <b>unveiled</b> a new model &amp; "
+    "benchmarks suggest a 15&ndash;20% improvement on reasoning tests.</p>\n"
+)
+SCRIPT = "<script>window.dataLayer = [];" + "var x = '<div>' + 1;" * 50 + "</script>\n"
+STYLE = "<style>" + ".card{color:#fff;margin:0 auto}" * 50 + "</style>\n"
+
+
+def regex_clean_html(html_text, limit=2000):
+    """The previous clean_html implementation (baseline)"""
+    if not html_text:
+        return ""
+    clean = re.sub(r'<[^>]+>', '', html_text)
+    return ' '.join(clean.split())[:limit]
+
+
+def make_page(size):
+    """Build a synthetic article page of roughly `size` characters"""
+    head = "<html><head><title>Article</title>" + STYLE + SCRIPT + "</head><body>"
+    body = []
+    length = len(head)
+    while length < size:
+        body.append(PARAGRAPH)
+        length += len(PARAGRAPH)
+    return head + ''.join(body) + "</body></html>"
+
+
+def bench(label, fn, docs, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(docs)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<32} {best * 1000:9.1f} ms  ({best / len(docs) * 1e6:8.1f} us/doc)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=500, help='number of pages')
+    parser.add_argument('--size', type=int, default=200000, help='characters per page')
+    parser.add_argument('--limit', type=int, default=2000, help='characters of text to keep')
+    args = parser.parse_args()
+
+    docs = [make_page(args.size) for _ in range(args.docs)]
+    print(f"{args.docs} pages x {args.size:,} chars, limit={args.limit}")
+
+    baseline = bench("regex clean_html", lambda d: [regex_clean_html(x, args.limit) for x in d], docs)
+    serial = bench("html_to_text (serial)", lambda d: [html_to_text(x, args.limit) for x in d], docs)
+    pooled = bench("extract_many (process pool)", lambda d: extract_many(d, limit=args.limit), docs, repeat=1)
+
+    print(f"\n  serial speedup: {baseline / serial:.1f}x   pool speedup: {baseline / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RSS ingestion with ET.fromstring + per-key dicts vs iterparse + PostStore
+
+The old path is the original refresh_rss_feed (regex clean_html, no activity
+index); the new one includes html_to_text entity decoding and the ActivityIndex
+build, so it does more work per item.
+
+Usage: python -m benchmarks.bench_rss_ingest [--items 10000]
+"""
+
+import argparse
+import gc
+import re
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from rss_feed import RSSFeedCache
+
+DESCRIPTION = (
+    "&lt;p&gt;Researchers at a major AI lab have &lt;b&gt;unveiled&lt;/b&gt; a new model "
+    "and benchmarks suggest a 15-20% improvement on reasoning tests.&lt;/p&gt;"
+)
+
+
+def make_feed(items):
+    """Synthetic rss.app style feed with `items` LinkedIn posts"""
+    parts = ["<rss version=\"2.0\"><channel><title>Feed</title>"]
+    for i in range(items):
+        activity_id = 7400000000000000000 + i
+        parts.append(
+            f"<item><title>Post {i}: AI news roundup</title>"
+            f"<description>{DESCRIPTION}</description>"
+            f"<link>https://www.linkedin.com/feed/update/urn:li:activity:{activity_id}</link>"
+            f"<guid>https://www.linkedin.com/feed/update/urn:li:activity:{activity_id}/guid</guid>"
+            f"<pubDate>Mon, 01 Sep 2025 12:00:00 GMT</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode()
+
+
+def old_clean_html(html_text):
+    """NewsSheetResponder.clean_html before html_extract"""
+    if not html_text:
+        return ""
+    clean = re.sub(r'<[^>]+>', '', html_text)
+    return ' '.join(clean.split())[:2000]
+
+
+def old_ingest(content):
+    """The previous refresh_rss_feed body, verbatim apart from self (baseline)"""
+    posts_cache = {}
+    root = ET.fromstring(content)
+    for item in root.findall('.//item'):
+        title = item.find('title')
+        description = item.find('description')
+        link = item.find('link')
+        guid = item.find('guid')
+        if link is not None:
+            post_url = link.text
+            post_data = {
+                "title": title.text if title is not None else "",
+                "description": old_clean_html(description.text) if description is not None else "",
+                "link": post_url,
+                "guid": guid.text if guid is not None else "",
+            }
+            posts_cache[post_url] = post_data
+            activity_match = re.search(r'activity[:\-](\d+)', post_url)
+            if activity_match:
+                posts_cache[activity_match.group(1)] = post_data
+            if guid is not None and guid.text:
+                posts_cache[guid.text] = post_data
+    count = len([k for k in posts_cache if k.isdigit()])
+    return posts_cache, count
+
+
+def new_ingest(content):
+    feed = RSSFeedCache("https://feed")
+    feed._merge(RSSFeedCache.parse(content))
+    return feed.posts_cache, feed.post_count()
+
+
+def parse_only(content):
+    records = RSSFeedCache.parse(content)
+    return records, len(records)
+
+
+def measure(label, fn, content, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    result = fn(content)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} {best * 1000:8.1f} ms   peak {peak / 2**20:7.1f} MiB   "
+          f"retained {retained / 2**20:6.1f} MiB   posts {result[1]}")
+    return best, peak, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000, help='number of feed items')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per path (best is reported)')
+    args = parser.parse_args()
+
+    content = make_feed(args.items)
+    print(f"{args.items:,} items, {len(content) / 2**20:.1f} MiB of XML")
+    old_time, old_peak, old_retained = measure("fromstring + dicts (old)", old_ingest, content, args.repeat)
+    new_time, new_peak, new_retained = measure("iterparse + PostStore", new_ingest, content, args.repeat)
+    parse_time, _, _ = measure("  of which iterparse only", parse_only, content, args.repeat)
+    print(f"  new/old: time {new_time / old_time:.2f}x, peak memory {new_peak / old_peak:.2f}x, "
+          f"retained {new_retained / old_retained:.2f}x "
+          f"(store + index build {(new_time - parse_time) * 1000:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: project hot paths on synthetic corpora, compared against a saved baseline
+
+Every run times each case (best of --repeat) and prints the change against the
+baseline file; the baseline is written on the first run and whenever
+--update-baseline is given. Cases whose module cannot be imported here (a
+missing optional dependency) are reported as skipped.
+
+Usage: python -m benchmarks.suite [--quick] [--only NAME ...] [--update-baseline]
+                                  [--baseline benchmarks/baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_html_extract import make_page
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+REGRESSION_THRESHOLD = 0.20     # slower than baseline by more than this is flagged
+
+CASES = []
+
+
+def case(name, items):
+    """Register a benchmark: setup(items) returns the zero-argument callable to time"""
+    def register(setup):
+        CASES.append((name, items, setup))
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def quiet():
+    """The pipeline functions print progress; keep it off the terminal while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def synthetic_scores(rng, providers=('ChatGPT', 'Claude', 'Gemini', 'Grok', 'Perplexity')):
+    return {
+        name: {'score': rng.randint(40, 95), 'rationale': f"{name} rationale"}
+        for name in providers if rng.random() > 0.1
+    }
+
+
+# ---------- cases ----------
+
+@case("calculate_consensus", 100_000)
+def bench_consensus(items):
+    from fetch_news import calculate_consensus
+
+    rng = random.Random(1)
+    score_sets = [synthetic_scores(rng) for _ in range(items)]
+
+    def run():
+        with quiet():
+            for scores in score_sets:
+                calculate_consensus(scores, 5)
+    return run
+
+
+@case("create_peer_pairs", 100_000)
+def bench_peer_pairs(items):
+    from fetch_news import create_peer_pairs
+
+    rng = random.Random(2)
+    score_sets = [synthetic_scores(rng) for _ in range(items)]
+
+    def run():
+        for scores in score_sets:
+            create_peer_pairs(scores)
+    return run
+
+
+@case("dedupe_articles", 1_000_000)
+def bench_dedupe(items):
+    from fetch_news import dedupe_articles
+
+    rng = random.Random(3)
+    articles = [
+        {'title': f"AI Story {rng.randrange(items // 2)}" if rng.random() > 0.02 else ""}
+        for _ in range(items)
+    ]
+
+    def run():
+        dedupe_articles(articles)
+    return run
+
+
+@case("find_article_by_id", 100_000)
+def bench_find_article(items):
+    from benchmarks.bench_rss_ingest import make_feed
+    from news_sheet_comment_responder import NewsSheetResponder
+    from rss_feed import RSSFeedCache
+
+    posts = 10_000
+    feed = RSSFeedCache("https://feed")
+    feed._merge(RSSFeedCache.parse(make_feed(posts)))
+    responder = NewsSheetResponder.__new__(NewsSheetResponder)   # no sheet / API connection
+    responder.feed = feed
+
+    rng = random.Random(4)
+    comment_ids = []
+    for _ in range(items):
+        activity_id = 7400000000000000000 + rng.randrange(posts * 11 // 10)    # ~9% misses
+        comment_ids.append(f"{activity_id}-ACoAABB7Kw8BOdPQnNzFg")
+
+    def run():
+        for comment_id in comment_ids:
+            responder.find_article_by_id(comment_id)
+    return run
+
+
+@case("rss_parse", 10_000)
+def bench_rss_parse(items):
+    from benchmarks.bench_rss_ingest import make_feed
+    from rss_feed import RSSFeedCache
+
+    content = make_feed(items)
+
+    def run():
+        feed = RSSFeedCache("https://feed")
+        feed._merge(RSSFeedCache.parse(content))
+    return run
+
+
+@case("clean_html", 10_000)
+def bench_clean_html(items):
+    from html_extract import html_to_text     # NewsSheetResponder.clean_html == html_to_text(text, 2000)
+
+    pages = [make_page(20_000) for _ in range(min(items, 100))]
+    docs = [pages[i % len(pages)] for i in range(items)]
+
+    def run():
+        for doc in docs:
+            html_to_text(doc, 2000)
+    return run
+
+
+@case("extract_json", 100_000)
+def bench_extract_json(items):
+    from fetch_news import extract_json
+
+    rng = random.Random(5)
+    texts = [
+        f"Here is my evaluation.\n```json\n{{\"score\": {rng.randint(0, 100)}, "
+        f"\"rationale\": \"Named sources and a neutral tone; headline slightly overstated.\"}}\n```\n"
+        f"Let me know if you need more detail."
+        for _ in range(items)
+    ]
+
+    def run():
+        for text in texts:
+            extract_json(text)
+    return run
+
+
+@case("cli_help", 20)
+def bench_cli_help(items):
+    """`news-intel --help` in a fresh interpreter: catches a heavy import creeping into cli"""
+    command = [sys.executable, '-m', 'cli', '--help']
+
+    def run():
+        for _ in range(items):
+            subprocess.run(command, cwd=REPO_ROOT, check=True, capture_output=True)
+    return run
+
+
+# ---------- runner ----------
+
+def measure(setup, items, repeat):
+    run = setup(items)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(path, results):
+    data = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def compare(seconds, items, previous):
+    """('+12.3%', 0.123) change vs the baseline entry, or ('new', None) if not comparable"""
+    if not previous or previous.get('items') != items:
+        return "new", None
+    change = seconds / previous['seconds'] - 1
+    return f"{change:+.1%}", change
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='corpora 10x smaller')
+    parser.add_argument('--only', nargs='*', help='run only these cases')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true', help='overwrite the baseline with this run')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='flag cases this much slower than baseline (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    previous = (baseline or {}).get('results', {})
+    results = dict(previous)
+    regressions = []
+
+    print(f"{'case':<22} {'items':>10} {'time':>11} {'per item':>11}   vs baseline")
+    for name, items, setup in CASES:
+        if args.only and name not in args.only:
+            continue
+        if args.quick:
+            items = max(1, items // 10)
+        try:
+            seconds = measure(setup, items, args.repeat)
+        except ImportError as e:
+            print(f"{name:<22} {items:>10,}   skipped ({e})")
+            continue
+
+        change, ratio = compare(seconds, items, previous.get(name))
+        regressed = ratio is not None and ratio > args.threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<22} {items:>10,} {seconds * 1000:9.1f}ms {seconds / items * 1e6:9.2f}us   "
+              f"{change}{'  REGRESSION' if regressed else ''}")
+        results[name] = {'items': items, 'seconds': seconds}
+
+    if baseline is None or args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline written to {args.baseline}")
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+news-intel: one entry point for the News Intelligence tools
+- Each subcommand names the module that implements it; the module (and its
+  requests / gspread / rich / PIL / sheet_manager imports) is only imported
+  when that subcommand runs, so `news-intel --help` stays fast
+- Arguments after the subcommand are passed through to the module's main()
+
+Usage: news-intel <command> [args...]     (news-intel <command> --help for details)
+"""
+
+import argparse
+import importlib
+import sys
+
+# name -> ("module:function", help)
+COMMANDS = {
+    'fetch': ("fetch_news:main", "fetch AI news, score it with 5 LLMs, add it to NEWS OUT"),
+    'post': ("process_news_in:main", "build and post checked NEWS IN articles to LinkedIn"),
+    'respond': ("news_sheet_comment_responder:main", "reply to LinkedIn comments (interactive menu)"),
+    'watch': ("comment_daemon:main", "reply to new comments as they arrive"),
+    'serve': ("webhook_server:main", "run the resident webhook service"),
+    'gui': ("news_responder_gui:main", "open the desktop comment responder"),
+    'demo': ("demo:main", "multi-AI scoring demo; --input FILE replays the real pipeline"),
+    'bench': ("benchmarks.suite:main", "run the benchmark suite against the saved baseline"),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="news-intel",
+        description="News Intelligence: AI news scoring, posting and comment replies",
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    for name, (target, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def load(target):
+    """Import "module:function" and return the function"""
+    module_name, function_name = target.split(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Everything after the subcommand belongs to it (including --help)
+    split = next((i for i, arg in enumerate(argv) if not arg.startswith('-')), len(argv))
+    parser = build_parser()
+    args = parser.parse_args(argv[:split + 1])
+    if not args.command:
+        parser.print_help()
+        return 2
+
+    target, _ = COMMANDS[args.command]
+    try:
+        command = load(target)
+    except ImportError as e:
+        print(f"news-intel {args.command}: missing dependency ({e}). Run: pip install -r requirements.txt",
+              file=sys.stderr)
+        return 1
+    return command(argv[split + 1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the comment responder
+- Polls the Comments sheet on a schedule; each poll reads only the mark row and
+  the rows appended after it (see CommentWatermark), never the whole sheet
+- Replies to new comments as they arrive, with one responder kept warm
+  (RSS index, API keys and pooled provider connections) across polls
+- Adaptive polling: tightens to min_interval when comments arrive, backs off
+  towards max_interval while the sheet is quiet
+- Counters for queue depth and reply latency, printed each active poll and
+  optionally written to a JSON status file
+
+Usage: python comment_daemon.py [--min-interval 15] [--max-interval 300] [--status-file PATH]
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+from metrics import LatencyTracker
+from warm_refresh import WarmRefresher
+
+MIN_POLL_SECONDS = 15
+MAX_POLL_SECONDS = 300
+POLL_BACKOFF = 1.5
+
+
+class CommentDaemon:
+    """Poll loop around a warm responder's process_new_comments_only()"""
+
+    def __init__(self, responder, min_interval=MIN_POLL_SECONDS, max_interval=MAX_POLL_SECONDS,
+                 backoff=POLL_BACKOFF, status_file=None):
+        self.responder = responder
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.status_file = status_file
+        self.interval = min_interval
+        self.stop_event = threading.Event()
+        self.refresher = WarmRefresher(responder)
+        self.reply_latency = LatencyTracker(window=200, min_samples=1)
+        self.counters = {
+            'polls': 0,
+            'active_polls': 0,
+            'replies': 0,
+            'errors': 0,
+            'queue_depth': 0,
+            'last_poll': None,
+        }
+
+    def next_interval(self, found):
+        """Tighten after activity, back off while quiet"""
+        if found:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        return self.interval
+
+    def poll_once(self):
+        """One poll: answer whatever arrived since the last one"""
+        self.counters['polls'] += 1
+        self.counters['last_poll'] = time.time()
+        try:
+            summary = self.responder.process_new_comments_only(update_sheet=True) or {}
+        except Exception as e:
+            self.counters['errors'] += 1
+            print(f"❌ Poll failed: {e}")
+            return 0
+
+        pending = summary.get('pending', 0)
+        processed = summary.get('processed', 0)
+        self.counters['queue_depth'] = max(0, pending - processed)
+        self.counters['replies'] += processed
+        for seconds in summary.get('reply_seconds', ()):
+            self.reply_latency.record('reply', seconds)
+        if pending:
+            self.counters['active_polls'] += 1
+        return pending
+
+    def stats(self):
+        """Counters plus reply latency percentiles"""
+        stats = dict(self.counters)
+        stats['interval'] = round(self.interval, 1)
+        stats['reply_p50'] = self.reply_latency.percentile('reply', 50)
+        stats['reply_p95'] = self.reply_latency.p95('reply')
+        return stats
+
+    def write_status(self):
+        if not self.status_file:
+            return
+        try:
+            tmp_path = self.status_file + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.stats(), f, indent=2)
+            os.replace(tmp_path, self.status_file)
+        except OSError as e:
+            print(f"⚠️ Could not write status file: {e}")
+
+    def run(self, max_polls=None):
+        """Poll until stop() (or max_polls polls, for testing)"""
+        self.refresher.start()
+        try:
+            while not self.stop_event.is_set():
+                found = self.poll_once()
+                interval = self.next_interval(found)
+                self.write_status()
+                if found:
+                    stats = self.stats()
+                    p95 = f"{stats['reply_p95']:.1f}s" if stats['reply_p95'] is not None else "n/a"
+                    print(f"📊 queue {stats['queue_depth']} | replies {stats['replies']} | "
+                          f"reply p95 {p95} | next poll in {interval:.0f}s")
+                if max_polls is not None and self.counters['polls'] >= max_polls:
+                    break
+                self.stop_event.wait(interval)
+        finally:
+            self.refresher.stop()
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="news-intel watch", description="Watch the Comments sheet and reply as comments arrive")
+    parser.add_argument("--min-interval", type=float, default=MIN_POLL_SECONDS)
+    parser.add_argument("--max-interval", type=float, default=MAX_POLL_SECONDS)
+    parser.add_argument("--status-file", default=None, help="write counters as JSON after each poll")
+    args = parser.parse_args(argv)
+
+    from news_sheet_comment_responder import get_responder
+
+    daemon = CommentDaemon(get_responder(), args.min_interval, args.max_interval, status_file=args.status_file)
+    print(f"👀 Watching Comments sheet (poll every {args.min_interval:.0f}-{args.max_interval:.0f}s, Ctrl+C to stop)")
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        print(f"\n👋 Stopped: {daemon.stats()}")
+
+
+if __name__ == "__main__":
+    main()
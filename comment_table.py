@@ -0,0 +1,135 @@
+"""
+In-memory model behind the GUI's comment table
+- One compact record per sheet row (row number, date, commenter, industry,
+  article, status) plus the raw row values for processing
+- Sorting reorders an index list; filtering narrows it. Typing more of the
+  same query only re-checks the rows that matched the shorter one
+- The view asks for a window of rows, so it only ever renders what is visible
+"""
+
+COLUMNS = ('row', 'date', 'commenter', 'industry', 'article', 'status')
+STATUS_PENDING = "Pending"
+STATUS_REPLIED = "Replied"
+STATUS_QUEUED = "Queued"
+
+MIN_REPLY_LENGTH = 20
+
+
+class CommentTableModel:
+    """Sortable, filterable list of comment rows"""
+
+    def __init__(self):
+        self.records = []        # [row, date, commenter, industry, article, status]
+        self.raw = []            # sheet values for each record
+        self.search_keys = []    # lowercased commenter / article / industry
+        self.by_row = {}         # sheet row number -> record position
+        self.order = []          # record positions in sort order
+        self.view = []           # positions in sort order that match the filter
+        self.query = ""
+        self.sort_column = 'row'
+        self.descending = False
+        self.first_row = 2
+
+    def set_rows(self, sheet_values, cols, article_title=None, first_row=2):
+        """
+        Load sheet rows (header already stripped). cols maps date / commenter /
+        id / industry / response / post_title to column indices; article_title(row)
+        resolves a title for rows without one in the sheet.
+        """
+        def cell(row, key):
+            col = cols[key]
+            return row[col] if len(row) > col else ""
+
+        records, search_keys, by_row = [], [], {}
+        for offset, row in enumerate(sheet_values):
+            row_num = first_row + offset
+            response = cell(row, 'response')
+            status = STATUS_REPLIED if len(response) >= MIN_REPLY_LENGTH else STATUS_PENDING
+            article = cell(row, 'post_title')
+            if not article and article_title is not None:
+                article = article_title(row) or ""
+            record = [row_num, cell(row, 'date'), cell(row, 'commenter'), cell(row, 'industry'), article, status]
+            by_row[row_num] = len(records)
+            records.append(record)
+            search_keys.append(f"{record[2]}\x1f{record[4]}\x1f{record[3]}".lower())
+
+        self.records = records
+        self.raw = list(sheet_values)
+        self.search_keys = search_keys
+        self.by_row = by_row
+        self.first_row = first_row
+        self.order = list(range(len(records)))
+        self.query = ""
+        self.view = self.order
+        if self.sort_column != 'row' or self.descending:
+            self.sort(self.sort_column, self.descending)
+
+    def __len__(self):
+        return len(self.view)
+
+    def total(self):
+        return len(self.records)
+
+    def sort(self, column, descending=None):
+        """Sort by a column; sorting the current column again flips the direction"""
+        if descending is None:
+            descending = not self.descending if column == self.sort_column else False
+        col = COLUMNS.index(column)
+        records = self.records
+        if col == 0:
+            key = lambda i: records[i][0]
+        else:
+            key = lambda i: (records[i][col].lower(), records[i][0])
+        self.order = sorted(range(len(records)), key=key, reverse=descending)
+        self.sort_column = column
+        self.descending = descending
+        query, self.query = self.query, ""
+        self.filter(query)
+
+    def filter(self, query):
+        """Keep rows whose commenter, article or industry contains query"""
+        query = query.strip().lower()
+        if not query:
+            self.view = self.order
+        elif self.query and query.startswith(self.query):
+            keys = self.search_keys
+            self.view = [i for i in self.view if query in keys[i]]
+        else:
+            keys = self.search_keys
+            self.view = [i for i in self.order if query in keys[i]]
+        self.query = query
+        return len(self.view)
+
+    def window(self, start, count):
+        """Records for view positions start .. start+count"""
+        records = self.records
+        return [records[i] for i in self.view[start:start + count]]
+
+    def row_at(self, position):
+        """Sheet row number shown at a view position"""
+        return self.records[self.view[position]][0]
+
+    def rows_between(self, first, last):
+        """Sheet row numbers for the view positions first..last (inclusive, either order)"""
+        lo, hi = sorted((first, last))
+        records = self.records
+        return [records[i][0] for i in self.view[lo:hi + 1]]
+
+    def items_for(self, row_nums):
+        """(index, row values) pairs, as start_processing expects, for sheet rows"""
+        items = []
+        for row_num in sorted(row_nums):
+            pos = self.by_row.get(row_num)
+            if pos is not None:
+                items.append((row_num - self.first_row, self.raw[pos]))
+        return items
+
+    def set_status(self, row_num, status, article=None):
+        pos = self.by_row.get(row_num)
+        if pos is None:
+            return
+        record = self.records[pos]
+        record[5] = status
+        if article:
+            record[4] = article
+            self.search_keys[pos] = f"{record[2]}\x1f{record[4]}\x1f{record[3]}".lower()
@@ -0,0 +1,86 @@
+"""
+Persistent high-water mark for new-comment detection
+- Remembers the last sheet row already handled plus a fingerprint of that row
+- A run reads only the rows after the mark; if the fingerprint no longer
+  matches (rows deleted or reordered above it) the run falls back to a full scan
+- A full reconcile pass still runs periodically to catch edits to older rows
+"""
+
+import hashlib
+import json
+import os
+import time
+
+RECONCILE_SECONDS = 24 * 3600     # full scan at least once a day
+
+
+class CommentWatermark:
+    """JSON-backed {last_row, fingerprint, last_reconcile}"""
+
+    def __init__(self, path, reconcile_every=RECONCILE_SECONDS, fingerprint_cols=None):
+        self.path = path
+        self.reconcile_every = reconcile_every
+        self.fingerprint_cols = fingerprint_cols
+        self.last_row = None
+        self.fingerprint = None
+        self.last_reconcile = 0.0
+        self.load()
+
+    def fingerprint_of(self, values):
+        """Hash of the identifying cells of a row (columns we write to are excluded)"""
+        cells = list(values)[:self.fingerprint_cols] if self.fingerprint_cols else list(values)
+        while cells and not cells[-1]:
+            cells.pop()
+        return hashlib.sha1("\x1f".join(cells).encode("utf-8")).hexdigest()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self.last_row = data.get('last_row')
+            self.fingerprint = data.get('fingerprint')
+            self.last_reconcile = data.get('last_reconcile', 0.0)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Comment watermark unreadable, doing a full scan: {e}")
+            self.reset()
+
+    def save(self):
+        if not self.path:
+            return
+        data = {
+            'last_row': self.last_row,
+            'fingerprint': self.fingerprint,
+            'last_reconcile': self.last_reconcile,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save comment watermark: {e}")
+
+    def reset(self):
+        self.last_row = None
+        self.fingerprint = None
+        self.last_reconcile = 0.0
+
+    def needs_reconcile(self, now=None):
+        """True when there is no usable mark or the periodic full scan is due"""
+        now = time.time() if now is None else now
+        return self.last_row is None or now - self.last_reconcile >= self.reconcile_every
+
+    def matches(self, row_values):
+        """Does the row at last_row still hold what it held when the mark was set?"""
+        return self.fingerprint is not None and self.fingerprint_of(row_values) == self.fingerprint
+
+    def advance(self, last_row, row_values, reconciled=False, now=None):
+        """Move the mark to last_row (a sheet row number) and persist it"""
+        self.last_row = last_row
+        self.fingerprint = self.fingerprint_of(row_values)
+        if reconciled:
+            self.last_reconcile = time.time() if now is None else now
+        self.save()
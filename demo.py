@@ -4,9 +4,11 @@ News Intelligence System Demo
 Demonstrates multi-AI article scoring with rich visual output.
 
 Run: python demo.py
+     python demo.py --input examples/sample_articles.json   (headless replay, simulated providers)
 """
 from __future__ import annotations
 
+import argparse
 import sys
 import time
 from typing import Dict, List
@@ -385,21 +387,35 @@ def step_consolidated_insights() -> None:
             print(f"  {category}: {rating} - {details}")
 
 
-def show_batch_summary() -> None:
-    """Show summary of all articles analyzed in this session."""
+def show_batch_summary(report: Dict | None = None) -> None:
+    """Show summary of all articles analyzed in this session (measured, when a replay report is given)."""
     print_header("SESSION SUMMARY: ALL ARTICLES")
 
-    # Simulated scores for all articles
-    batch_results = [
-        ("AI Breakthrough: New Model Achieves...", "MIT Tech Review", 7.8, "green", "SHARE"),
-        ("EU Finalizes AI Regulation Framework", "Reuters", 8.5, "green", "SHARE"),
-        ("OpenAI and Microsoft $10B Partnership", "WSJ", 7.2, "green", "SHARE"),
-        ("AI Art Wins Photography Competition", "The Verge", 6.4, "yellow", "REVIEW"),
-        ("Healthcare AI Detects Cancer 94%", "Nature Medicine", 9.1, "green", "SHARE"),
-    ]
+    if report is None:
+        # Illustrative scores for the scripted walkthrough
+        batch_results = [
+            ("AI Breakthrough: New Model Achieves...", "MIT Tech Review", 7.8, "green", "SHARE"),
+            ("EU Finalizes AI Regulation Framework", "Reuters", 8.5, "green", "SHARE"),
+            ("OpenAI and Microsoft $10B Partnership", "WSJ", 7.2, "green", "SHARE"),
+            ("AI Art Wins Photography Competition", "The Verge", 6.4, "yellow", "REVIEW"),
+            ("Healthcare AI Detects Cancer 94%", "Nature Medicine", 9.1, "green", "SHARE"),
+        ]
+    else:
+        batch_results = []
+        for result in report['results']:
+            score = result['consensus'] / 10
+            share = score >= 7
+            batch_results.append((
+                result['title'][:38], result['source'], score,
+                "green" if share else "yellow", "SHARE" if share else "REVIEW",
+            ))
+
+    if not batch_results:
+        print("  No articles scored.")
+        return
 
     if RICH_AVAILABLE:
-        table = Table(title="📊 Batch Analysis Results (5 Articles)", box=box.ROUNDED)
+        table = Table(title=f"📊 Batch Analysis Results ({len(batch_results)} Articles)", box=box.ROUNDED)
         table.add_column("#", justify="right", style="dim", width=3)
         table.add_column("Article", style="white", max_width=38)
         table.add_column("Source", style="cyan")
@@ -422,6 +438,7 @@ def show_batch_summary() -> None:
         # Statistics
         avg_score = sum(r[2] for r in batch_results) / len(batch_results)
         shareable = sum(1 for r in batch_results if r[4] == "SHARE")
+        top = max(batch_results, key=lambda r: r[2])
 
         stats_panel = f"""
 [bold]Session Statistics[/bold]
@@ -432,10 +449,13 @@ def show_batch_summary() -> None:
 [cyan]Need Review:[/cyan]        {len(batch_results) - shareable}
 
 [bold]Top Performer:[/bold]
-  [green]Healthcare AI Detects Cancer (9.1)[/green] - Nature Medicine
-
-[bold]Processing Time:[/bold]  12.4 seconds (avg 2.5s/article)
-[bold]API Calls:[/bold]        25 total (5 per article)
+  [green]{top[0]} ({top[2]:.1f})[/green] - {top[1]}
+"""
+        if report is not None:
+            calls = sum(n or 0 for n in report['calls'].values())
+            stats_panel += f"""
+[bold]Processing Time:[/bold]  {report['wall_seconds']:.1f} seconds measured (avg {report['wall_seconds'] / len(batch_results):.2f}s/article)
+[bold]API Calls:[/bold]        {calls} total (simulated providers)
 """
         console.print(Panel(stats_panel, title="📈 Analytics", border_style="gold1", box=box.ROUNDED))
     else:
@@ -443,6 +463,65 @@ def show_batch_summary() -> None:
             print(f"  {i}. [{score:.1f}] {title[:40]}... - {action}")
 
 
+def show_replay_report(report: Dict) -> None:
+    """Measured wall time, per-stage timings and call counts from a headless replay."""
+    print_header("REPLAY: MEASURED PIPELINE TIMINGS")
+
+    wall = report['wall_seconds']
+    articles = len(report['results'])
+    stage_rows = [
+        (name, data['seconds'], data['count'])
+        for name, data in report['stages'].items()
+    ]
+    call_rows = [
+        (name, calls or 0, report['failures'].get(name) or 0)
+        for name, calls in report['calls'].items()
+    ]
+
+    if RICH_AVAILABLE:
+        stages = Table(title="⏱️  Per-Stage Timings", box=box.ROUNDED)
+        stages.add_column("Stage", style="cyan")
+        stages.add_column("Total", justify="right")
+        stages.add_column("Per Article", justify="right")
+        stages.add_column("Share of Wall", justify="right")
+        for name, seconds, count in stage_rows:
+            stages.add_row(name, f"{seconds * 1000:.1f} ms", f"{seconds / max(count, 1) * 1000:.1f} ms",
+                           f"{seconds / wall:.0%}" if wall else "-")
+        console.print(stages)
+
+        calls = Table(title="📞 Provider Calls", box=box.ROUNDED)
+        calls.add_column("Provider", style="cyan")
+        calls.add_column("Calls", justify="right")
+        calls.add_column("Failed", justify="right")
+        for name, count, failed in call_rows:
+            calls.add_row(name, str(count), str(failed))
+        console.print(calls)
+
+        console.print(f"[bold]Wall time:[/bold] {wall:.2f}s for {articles} articles "
+                      f"({articles / wall * 60:.1f} articles/min)" if wall else "")
+    else:
+        for name, seconds, count in stage_rows:
+            print(f"  {name:<10} {seconds * 1000:9.1f} ms total  {seconds / max(count, 1) * 1000:8.1f} ms/article")
+        for name, count, failed in call_rows:
+            print(f"  {name:<10} {count:4d} calls  {failed:3d} failed")
+        if wall:
+            print(f"  Wall time: {wall:.2f}s for {articles} articles ({articles / wall * 60:.1f} articles/min)")
+
+
+def run_replay(args: argparse.Namespace) -> None:
+    """Headless: real scoring pipeline over --input, against simulated providers."""
+    from replay import load_articles, replay, simulated_callers
+
+    articles = load_articles(args.input)
+    callers = simulated_callers(args.latency, args.jitter, args.fail_rate, args.seed)
+    print(f"Replaying {len(articles)} articles from {args.input} "
+          f"(simulated latency {args.latency:.2f}s ±{args.jitter:.0%}, failure rate {args.fail_rate:.0%})")
+
+    report = replay(articles, callers)
+    show_batch_summary(report)
+    show_replay_report(report)
+
+
 def show_summary() -> None:
     """Show final summary."""
     print_header("WORKFLOW SUMMARY")
@@ -472,8 +551,24 @@ def show_summary() -> None:
         print("  6. INSIGHTS      - Synthesize takeaways")
 
 
-def main() -> None:
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="news-intel demo", description="Multi-AI news scoring demo (no API keys needed)")
+    parser.add_argument("--input", help="article JSON file: run the real scoring pipeline headless "
+                                        "against simulated providers and report measured timings")
+    parser.add_argument("--latency", type=float, default=0.4, help="simulated seconds per provider call")
+    parser.add_argument("--jitter", type=float, default=0.25, help="latency jitter as a fraction (0.25 = ±25%%)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of simulated calls that fail")
+    parser.add_argument("--seed", type=int, default=0, help="seed for simulated latency and failures")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
     """Main entry point."""
+    args = parse_args(argv)
+    if args.input:
+        run_replay(args)
+        return
+
     interactive = sys.stdin.isatty()
 
     def pause(msg: str = "") -> None:
@@ -8,7 +8,9 @@ JS Intelligence - News Article Scoring Pipeline
 - 6th LLM consolidates into 4 "My score is due to..." bullets
 """
 
+import argparse
 import os
+import re
 import requests
 import json
 import random
@@ -213,6 +215,17 @@ Description: {description}
 Return JSON only: {{"score": <0-100>, "rationale": "<2-3 sentence explanation>"}}"""
 
 
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def extract_json(text):
+    """First {...} span of a provider reply, parsed; None if the reply has none"""
+    match = JSON_OBJECT_RE.search(text)
+    if match:
+        return json.loads(match.group())
+    return None
+
+
 def call_chatgpt(prompt):
     try:
         r = requests.post(
@@ -237,11 +250,7 @@ def call_claude(prompt):
             timeout=30
         )
         if r.status_code == 200:
-            import re
-            content = r.json()['content'][0]['text']
-            match = re.search(r'\{.*\}', content, re.DOTALL)
-            if match:
-                return json.loads(match.group())
+            return extract_json(r.json()['content'][0]['text'])
     except:
         pass
     return None
@@ -255,11 +264,7 @@ def call_gemini(prompt):
             timeout=30
         )
         if r.status_code == 200:
-            import re
-            content = r.json()['candidates'][0]['content']['parts'][0]['text']
-            match = re.search(r'\{.*\}', content, re.DOTALL)
-            if match:
-                return json.loads(match.group())
+            return extract_json(r.json()['candidates'][0]['content']['parts'][0]['text'])
     except:
         pass
     return None
@@ -274,11 +279,7 @@ def call_grok(prompt):
             timeout=30
         )
         if r.status_code == 200:
-            import re
-            content = r.json()['choices'][0]['message']['content']
-            match = re.search(r'\{.*\}', content, re.DOTALL)
-            if match:
-                return json.loads(match.group())
+            return extract_json(r.json()['choices'][0]['message']['content'])
     except:
         pass
     return None
@@ -293,61 +294,38 @@ def call_perplexity(prompt):
             timeout=30
         )
         if r.status_code == 200:
-            import re
-            content = r.json()['choices'][0]['message']['content']
-            match = re.search(r'\{.*\}', content, re.DOTALL)
-            if match:
-                return json.loads(match.group())
+            return extract_json(r.json()['choices'][0]['message']['content'])
     except:
         pass
     return None
 
 
-def score_article(article):
-    """Get scores from all 5 AI models"""
-    prompt = SCORING_PROMPT.format(title=article.get('title', ''), description=article.get('description', ''))
-
-    scores = {}
-
-    print("  AI-1 (ChatGPT)...", end=" ", flush=True)
-    result = call_chatgpt(prompt)
-    if result:
-        scores['ChatGPT'] = result
-        print(f"{result.get('score', '?')}%")
-    else:
-        print("FAILED")
+def default_callers():
+    """Scoring order: AI-1 ChatGPT, AI-2 Claude, AI-3 Gemini, AI-4 Grok, AI-5 Perplexity"""
+    return {
+        'ChatGPT': call_chatgpt,
+        'Claude': call_claude,
+        'Gemini': call_gemini,
+        'Grok': call_grok,
+        'Perplexity': call_perplexity
+    }
 
-    print("  AI-2 (Claude)...", end=" ", flush=True)
-    result = call_claude(prompt)
-    if result:
-        scores['Claude'] = result
-        print(f"{result.get('score', '?')}%")
-    else:
-        print("FAILED")
 
-    print("  AI-3 (Gemini)...", end=" ", flush=True)
-    result = call_gemini(prompt)
-    if result:
-        scores['Gemini'] = result
-        print(f"{result.get('score', '?')}%")
-    else:
-        print("FAILED")
+def score_article(article, callers=None):
+    """Get scores from all 5 AI models (callers: {name: fn(prompt)}, defaults to the live APIs)"""
+    prompt = SCORING_PROMPT.format(title=article.get('title', ''), description=article.get('description', ''))
+    callers = default_callers() if callers is None else callers
 
-    print("  AI-4 (Grok)...", end=" ", flush=True)
-    result = call_grok(prompt)
-    if result:
-        scores['Grok'] = result
-        print(f"{result.get('score', '?')}%")
-    else:
-        print("FAILED")
+    scores = {}
 
-    print("  AI-5 (Perplexity)...", end=" ", flush=True)
-    result = call_perplexity(prompt)
-    if result:
-        scores['Perplexity'] = result
-        print(f"{result.get('score', '?')}%")
-    else:
-        print("FAILED")
+    for n, (name, call) in enumerate(callers.items(), 1):
+        print(f"  AI-{n} ({name})...", end=" ", flush=True)
+        result = call(prompt)
+        if result:
+            scores[name] = result
+            print(f"{result.get('score', '?')}%")
+        else:
+            print("FAILED")
 
     return scores
 
@@ -395,13 +373,7 @@ Original Rationale: {original_rationale}
 Provide your critique and suggested adjusted score (if any).
 Return JSON: {{"suggested_score": <0-100>, "critique": "<brief critique>", "accept_original": <true/false>}}"""
 
-    callers = {
-        'ChatGPT': call_chatgpt,
-        'Claude': call_claude,
-        'Gemini': call_gemini,
-        'Grok': call_grok,
-        'Perplexity': call_perplexity
-    }
+    callers = default_callers()
 
     if reviewer_name in callers:
         return callers[reviewer_name](prompt)
@@ -590,13 +562,7 @@ Number of LLMs: {len(valid_scores)}
 
 Check if the average is correct. Return JSON: {{"verified_consensus": <your calculation>, "matches": <true/false>, "note": "<any discrepancy>"}}"""
 
-    callers = {
-        'ChatGPT': call_chatgpt,
-        'Claude': call_claude,
-        'Gemini': call_gemini,
-        'Grok': call_grok,
-        'Perplexity': call_perplexity
-    }
+    callers = default_callers()
 
     verifications = []
     for verifier in verifiers:
@@ -710,6 +676,18 @@ def check_paywall_quick(url: str) -> tuple:
         return False, 0, None
 
 
+def dedupe_articles(articles):
+    """Drop articles without a title or whose title (case-insensitive) was already seen"""
+    seen = set()
+    unique = []
+    for a in articles:
+        t = a.get('title', '').lower()
+        if t and t not in seen:
+            seen.add(t)
+            unique.append(a)
+    return unique
+
+
 def fetch_and_score():
     """Main pipeline"""
 
@@ -731,14 +709,7 @@ def fetch_and_score():
     articles.extend(fetch_newsapi())
     articles.extend(fetch_newsdata())
 
-    # Dedupe
-    seen = set()
-    unique = []
-    for a in articles:
-        t = a.get('title', '').lower()
-        if t and t not in seen:
-            seen.add(t)
-            unique.append(a)
+    unique = dedupe_articles(articles)
 
     print(f"\nTotal unique: {len(unique)} articles")
     print("Article Loaded.")
@@ -828,5 +799,12 @@ def fetch_and_score():
     return added
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """news-intel fetch: health check, fetch, score and add to the NEWS OUT sheet"""
+    parser = argparse.ArgumentParser(prog="news-intel fetch", description="Fetch AI news, score it with 5 LLMs and add it to NEWS OUT")
+    parser.parse_args(argv)
     fetch_and_score()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,20 @@
 Generate animated demo GIF for News Intelligence
 
 This script creates an animated GIF showing the multi-AI scoring process.
+- Each step is rendered once, in a process pool, and held on screen with a
+  per-frame duration instead of repeating the same frame
+- All frames are encoded against one shared palette
 Requires: Pillow
 
-Usage: python generate_demo_gif.py
+Usage: python generate_demo_gif.py [--width 600] [--height 450] [--frames-per-step 3]
+                                   [--hold-frames 5] [--frame-ms 200] [--workers N] [--output demo.gif]
 Output: demo.gif
 """
 
+import argparse
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -20,11 +27,30 @@ except ImportError:
     from PIL import Image, ImageDraw, ImageFont
 
 
+BASE_SIZE = (600, 450)       # the layout below is drawn in these coordinates
+BASE_FONT_SIZE = 10
+TOTAL_STEPS = 9
+
+
+def load_font(size):
+    try:
+        return ImageFont.load_default(size=size)
+    except (TypeError, OSError):     # Pillow < 10.1 or no FreeType: fixed-size bitmap font
+        return ImageFont.load_default()
+
+
 def create_frame(size, step, total_steps):
     """Create a single animation frame"""
     img = Image.new('RGB', size, '#0d1117')
     draw = ImageDraw.Draw(img)
 
+    # Scale the base layout to the requested resolution
+    scale = min(size[0] / BASE_SIZE[0], size[1] / BASE_SIZE[1])
+    font = load_font(max(1, round(BASE_FONT_SIZE * scale)))
+
+    def px(value):
+        return round(value * scale)
+
     # Colors
     gold = '#ffd700'
     white = '#ffffff'
@@ -32,8 +58,8 @@ def create_frame(size, step, total_steps):
     purple = '#a855f7'
 
     # Title
-    draw.text((size[0]//2 - 160, 30), "News Intelligence", fill=gold)
-    draw.text((size[0]//2 - 160, 60), "5-AI Consensus Scoring", fill=white)
+    draw.text((size[0]//2 - px(160), px(30)), "News Intelligence", fill=gold, font=font)
+    draw.text((size[0]//2 - px(160), px(60)), "5-AI Consensus Scoring", fill=white, font=font)
 
     # Animation steps
     steps_text = [
@@ -50,22 +76,23 @@ def create_frame(size, step, total_steps):
 
     # Progress bar
     progress = (step + 1) / total_steps
-    bar_width = 400
+    bar_width = px(400)
     bar_x = (size[0] - bar_width) // 2
-    bar_y = size[1] - 80
+    bar_y = size[1] - px(80)
+    border = max(1, px(2))
 
-    draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + 20],
-                   outline=white, width=2)
+    draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + px(20)],
+                   outline=white, width=border)
 
     fill_width = int(bar_width * progress)
     if fill_width > 0:
-        draw.rectangle([bar_x + 2, bar_y + 2, bar_x + fill_width - 2, bar_y + 18],
+        draw.rectangle([bar_x + border, bar_y + border, bar_x + fill_width - border, bar_y + px(20) - border],
                        fill=purple)
 
     current_text = steps_text[min(step, len(steps_text) - 1)]
-    draw.text((size[0]//2 - 130, bar_y - 40), current_text, fill=white)
+    draw.text((size[0]//2 - px(130), bar_y - px(40)), current_text, fill=white, font=font)
 
-    y_pos = 120
+    y_pos = px(120)
     for i, text in enumerate(steps_text):
         if i < step:
             color = green
@@ -76,36 +103,91 @@ def create_frame(size, step, total_steps):
         else:
             color = '#666666'
             prefix = "  "
-        draw.text((80, y_pos + i * 25), prefix + text, fill=color)
+        draw.text((px(80), y_pos + i * px(25)), prefix + text, fill=color, font=font)
 
     return img
 
 
-def generate_demo_gif():
-    """Generate the demo GIF"""
-    size = (600, 450)
-    total_steps = 9
-    frames = []
-
-    for step in range(total_steps):
-        frame = create_frame(size, step, total_steps)
-        for _ in range(3):
-            frames.append(frame)
-
-    for _ in range(5):
-        frames.append(frames[-1])
-
-    output_path = Path(__file__).parent / "demo.gif"
+def render_step(args):
+    """Process-pool entry point: (size, step, total_steps) -> frame"""
+    return create_frame(*args)
+
+
+def render_frames(size, total_steps, workers=None):
+    """One frame per step, rendered in parallel (workers=1 renders in this process)"""
+    jobs = [(size, step, total_steps) for step in range(total_steps)]
+    if workers == 1:
+        return [render_step(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_step, jobs))
+
+
+def hold_durations(frames, durations):
+    """Merge consecutive identical frames into one frame shown for their summed duration"""
+    merged, merged_durations = [], []
+    previous = None
+    for frame, duration in zip(frames, durations):
+        data = frame.tobytes()
+        if data == previous:
+            merged_durations[-1] += duration
+            continue
+        merged.append(frame)
+        merged_durations.append(duration)
+        previous = data
+    return merged, merged_durations
+
+
+def shared_palette(frames, colors=256):
+    """Quantize every frame against one palette built from all of them"""
+    width, height = frames[0].size
+    sheet = Image.new('RGB', (width, height * len(frames)))
+    for i, frame in enumerate(frames):
+        sheet.paste(frame, (0, i * height))
+    palette = sheet.quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+    return [frame.quantize(palette=palette, dither=Image.Dither.NONE) for frame in frames]
+
+
+def generate_demo_gif(size=BASE_SIZE, total_steps=TOTAL_STEPS, frames_per_step=3, hold_frames=5,
+                      frame_ms=200, workers=None, colors=256, output_path=None):
+    """Generate the demo GIF; returns its path"""
+    start = time.perf_counter()
+    frames = render_frames(size, total_steps, workers)
+    durations = [frames_per_step * frame_ms] * total_steps
+    durations[-1] += hold_frames * frame_ms      # linger on the final consensus
+    frames, durations = hold_durations(frames, durations)
+    frames = shared_palette(frames, colors)
+
+    output_path = output_path or Path(__file__).parent / "demo.gif"
     frames[0].save(
         output_path,
         save_all=True,
         append_images=frames[1:],
-        duration=200,
-        loop=0
+        duration=durations,
+        loop=0,
+        optimize=False,       # the palette is already shared; don't let PIL rebuild it per frame
     )
 
-    print(f"✓ Demo GIF created: {output_path}")
+    elapsed = time.perf_counter() - start
+    print(f"✓ Demo GIF created: {output_path} ({len(frames)} frames, {size[0]}x{size[1]}, "
+          f"{os.path.getsize(output_path) / 1024:.0f} KB in {elapsed:.2f}s)")
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the animated demo GIF")
+    parser.add_argument('--width', type=int, default=BASE_SIZE[0])
+    parser.add_argument('--height', type=int, default=BASE_SIZE[1])
+    parser.add_argument('--frames-per-step', type=int, default=3, help='how long each step is shown, in frames')
+    parser.add_argument('--hold-frames', type=int, default=5, help='extra frames on the final step')
+    parser.add_argument('--frame-ms', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=None, help='render processes (default: CPU count)')
+    parser.add_argument('--colors', type=int, default=256, help='shared palette size')
+    parser.add_argument('--output', default=None, help='default: demo.gif next to this script')
+    args = parser.parse_args(argv)
+
+    generate_demo_gif((args.width, args.height), TOTAL_STEPS, args.frames_per_step, args.hold_frames,
+                      args.frame_ms, args.workers, args.colors, args.output)
 
 
 if __name__ == "__main__":
-    generate_demo_gif()
+    main()
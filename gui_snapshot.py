@@ -0,0 +1,90 @@
+"""
+Local snapshot of the GUI's last known state
+- Comment counts and provider status are written after every reconcile / run
+- The GUI restores them at launch so it is usable immediately, then
+  reconciles with Google Sheets and the RSS feed in the background
+- API keys themselves are never written to the snapshot, only whether each
+  provider had one
+"""
+
+import json
+import os
+import time
+
+SNAPSHOT_VERSION = 1
+
+
+class GUISnapshot:
+    """JSON-backed {total_rows, new_rows, providers, saved_at}"""
+
+    def __init__(self, path):
+        self.path = path
+        self.total_rows = None
+        self.new_rows = None
+        self.providers = {}
+        self.saved_at = None
+
+    def load(self):
+        """True if a usable snapshot was restored"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get('version') != SNAPSHOT_VERSION:
+                return False
+            self.total_rows = data.get('total_rows')
+            self.new_rows = data.get('new_rows')
+            self.providers = {k: bool(v) for k, v in data.get('providers', {}).items()}
+            self.saved_at = data.get('saved_at')
+            return True
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️ GUI snapshot unreadable, starting cold: {e}")
+            return False
+
+    def update(self, total_rows=None, new_rows=None, providers=None):
+        if total_rows is not None:
+            self.total_rows = total_rows
+        if new_rows is not None:
+            self.new_rows = new_rows
+        if providers is not None:
+            self.providers = {k: bool(v) for k, v in providers.items()}
+
+    def save(self, now=None):
+        if not self.path:
+            return
+        self.saved_at = time.time() if now is None else now
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'total_rows': self.total_rows,
+            'new_rows': self.new_rows,
+            'providers': self.providers,
+            'saved_at': self.saved_at,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save GUI snapshot: {e}")
+
+    def age_text(self, now=None):
+        """'5 min ago' style age of the snapshot, or None if never saved"""
+        if not self.saved_at:
+            return None
+        seconds = max(0, (time.time() if now is None else now) - self.saved_at)
+        if seconds < 60:
+            return "just now"
+        if seconds < 3600:
+            return f"{int(seconds // 60)} min ago"
+        if seconds < 86400:
+            return f"{int(seconds // 3600)} h ago"
+        return f"{int(seconds // 86400)} d ago"
+
+
+def count_pending(response_cells, total_rows, min_length=20):
+    """Rows still needing a reply, from the response column values (trailing blanks trimmed)"""
+    answered = sum(1 for value in response_cells if value and len(value) >= min_length)
+    return max(0, total_rows - answered)
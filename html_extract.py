@@ -0,0 +1,123 @@
+"""
+Fast HTML-to-text extraction
+- Decodes HTML entities (&amp;, &#8217;, ...)
+- Drops <script> and <style> blocks entirely
+- Collapses whitespace the same way as ' '.join(text.split())
+- Stops parsing as soon as the first N characters of text are collected
+- Bulk extraction across a process pool for validating hundreds of pages
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html import unescape
+
+# Default length used by the RSS descriptions and sheet columns (matches old clean_html)
+DEFAULT_LIMIT = 2000
+
+# One pass tokenizer: invisible blocks, comments, and tags (group 2 = tag name)
+_TOKEN_RE = re.compile(
+    r'<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>'
+    r'|<!--.*?-->'
+    r'|</?([a-zA-Z][a-zA-Z0-9]*)[^>]*>'
+    r'|<![^>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Block-level tags that separate words ("a<br>b" -> "a b")
+BREAK_TAGS = {
+    'br', 'p', 'div', 'li', 'ul', 'ol', 'tr', 'td', 'th', 'table',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'section', 'article', 'header',
+    'footer', 'blockquote', 'pre', 'hr', 'title',
+}
+
+
+def html_to_text(html_text, limit=DEFAULT_LIMIT):
+    """Return the first `limit` characters of visible text in an HTML fragment"""
+    if not html_text:
+        return ""
+
+    parts = []
+    length = 0
+    pending_space = False
+    pos = 0
+    end = len(html_text)
+
+    while pos < end:
+        match = _TOKEN_RE.search(html_text, pos)
+        chunk_end = match.start() if match else end
+
+        if chunk_end > pos:
+            data = html_text[pos:chunk_end]
+            if '&' in data:
+                data = unescape(data)
+            words = data.split()
+            if words:
+                if data[0].isspace():
+                    pending_space = True
+                for word in words:
+                    if pending_space and length:
+                        parts.append(' ')
+                        length += 1
+                    parts.append(word)
+                    length += len(word)
+                    pending_space = True
+                    if length >= limit:
+                        return ''.join(parts)[:limit]
+                # "foo<b>bar</b>" stays "foobar", like the old regex stripper
+                pending_space = data[-1].isspace()
+            elif data:
+                pending_space = True
+
+        if not match:
+            break
+
+        tag = match.group(2)
+        if tag is None or tag.lower() in BREAK_TAGS:
+            pending_space = True
+        pos = match.end()
+
+    return ''.join(parts)[:limit]
+
+
+def _extract_one(args):
+    """Process pool worker (must be module-level to be picklable)"""
+    html_text, limit = args
+    return html_to_text(html_text, limit)
+
+
+def extract_many(html_docs, limit=DEFAULT_LIMIT, max_workers=None, chunksize=16):
+    """
+    Extract text from many HTML documents in a process pool.
+    Returns a list of texts in the same order as html_docs.
+    """
+    html_docs = list(html_docs)
+    if len(html_docs) < 2 or max_workers == 1:
+        return [html_to_text(doc, limit) for doc in html_docs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_extract_one, ((doc, limit) for doc in html_docs), chunksize=chunksize))
+
+
+def _fetch_html(url, timeout=10):
+    """Download a page for extraction (thread pool worker)"""
+    import requests
+
+    try:
+        response = requests.get(url, timeout=timeout, headers={'User-Agent': 'Mozilla/5.0'})
+        return response.text
+    except Exception as e:
+        print(f"   Fetch error for {url[:60]}: {e}")
+        return ""
+
+
+def fetch_and_extract(urls, limit=DEFAULT_LIMIT, fetch_workers=16, max_workers=None):
+    """
+    Bulk validation helper: download pages on a thread pool (I/O bound),
+    then strip them on a process pool (CPU bound).
+    Returns {url: text}.
+    """
+    urls = list(dict.fromkeys(u for u in urls if u))
+    with ThreadPoolExecutor(max_workers=fetch_workers) as pool:
+        pages = list(pool.map(_fetch_html, urls))
+
+    return dict(zip(urls, extract_many(pages, limit=limit, max_workers=max_workers)))
@@ -0,0 +1,107 @@
+"""
+Durable per-article job journal (SQLite)
+- Records each completed stage of an article and its output (JSON)
+- A rerun after a failure resumes from the last completed stage
+  instead of repeating AI, Gamma and LinkedIn calls
+- Safe to share between the pipeline's worker threads
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+_MISSING = object()
+
+
+class JobJournal:
+    """Stage-level checkpoint store keyed by article (e.g. its link)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS stages (
+                article_key TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                output TEXT,
+                completed_at REAL NOT NULL,
+                PRIMARY KEY (article_key, stage)
+            )"""
+        )
+
+    def record(self, key, stage, output=None):
+        """Mark a stage complete with its (JSON-serializable) output"""
+        payload = json.dumps(output)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO stages (article_key, stage, output, completed_at) VALUES (?, ?, ?, ?)",
+                (key, stage, payload, time.time()),
+            )
+
+    def get(self, key, stage, default=None):
+        """Output of a completed stage, or default if it never completed"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT output FROM stages WHERE article_key = ? AND stage = ?", (key, stage)
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def has(self, key, stage):
+        return self.get(key, stage, _MISSING) is not _MISSING
+
+    def stages(self, key):
+        """All completed stages for an article: {stage: output}"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT stage, output FROM stages WHERE article_key = ? ORDER BY completed_at", (key,)
+            ).fetchall()
+        return {stage: json.loads(output) for stage, output in rows}
+
+    def forget(self, key, stage=None):
+        """Drop one stage (to force a redo) or the whole article"""
+        with self.lock:
+            if stage is None:
+                self.conn.execute("DELETE FROM stages WHERE article_key = ?", (key,))
+            else:
+                self.conn.execute("DELETE FROM stages WHERE article_key = ? AND stage = ?", (key, stage))
+
+    def prune(self, max_age_days=30):
+        """Remove journal entries for articles not touched in max_age_days"""
+        cutoff = time.time() - max_age_days * 86400
+        with self.lock:
+            self.conn.execute(
+                """DELETE FROM stages WHERE article_key IN (
+                    SELECT article_key FROM stages GROUP BY article_key HAVING MAX(completed_at) < ?
+                )""",
+                (cutoff,),
+            )
+
+    def step(self, key, stage, fn, is_valid=None):
+        """
+        Wrap fn so a completed stage is replayed from the journal.
+        Outputs of None/False (failures) are not recorded.
+        """
+
+        def wrapper(**kwargs):
+            output = self.get(key, stage, _MISSING)
+            if output is not _MISSING and (is_valid is None or is_valid(output)):
+                print(f"↺ {stage}: resumed from journal")
+                return output
+
+            output = fn(**kwargs)
+            if output is not None and output is not False:
+                try:
+                    self.record(key, stage, output)
+                except (TypeError, ValueError) as e:
+                    print(f"⚠️  {stage}: output not journaled ({e})")
+            return output
+
+        return wrapper
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
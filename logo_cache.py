@@ -0,0 +1,71 @@
+"""
+Pre-resized logo thumbnails for the GUI
+- Each source logo is resized once (LANCZOS) into a PNG in the cache directory
+- A thumbnail is reused while it is newer than its source; editing or
+  replacing the source logo regenerates it
+- PIL is imported only when a thumbnail has to be (re)generated, so a launch
+  with a warm cache never loads it; Tk reads the cached PNGs directly
+"""
+
+import os
+
+LOGO_SIZE = (50, 50)
+
+
+class LogoCache:
+    """{key: source path} -> thumbnail paths, generated on first use"""
+
+    def __init__(self, sources, cache_dir, sizes=None, default_size=LOGO_SIZE):
+        self.sources = dict(sources)
+        self.cache_dir = cache_dir
+        self.sizes = dict(sizes or {})
+        self.default_size = default_size
+        self.generated = 0
+
+    def size_of(self, key):
+        return self.sizes.get(key, self.default_size)
+
+    def thumb_path(self, key):
+        width, height = self.size_of(key)
+        return os.path.join(self.cache_dir, f"{key}_{width}x{height}.png")
+
+    def is_fresh(self, key):
+        """Thumbnail exists and is at least as new as its source"""
+        thumb = self.thumb_path(key)
+        try:
+            return os.path.getmtime(thumb) >= os.path.getmtime(self.sources[key])
+        except OSError:
+            return False
+
+    def path(self, key):
+        """Path of an up-to-date thumbnail for key, or None if it cannot be made"""
+        source = self.sources.get(key)
+        if not source or not os.path.exists(source):
+            return None
+        if self.is_fresh(key):
+            return self.thumb_path(key)
+        try:
+            return self.generate(key)
+        except Exception as e:
+            print(f"Could not load logo {key}: {e}")
+            return None
+
+    def generate(self, key):
+        """Resize the source logo into the cache (imports PIL on first use)"""
+        try:
+            from PIL import Image
+        except ImportError:
+            print("Note: Install Pillow for logo display: pip3 install Pillow")
+            return None
+
+        thumb = self.thumb_path(key)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with Image.open(self.sources[key]) as img:
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            img = img.resize(self.size_of(key), Image.Resampling.LANCZOS)
+            tmp_path = thumb + '.tmp'
+            img.save(tmp_path, format='PNG')
+        os.replace(tmp_path, thumb)
+        self.generated += 1
+        return thumb
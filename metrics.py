@@ -0,0 +1,112 @@
+"""
+Rolling latency metrics per AI provider
+- Keeps the last N successful call durations for each provider
+- Percentiles (p50 / p95) drive the hedged fallback cascade in ai_providers
+- ReplyStats counts which source produced each reply (fallback rate),
+  replies per minute and errors; the CLI and the GUI dashboard share it
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+
+LATENCY_WINDOW = 50      # samples kept per provider
+MIN_SAMPLES = 5          # below this, percentile() returns None
+RATE_WINDOW = 60         # seconds of replies behind replies-per-minute
+PRIMARY_SOURCE = "ChatGPT"
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of call latencies, keyed by provider name"""
+
+    def __init__(self, window=LATENCY_WINDOW, min_samples=MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self.samples = defaultdict(lambda: deque(maxlen=self.window))
+        self.failures = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds, ok=True):
+        """Record one call; only successful calls count towards the percentiles"""
+        with self.lock:
+            if ok:
+                self.samples[name].append(seconds)
+            else:
+                self.failures[name] += 1
+
+    def percentile(self, name, q):
+        """q-th percentile (0-100, nearest rank) of recent latencies, or None if too few samples"""
+        with self.lock:
+            values = sorted(self.samples.get(name, ()))
+        if len(values) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(q / 100 * len(values)))
+        return values[rank - 1]
+
+    def p95(self, name):
+        return self.percentile(name, 95)
+
+    def snapshot(self):
+        """{provider: {'count', 'failures', 'p50', 'p95'}} for reporting"""
+        with self.lock:
+            names = set(self.samples) | set(self.failures)
+            counts = {name: len(self.samples.get(name, ())) for name in names}
+            failures = {name: self.failures.get(name, 0) for name in names}
+        return {
+            name: {
+                'count': counts[name],
+                'failures': failures[name],
+                'p50': self.percentile(name, 50),
+                'p95': self.percentile(name, 95),
+            }
+            for name in sorted(names)
+        }
+
+
+class ReplyStats:
+    """Thread-safe counters for generated replies, keyed by the source that answered"""
+
+    def __init__(self, primary=PRIMARY_SOURCE, rate_window=RATE_WINDOW):
+        self.primary = primary
+        self.rate_window = rate_window
+        self.by_source = defaultdict(int)
+        self.recent = deque()
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def record(self, source, now=None):
+        """Count one reply; "Claude (batch)" counts as Claude"""
+        now = time.monotonic() if now is None else now
+        source = (source or "Template").split(" (")[0]
+        with self.lock:
+            self.by_source[source] += 1
+            self.recent.append(now)
+            self._trim(now)
+
+    def record_error(self, count=1):
+        with self.lock:
+            self.errors += count
+
+    def _trim(self, now):
+        cutoff = now - self.rate_window
+        while self.recent and self.recent[0] < cutoff:
+            self.recent.popleft()
+
+    def snapshot(self, now=None):
+        """{'replies', 'per_minute', 'by_source', 'fallback_rate', 'errors'}"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            self._trim(now)
+            by_source = dict(self.by_source)
+            recent = len(self.recent)
+            errors = self.errors
+        replies = sum(by_source.values())
+        fallbacks = replies - by_source.get(self.primary, 0)
+        return {
+            'replies': replies,
+            'per_minute': recent * 60.0 / self.rate_window,
+            'by_source': by_source,
+            'fallback_rate': fallbacks / replies if replies else 0.0,
+            'errors': errors,
+        }
@@ -3,24 +3,24 @@ JJ Shay News Comment Responder - GUI Edition
 Beautiful Apple-style interface with logos and progress tracking
 """
 
+import argparse
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 import json
-import os
-import re
-import xml.etree.ElementTree as ET
 from datetime import datetime
 
-# Try to import PIL for image handling
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    print("Note: Install Pillow for logo display: pip3 install Pillow")
+from ai_providers import REPLY_WORKERS, ProviderLimiter, generate_reply
+from comment_table import STATUS_QUEUED, STATUS_REPLIED, CommentTableModel
+from gui_snapshot import GUISnapshot, count_pending
+from html_extract import html_to_text
+from logo_cache import LogoCache
+from metrics import LatencyTracker, ReplyStats
+from rss_feed import RSSFeedCache
+from sheet_writer import SheetWriteBuffer
+from ui_queue import UIEventQueue
 
 # Try to import gspread
 try:
@@ -35,6 +35,11 @@ SHEET_ID = "11a-_IWhljPJHeKV8vdke-JiLmm_KCq-bedSceKB0kZI"
 SHEET_NAME = "Comments"
 GOOGLE_CREDS_FILE = "/Users/johnshay/jj_shay_takeaways/google_service_account.json"
 RSS_FEED_URL = "https://rss.app/feeds/bJZbxhVRx0Xx77J3.xml"
+RSS_CACHE_FILE = "/Users/johnshay/jj_shay_takeaways/rss_feed_cache.json"
+GUI_SNAPSHOT_FILE = "/Users/johnshay/jj_shay_takeaways/gui_snapshot.json"
+LOGO_CACHE_DIR = "/Users/johnshay/jj_shay_takeaways/logo_cache"
+MAX_GUI_WORKERS = 16
+DASHBOARD_REFRESH_MS = 1000
 
 # Logo paths
 LOGOS = {
@@ -46,6 +51,7 @@ LOGOS = {
     'feedly': '/Users/johnshay/Downloads/feedly.png',
     'oneup': '/Users/johnshay/Downloads/oneup.png',
 }
+LOGO_SIZES = {'jjshay': (70, 70)}   # everything else is 50x50
 
 # Column indices
 COL_DATE = 0
@@ -61,6 +67,266 @@ COL_CHATGPT = 14
 COL_POST_TITLE = 15
 COL_POST_CONTENT = 16
 
+TABLE_COLS = {
+    'date': COL_DATE,
+    'commenter': COL_PROFILE_NAME,
+    'id': COL_ID,
+    'industry': COL_INDUSTRY,
+    'response': COL_CHATGPT,
+    'post_title': COL_POST_TITLE,
+}
+
+# Comment table layout: (column, heading, width in px)
+TABLE_LAYOUT = (
+    ('row', 'Row', 60),
+    ('date', 'Date', 120),
+    ('commenter', 'Commenter', 200),
+    ('industry', 'Industry', 170),
+    ('article', 'Article', 340),
+    ('status', 'Status', 90),
+)
+TABLE_ROW_HEIGHT = 24
+
+
+class CommentTableWindow:
+    """
+    Virtualized comment table: a fixed pool of canvas rows is re-labelled as the
+    view scrolls, so drawing cost depends on the window height, not the row count
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.colors = app.colors
+        self.model = app.comment_table
+        self.top = 0
+        self.slots = []
+        self.selected = set()
+        self.anchor = None
+        self.redraw_pending = False
+        self.filter_job = None
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Comments")
+        self.window.geometry("1020x640")
+        self.window.configure(bg=self.colors['bg_dark'])
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        toolbar = tk.Frame(self.window, bg=self.colors['bg_dark'])
+        toolbar.pack(fill='x', padx=15, pady=(15, 10))
+
+        tk.Label(
+            toolbar, text="Filter", font=('SF Pro Text', 13),
+            fg=self.colors['text_secondary'], bg=self.colors['bg_dark']
+        ).pack(side='left')
+
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', self.on_filter_change)
+        tk.Entry(
+            toolbar, textvariable=self.filter_var, width=32, font=('SF Pro Text', 13),
+            fg=self.colors['text_primary'], bg=self.colors['bg_input'],
+            insertbackground=self.colors['text_primary'], relief='flat'
+        ).pack(side='left', padx=(8, 15))
+
+        tk.Button(
+            toolbar, text="Reload", font=('SF Pro Text', 13), relief='flat',
+            command=self.app.load_comment_table
+        ).pack(side='left')
+
+        tk.Button(
+            toolbar, text="Queue Selected", font=('SF Pro Text', 13, 'bold'), relief='flat',
+            command=self.queue_selected
+        ).pack(side='left', padx=(10, 0))
+
+        self.count_label = tk.Label(
+            toolbar, text="", font=('SF Pro Text', 13),
+            fg=self.colors['text_secondary'], bg=self.colors['bg_dark']
+        )
+        self.count_label.pack(side='right')
+
+        self.header = tk.Canvas(
+            self.window, height=TABLE_ROW_HEIGHT, bg=self.colors['bg_card'], highlightthickness=0
+        )
+        self.header.pack(fill='x', padx=15)
+        self.header.bind('<Button-1>', self.on_header_click)
+
+        body = tk.Frame(self.window, bg=self.colors['bg_dark'])
+        body.pack(fill='both', expand=True, padx=15, pady=(0, 15))
+
+        self.scrollbar = tk.Scrollbar(body, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.canvas = tk.Canvas(body, bg=self.colors['bg_dark'], highlightthickness=0)
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.canvas.bind('<Configure>', self.on_resize)
+        self.canvas.bind('<Button-1>', self.on_click)
+        self.canvas.bind('<Shift-Button-1>', lambda e: self.on_click(e, extend=True))
+        self.canvas.bind('<Control-Button-1>', lambda e: self.on_click(e, toggle=True))
+        if self.window.tk.call('tk', 'windowingsystem') == 'aqua':
+            self.canvas.bind('<Command-Button-1>', lambda e: self.on_click(e, toggle=True))
+        for widget in (self.canvas, self.header):
+            widget.bind('<MouseWheel>', self.on_wheel)
+            widget.bind('<Button-4>', lambda e: self.scroll(-3))
+            widget.bind('<Button-5>', lambda e: self.scroll(3))
+
+        self.draw_header()
+
+    # ---------- drawing ----------
+
+    def draw_header(self):
+        self.header.delete('all')
+        x = 0
+        for column, heading, width in TABLE_LAYOUT:
+            if column == self.model.sort_column:
+                heading += " \u25bc" if self.model.descending else " \u25b2"
+            self.header.create_text(
+                x + 8, TABLE_ROW_HEIGHT // 2, text=heading, anchor='w',
+                font=('SF Pro Text', 12, 'bold'), fill=self.colors['text_secondary']
+            )
+            x += width
+
+    def visible_rows(self):
+        return max(1, self.canvas.winfo_height() // TABLE_ROW_HEIGHT + 1)
+
+    def on_resize(self, event=None):
+        """Grow or shrink the pool of row slots to fit the window"""
+        needed = self.visible_rows()
+        while len(self.slots) < needed:
+            y = len(self.slots) * TABLE_ROW_HEIGHT
+            rect = self.canvas.create_rectangle(0, y, 4000, y + TABLE_ROW_HEIGHT, width=0)
+            texts = []
+            x = 0
+            for column, heading, width in TABLE_LAYOUT:
+                texts.append(self.canvas.create_text(
+                    x + 8, y + TABLE_ROW_HEIGHT // 2, anchor='w', text="",
+                    font=('SF Pro Text', 12), fill=self.colors['text_primary']
+                ))
+                x += width
+            self.slots.append((rect, texts))
+        while len(self.slots) > needed:
+            rect, texts = self.slots.pop()
+            self.canvas.delete(rect, *texts)
+        self.redraw()
+
+    def request_redraw(self):
+        """Redraw at most once per idle cycle, however many scroll events arrive"""
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.window.after_idle(self.redraw)
+
+    def redraw(self):
+        self.redraw_pending = False
+        total = len(self.model)
+        visible = len(self.slots)
+        self.top = max(0, min(self.top, total - visible + 1))
+        records = self.model.window(self.top, visible)
+
+        for k, (rect, texts) in enumerate(self.slots):
+            if k < len(records):
+                record = records[k]
+                if record[0] in self.selected:
+                    fill = self.colors['accent_blue']
+                elif (self.top + k) % 2:
+                    fill = self.colors['bg_card']
+                else:
+                    fill = self.colors['bg_dark']
+                self.canvas.itemconfigure(rect, fill=fill)
+                for item, value, (column, heading, width) in zip(texts, record, TABLE_LAYOUT):
+                    value = str(value)
+                    limit = width // 8
+                    self.canvas.itemconfigure(item, text=value if len(value) <= limit else value[:limit - 1] + "\u2026")
+            else:
+                self.canvas.itemconfigure(rect, fill=self.colors['bg_dark'])
+                for item in texts:
+                    self.canvas.itemconfigure(item, text="")
+
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        shown = f"{total:,} of {self.model.total():,}" if total != self.model.total() else f"{total:,}"
+        self.count_label.configure(text=f"{shown} comments  |  {len(self.selected)} selected")
+
+    # ---------- scrolling ----------
+
+    def yview(self, *args):
+        """Scrollbar callback: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * len(self.model))
+            self.request_redraw()
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self.scroll(step * (len(self.slots) - 1) if args[2] == 'pages' else step)
+
+    def scroll(self, rows):
+        self.top += rows
+        self.request_redraw()
+
+    def on_wheel(self, event):
+        delta = event.delta
+        if abs(delta) >= 120:          # Windows reports multiples of 120
+            delta //= 40
+        self.scroll(-delta)
+
+    # ---------- sort / filter / select ----------
+
+    def on_header_click(self, event):
+        x = 0
+        for column, heading, width in TABLE_LAYOUT:
+            if event.x < x + width:
+                self.model.sort(column)
+                self.top = 0
+                self.draw_header()
+                self.redraw()
+                return
+            x += width
+
+    def on_filter_change(self, *args):
+        """Debounce keystrokes so filtering runs once per pause in typing"""
+        if self.filter_job is not None:
+            self.window.after_cancel(self.filter_job)
+        self.filter_job = self.window.after(120, self.apply_filter)
+
+    def apply_filter(self):
+        self.filter_job = None
+        self.model.filter(self.filter_var.get())
+        self.top = 0
+        self.redraw()
+
+    def on_click(self, event, extend=False, toggle=False):
+        position = self.top + event.y // TABLE_ROW_HEIGHT
+        if position >= len(self.model):
+            return
+        row_num = self.model.row_at(position)
+        if extend and self.anchor is not None:
+            self.selected.update(self.model.rows_between(self.anchor, position))
+        elif toggle:
+            self.selected.symmetric_difference_update({row_num})
+            self.anchor = position
+        else:
+            self.selected = {row_num}
+            self.anchor = position
+        self.redraw()
+
+    def queue_selected(self):
+        if not self.selected:
+            return
+        if self.app.queue_rows(sorted(self.selected)):
+            self.selected = set()
+            self.redraw()
+
+    # ---------- model updates ----------
+
+    def set_model(self, model):
+        model.filter(self.filter_var.get())
+        self.model = model
+        self.selected &= set(model.by_row)
+        self.draw_header()
+        self.redraw()
+
+    def close(self):
+        self.app.table_window = None
+        self.window.destroy()
+
 
 class AppleStyleGUI:
     def __init__(self):
@@ -102,28 +368,36 @@ class AppleStyleGUI:
         # Data
         self.spreadsheet = None
         self.sheet = None
-        self.posts_cache = {}
+        self.feed = RSSFeedCache(RSS_FEED_URL, RSS_CACHE_FILE)
+        self.limiter = ProviderLimiter()
+        self.latency = LatencyTracker()
+        self.replies = ReplyStats()
+        self.writer = None
+        self.snapshot = GUISnapshot(GUI_SNAPSHOT_FILE)
+        self.comment_table = CommentTableModel()
+        self.table_window = None
         self.is_processing = False
+        self.cancel_event = threading.Event()
+        self.logos = LogoCache(LOGOS, LOGO_CACHE_DIR, LOGO_SIZES)
         self.logo_images = {}
 
-        self.load_logos()
-        self.setup_ui()
-
-    def load_logos(self):
-        """Load and resize logo images"""
-        if not PIL_AVAILABLE:
-            return
+        self.ui = UIEventQueue()
 
-        for key, path in LOGOS.items():
+        self.setup_ui()
+        self.ui.start(self.root)
+        self.restore_snapshot()
+        self.root.after(DASHBOARD_REFRESH_MS, self.refresh_dashboard)
+
+    def logo(self, key):
+        """PhotoImage for a logo, decoded from its cached thumbnail on first use"""
+        if key not in self.logo_images:
+            path = self.logos.path(key) if key else None
             try:
-                if os.path.exists(path):
-                    img = Image.open(path)
-                    # Resize to fit (40x40 for small, 60x60 for header)
-                    size = (50, 50) if key != 'jjshay' else (70, 70)
-                    img = img.resize(size, Image.Resampling.LANCZOS)
-                    self.logo_images[key] = ImageTk.PhotoImage(img)
-            except Exception as e:
+                self.logo_images[key] = tk.PhotoImage(file=path) if path else None
+            except tk.TclError as e:
                 print(f"Could not load logo {key}: {e}")
+                self.logo_images[key] = None
+        return self.logo_images[key]
 
     def setup_ui(self):
         """Create the Apple-style UI"""
@@ -137,10 +411,11 @@ class AppleStyleGUI:
         header_frame.pack(fill='x', pady=(0, 25))
 
         # JJ Shay Logo
-        if 'jjshay' in self.logo_images:
+        header_logo = self.logo('jjshay')
+        if header_logo:
             logo_label = tk.Label(
                 header_frame,
-                image=self.logo_images['jjshay'],
+                image=header_logo,
                 bg=self.colors['bg_dark']
             )
             logo_label.pack(side='left', padx=(0, 15))
@@ -208,10 +483,11 @@ class AppleStyleGUI:
             tech_inner.pack(padx=15, pady=12)
 
             # Logo or dot
-            if logo_key and logo_key in self.logo_images:
+            logo = self.logo(logo_key)
+            if logo:
                 logo_lbl = tk.Label(
                     tech_inner,
-                    image=self.logo_images[logo_key],
+                    image=logo,
                     bg=self.colors['bg_input']
                 )
                 logo_lbl.pack()
@@ -268,7 +544,7 @@ class AppleStyleGUI:
         ai_header.pack(anchor='w', pady=(5, 10))
 
         cards_frame = tk.Frame(main_frame, bg=self.colors['bg_dark'])
-        cards_frame.pack(fill='x', pady=(0, 20))
+        cards_frame.pack(fill='x', pady=(0, 8))
 
         # API Status Cards with Logos
         self.api_cards = {}
@@ -295,6 +571,17 @@ class AppleStyleGUI:
                 )
                 arrow.pack(side='left', padx=4)
 
+        # Live run metrics (same LatencyTracker / ReplyStats / write buffer the CLI reports)
+        self.dashboard_label = tk.Label(
+            main_frame,
+            text="No replies yet",
+            font=('SF Pro Text', 12),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_dark'],
+            anchor='w'
+        )
+        self.dashboard_label.pack(fill='x', pady=(0, 20))
+
         # ===== PROGRESS SECTION =====
         progress_card = tk.Frame(main_frame, bg=self.colors['bg_card'])
         progress_card.pack(fill='x', pady=(0, 15))
@@ -468,6 +755,63 @@ class AppleStyleGUI:
         )
         self.process_all_btn.pack(side='left', padx=(15, 0))
 
+        # Cancel button (drains in-flight replies and saves them)
+        self.cancel_btn = tk.Button(
+            button_frame,
+            text="Cancel",
+            font=('SF Pro Text', 14, 'bold'),
+            fg=self.colors['text_primary'],
+            bg=self.colors['bg_input'],
+            activebackground=self.colors['bg_input'],
+            activeforeground=self.colors['text_primary'],
+            relief='flat',
+            padx=20,
+            pady=14,
+            cursor='hand2',
+            command=self.cancel_processing,
+            state='disabled'
+        )
+        self.cancel_btn.pack(side='left', padx=(15, 0))
+
+        # Concurrency control
+        workers_label = tk.Label(
+            button_frame,
+            text="Workers",
+            font=('SF Pro Text', 13),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_dark']
+        )
+        workers_label.pack(side='left', padx=(20, 6))
+
+        self.workers_var = tk.StringVar(value=str(REPLY_WORKERS))
+        workers_spin = tk.Spinbox(
+            button_frame,
+            from_=1,
+            to=MAX_GUI_WORKERS,
+            width=3,
+            textvariable=self.workers_var,
+            font=('SF Pro Text', 13),
+            state='readonly'
+        )
+        workers_spin.pack(side='left')
+
+        # Comment table (triage / queue selected rows)
+        self.table_btn = tk.Button(
+            button_frame,
+            text="Browse",
+            font=('SF Pro Text', 14, 'bold'),
+            fg=self.colors['text_primary'],
+            bg=self.colors['bg_input'],
+            activebackground=self.colors['bg_input'],
+            activeforeground=self.colors['text_primary'],
+            relief='flat',
+            padx=20,
+            pady=14,
+            cursor='hand2',
+            command=self.open_comment_table
+        )
+        self.table_btn.pack(side='left', padx=(15, 0))
+
         # Stats label
         self.stats_label = tk.Label(
             button_frame,
@@ -478,6 +822,16 @@ class AppleStyleGUI:
         )
         self.stats_label.pack(side='right')
 
+        # Snapshot freshness ("Snapshot 5 min ago - refreshing..." until reconciled)
+        self.freshness_label = tk.Label(
+            button_frame,
+            text="",
+            font=('SF Pro Text', 12),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_dark']
+        )
+        self.freshness_label.pack(side='right', padx=(0, 15))
+
     def create_api_card(self, parent, name, color, role="", logo_key=None):
         """Create an API status card with logo"""
         card = tk.Frame(parent, bg=self.colors['bg_card'])
@@ -498,10 +852,11 @@ class AppleStyleGUI:
             role_label.pack(anchor='w')
 
         # Logo or dot
-        if logo_key and logo_key in self.logo_images:
+        logo = self.logo(logo_key)
+        if logo:
             logo_lbl = tk.Label(
                 inner,
-                image=self.logo_images[logo_key],
+                image=logo,
                 bg=self.colors['bg_card']
             )
             logo_lbl.pack(pady=(5, 0))
@@ -538,6 +893,16 @@ class AppleStyleGUI:
         status.pack()
         card.status_label = status
 
+        metrics = tk.Label(
+            inner,
+            text="p50 —  p95 —",
+            font=('SF Pro Text', 10),
+            fg=self.colors['text_secondary'],
+            bg=self.colors['bg_card']
+        )
+        metrics.pack()
+        card.metrics_label = metrics
+
         return card
 
     def update_api_status(self, api_key, connected):
@@ -559,7 +924,6 @@ class AppleStyleGUI:
                 tech['box'].configure(highlightbackground=tech['color'], highlightthickness=3)
             else:
                 tech['box'].configure(highlightbackground=self.colors['border'], highlightthickness=1)
-        self.root.update()
 
     def highlight_active_ai(self, api_key):
         """Highlight the currently active AI model"""
@@ -570,7 +934,45 @@ class AppleStyleGUI:
                 card.configure(highlightbackground=card.active_color, highlightthickness=2)
             else:
                 card.configure(highlightbackground=self.colors['border'], highlightthickness=1)
-        self.root.update()
+
+    def refresh_dashboard(self):
+        """Redraw live metrics once a second on the Tk thread; the slowest provider is flagged"""
+        try:
+            providers = self.latency.snapshot()
+            replies = self.replies.snapshot()
+            pending_writes = self.writer.pending_count() if self.writer is not None else 0
+
+            timed = {name: entry['p95'] for name, entry in providers.items() if entry['p95'] is not None}
+            slowest = max(timed, key=timed.get) if len(timed) > 1 else None
+
+            for name, entry in providers.items():
+                card = self.api_cards.get(name.lower())
+                if card is None:
+                    continue
+                p50 = f"{entry['p50']:.1f}s" if entry['p50'] is not None else "—"
+                p95 = f"{entry['p95']:.1f}s" if entry['p95'] is not None else "—"
+                text = f"p50 {p50}  p95 {p95}"
+                if entry['failures']:
+                    text += f"  |  {entry['failures']} err"
+                color = self.colors['accent_orange'] if name == slowest else self.colors['text_secondary']
+                card.metrics_label.configure(text=text, fg=color)
+
+            if replies['replies']:
+                fallbacks = ", ".join(
+                    f"{source} {count / replies['replies']:.0%}"
+                    for source, count in sorted(replies['by_source'].items()) if source != self.replies.primary
+                )
+                provider_errors = sum(entry['failures'] for entry in providers.values())
+                text = (f"{replies['per_minute']:.1f} comments/min   |   fallback {replies['fallback_rate']:.0%}"
+                        + (f" ({fallbacks})" if fallbacks else "")
+                        + f"   |   {pending_writes} writes pending"
+                        + f"   |   {replies['errors'] + provider_errors} errors")
+                if slowest:
+                    text += f"   |   slowest: {slowest}"
+                self.dashboard_label.configure(text=text)
+        except Exception as e:
+            print(f"Dashboard error: {e}")
+        self.root.after(DASHBOARD_REFRESH_MS, self.refresh_dashboard)
 
     def update_status(self, message, progress=None):
         """Update status message and progress bar"""
@@ -578,35 +980,105 @@ class AppleStyleGUI:
         if progress is not None:
             self.progress_bar['value'] = progress
             self.progress_percent.configure(text=f"{int(progress)}%")
-        self.root.update()
 
     def update_progress_title(self, title):
         """Update the progress section title"""
         self.progress_title.configure(text=title)
-        self.root.update()
 
     def update_info(self, key, value):
         """Update info display"""
         if key in self.info_labels:
             display_value = str(value)[:200] + "..." if len(str(value)) > 200 else str(value)
             self.info_labels[key].configure(text=display_value or "—")
-        self.root.update()
+
+    # Worker threads post through the UI queue; updates to the same widget are merged
+    def post_status(self, message, progress=None):
+        self.ui.post('status', self.update_status, message, progress)
+
+    def post_title(self, title):
+        self.ui.post('progress_title', self.update_progress_title, title)
+
+    def post_info(self, key, value):
+        self.ui.post(('info', key), self.update_info, key, value)
+
+    def post_tech(self, tech_key, active, status_text=""):
+        self.ui.post(('tech', tech_key), self.update_tech_status, tech_key, active, status_text)
+
+    def post_api(self, api_key, connected):
+        self.ui.post(('api', api_key), self.update_api_status, api_key, connected)
+
+    def post_highlight(self, api_key):
+        self.ui.post('highlight', self.highlight_active_ai, api_key)
+
+    def update_freshness(self, text, stale):
+        """Stale/refreshing indicator next to the comment counts"""
+        color = self.colors['accent_orange'] if stale else self.colors['accent_green']
+        self.freshness_label.configure(text=text, fg=color)
+
+    def post_freshness(self, text, stale):
+        self.ui.post('freshness', self.update_freshness, text, stale)
+
+    def show_counts(self, total_rows, new_rows):
+        self.ui.post('stats', lambda: self.stats_label.configure(
+            text=f"{total_rows} comments  |  {new_rows} need responses"))
 
     def clear_info(self):
         """Clear all info labels"""
         for label in self.info_labels.values():
             label.configure(text="—")
-        self.root.update()
+
+    def restore_snapshot(self):
+        """Show the last known state at once, then reconcile in the background"""
+        rss_loaded = self.feed.load()
+        if rss_loaded:
+            self.update_tech_status('rss', True)
+
+        if not self.snapshot.load():
+            return
+
+        if self.snapshot.total_rows is not None:
+            self.show_counts(self.snapshot.total_rows, self.snapshot.new_rows or 0)
+        for key, connected in self.snapshot.providers.items():
+            self.update_api_status(key, connected)
+        if any(self.snapshot.providers.values()):
+            self.update_tech_status('ai', True)
+
+        self.update_status(f"Restored snapshot from {self.snapshot.age_text()} - reconnecting in the background...", 0)
+        self.update_progress_title("Restored")
+        self.root.after(0, self.connect_sheet)
+
+    def load_api_keys(self):
+        """Read provider keys from the "API KEY" tab (rows 5, 6, 8, 10 of column B)"""
+        api_sheet = self.spreadsheet.worksheet("API KEY")
+        values = api_sheet.batch_get(['B5:B10'])[0]
+        cells = [row[0] if row else "" for row in values] + [""] * 6
+        self.api_keys['claude'] = cells[0]
+        self.api_keys['chatgpt'] = cells[1]
+        self.api_keys['grok'] = cells[3]
+        self.api_keys['gemini'] = cells[5]
+
+    def refresh_counts(self):
+        """Count comments from two column reads instead of the whole sheet"""
+        ids, responses = self.sheet.batch_get(['A2:C', 'O2:O'])
+        response_cells = [row[0] if row else "" for row in responses]
+        total_rows = max(len(ids), len(response_cells))
+        new_rows = count_pending(response_cells, total_rows)
+        self.snapshot.update(total_rows=total_rows, new_rows=new_rows)
+        self.show_counts(total_rows, new_rows)
+        return total_rows, new_rows
 
     def connect_sheet(self):
         """Connect to Google Sheet and load API keys"""
         self.update_status("Connecting to Google Sheet...", 0)
         self.update_progress_title("Connecting")
+        age = self.snapshot.age_text()
+        self.update_freshness(f"Snapshot {age} - refreshing..." if age else "Refreshing...", True)
 
         def connect_thread():
             try:
                 if not GSPREAD_AVAILABLE:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "gspread not installed. Run: pip3 install gspread google-auth"))
+                    self.post_freshness("Offline snapshot" if age else "", True)
+                    self.ui.call(messagebox.showerror, "Error", "gspread not installed. Run: pip3 install gspread google-auth")
                     return
 
                 scopes = [
@@ -614,117 +1086,80 @@ class AppleStyleGUI:
                     'https://www.googleapis.com/auth/drive'
                 ]
 
-                self.root.after(0, lambda: self.update_status("Loading Google credentials...", 10))
+                self.post_status("Loading Google credentials...", 10)
 
                 creds = Credentials.from_service_account_file(GOOGLE_CREDS_FILE, scopes=scopes)
                 client = gspread.authorize(creds)
 
-                self.root.after(0, lambda: self.update_status("Connecting to Google Sheets...", 25))
+                self.post_status("Connecting to Google Sheets...", 25)
 
                 self.spreadsheet = client.open_by_key(SHEET_ID)
                 self.sheet = self.spreadsheet.worksheet(SHEET_NAME)
 
                 # Light up Google Sheets indicator
-                self.root.after(0, lambda: self.update_tech_status('google_sheets', True))
+                self.post_tech('google_sheets', True)
 
-                self.root.after(0, lambda: self.update_status("Loading API keys from sheet...", 40))
+                self.post_status("Loading API keys from sheet...", 40)
 
                 # Load API keys from "API KEY" tab
                 try:
-                    api_sheet = self.spreadsheet.worksheet("API KEY")
-                    all_values = api_sheet.get_all_values()
-
-                    if len(all_values) >= 6:
-                        self.api_keys['claude'] = all_values[4][1] if len(all_values[4]) > 1 else ""
-                        self.api_keys['chatgpt'] = all_values[5][1] if len(all_values[5]) > 1 else ""
-                    if len(all_values) >= 8:
-                        self.api_keys['grok'] = all_values[7][1] if len(all_values[7]) > 1 else ""
-                    if len(all_values) >= 10:
-                        self.api_keys['gemini'] = all_values[9][1] if len(all_values[9]) > 1 else ""
+                    self.load_api_keys()
 
                     # Update API status cards
                     for key in ['chatgpt', 'claude', 'grok', 'gemini']:
-                        self.root.after(0, lambda k=key: self.update_api_status(k, bool(self.api_keys.get(k))))
+                        self.post_api(key, bool(self.api_keys.get(key)))
 
                     # Light up AI indicator
                     if any(self.api_keys.values()):
-                        self.root.after(0, lambda: self.update_tech_status('ai', True))
+                        self.post_tech('ai', True)
+                    self.snapshot.update(providers=self.api_keys)
 
                 except Exception as e:
-                    self.root.after(0, lambda: self.update_status(f"Warning: Could not load API keys: {e}", 50))
+                    self.post_status(f"Warning: Could not load API keys: {e}", 50)
 
-                self.root.after(0, lambda: self.update_status("Loading Feedly RSS feed...", 60))
-                self.refresh_rss_feed()
+                # Sheet and keys are live - processing can start while the rest reconciles
+                self.ui.call(lambda: self.process_new_btn.configure(state='normal'))
+                self.ui.call(lambda: self.process_all_btn.configure(state='normal'))
+                self.ui.call(lambda: self.connect_btn.configure(text="Reconnect", bg=self.colors['bg_input']))
 
-                # Light up RSS indicator
-                self.root.after(0, lambda: self.update_tech_status('rss', True))
+                # RSS index was restored from disk at launch; refresh it off this thread
+                self.post_status("Refreshing Feedly RSS feed in the background...", 60)
+                self.feed.refresh_async()
+                self.post_tech('rss', True)
 
-                self.root.after(0, lambda: self.update_status("Counting comments...", 80))
-
-                # Count rows
-                all_data = self.sheet.get_all_values()
-                total_rows = len(all_data) - 1
-                new_rows = sum(1 for row in all_data[1:] if len(row) <= COL_CHATGPT or not row[COL_CHATGPT] or len(row[COL_CHATGPT]) < 20)
+                self.post_status("Counting comments...", 80)
+                total_rows, new_rows = self.refresh_counts()
 
                 # Light up LinkedIn/OneUp indicator
-                self.root.after(0, lambda: self.update_tech_status('linkedin', True))
-
-                self.root.after(0, lambda: self.stats_label.configure(text=f"{total_rows} comments  |  {new_rows} need responses"))
-                self.root.after(0, lambda: self.update_status(f"Connected! {total_rows} comments found, {new_rows} need responses", 100))
-                self.root.after(0, lambda: self.update_progress_title("Ready"))
+                self.post_tech('linkedin', True)
 
-                # Enable buttons
-                self.root.after(0, lambda: self.process_new_btn.configure(state='normal'))
-                self.root.after(0, lambda: self.process_all_btn.configure(state='normal'))
-                self.root.after(0, lambda: self.connect_btn.configure(text="Reconnect", bg=self.colors['bg_input']))
+                self.snapshot.save()
+                self.post_freshness("Live", False)
+                self.post_status(f"Connected! {total_rows} comments found, {new_rows} need responses", 100)
+                self.post_title("Ready")
 
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Connection failed: {str(e)}", 0))
-                self.root.after(0, lambda: self.update_progress_title("Error"))
-                self.root.after(0, lambda: messagebox.showerror("Connection Error", str(e)))
+                self.post_freshness("Offline snapshot" if age else "", True)
+                self.post_status(f"Connection failed: {str(e)}", 0)
+                self.post_title("Error")
+                self.ui.call(messagebox.showerror, "Connection Error", str(e))
 
         threading.Thread(target=connect_thread, daemon=True).start()
 
+    @property
+    def posts_cache(self):
+        return self.feed.posts_cache
+
     def refresh_rss_feed(self):
-        """Fetch and parse RSS feed"""
+        """Fetch RSS feed (conditional GET) and merge new posts"""
         try:
-            response = requests.get(RSS_FEED_URL, timeout=10)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-
-            for item in root.findall('.//item'):
-                title = item.find('title')
-                description = item.find('description')
-                link = item.find('link')
-                guid = item.find('guid')
-
-                if link is not None:
-                    post_url = link.text
-                    post_data = {
-                        "title": title.text if title is not None else "",
-                        "description": self.clean_html(description.text) if description is not None else "",
-                        "link": post_url,
-                    }
-
-                    self.posts_cache[post_url] = post_data
-
-                    activity_match = re.search(r'activity[:\-](\d+)', post_url)
-                    if activity_match:
-                        self.posts_cache[activity_match.group(1)] = post_data
-
-                    if guid is not None and guid.text:
-                        self.posts_cache[guid.text] = post_data
-
+            self.feed.refresh()
         except Exception as e:
             print(f"RSS Error: {e}")
 
     def clean_html(self, html_text):
-        """Remove HTML tags"""
-        if not html_text:
-            return ""
-        clean = re.sub(r'<[^>]+>', '', html_text)
-        return ' '.join(clean.split())[:2000]
+        """Remove HTML tags, scripts/styles and entities"""
+        return html_to_text(html_text, 2000)
 
     def find_article_by_id(self, comment_id):
         """Find article by activity ID"""
@@ -733,104 +1168,223 @@ class AppleStyleGUI:
 
         activity_id = comment_id.split('-')[0] if '-' in str(comment_id) else str(comment_id)
 
-        if activity_id in self.posts_cache:
-            return self.posts_cache[activity_id]
+        article = self.feed.lookup(activity_id)
+        if article is None and self.feed.wait_for_refresh(timeout=15):
+            article = self.feed.lookup(activity_id)
+        return article
+
+    def _reply_for_row(self, row):
+        """Article lookup + AI reply for one sheet row (runs on a pool worker)"""
+        commenter = row[COL_PROFILE_NAME] if len(row) > COL_PROFILE_NAME else "Unknown"
+        comment_id = row[COL_ID] if len(row) > COL_ID else ""
+        comment_type = row[COL_TYPE].lower() if len(row) > COL_TYPE else ""
+        comment_text = row[COL_TEXT] if len(row) > COL_TEXT else ""
+        industry = row[COL_INDUSTRY] if len(row) > COL_INDUSTRY else ""
+
+        if comment_type == 'reaction' and not comment_text:
+            comment_text = "liked"
+
+        article = self.find_article_by_id(comment_id)
+
+        profile_data = {
+            'industry': industry,
+            'summary': row[COL_SUMMARY] if len(row) > COL_SUMMARY else "",
+            'location': row[COL_LOCATION] if len(row) > COL_LOCATION else "",
+            'company': row[COL_COMPANY] if len(row) > COL_COMPANY else "",
+        }
+
+        response, ai_model = self.generate_ai_response(article, comment_text, commenter, comment_type, profile_data)
+        return {
+            'commenter': commenter,
+            'industry': industry,
+            'comment': comment_text,
+            'article': article,
+            'ai_model': ai_model,
+            'response': response,
+        }
 
-        for key, data in self.posts_cache.items():
-            if activity_id in key or key in activity_id:
-                return data
+    def show_result(self, result):
+        """Show the most recently completed comment in the Live Processing card"""
+        self.post_info('commenter', result['commenter'])
+        self.post_info('industry', result['industry'] or "Not specified")
+        self.post_info('comment', result['comment'])
+        article = result['article']
+        self.post_info('article', article.get('title', 'Unknown') if article else "Not found in RSS feed")
+        self.post_info('ai_model', result['ai_model'])
+        self.post_info('response', result['response'])
+
+    def open_comment_table(self):
+        """Show the comment table, loading it from the sheet the first time"""
+        if self.table_window is not None:
+            self.table_window.window.lift()
+            return
+        self.table_window = CommentTableWindow(self)
+        if not self.comment_table.total():
+            self.load_comment_table()
 
-        return None
+    def _article_title(self, row):
+        """Cached article title for a row, without waiting on an RSS refresh"""
+        comment_id = row[COL_ID] if len(row) > COL_ID else ""
+        if not comment_id:
+            return ""
+        article = self.feed.lookup(comment_id.split('-')[0])
+        return article.get('title', '') if article else ""
+
+    def load_comment_table(self):
+        """Read the Comments tab in the background and swap in a fresh table model"""
+        if self.sheet is None:
+            messagebox.showinfo("Comments", "Connect to the Google Sheet first.")
+            return
+
+        def load_thread():
+            try:
+                self.post_status("Loading comments table...")
+                rows = self.sheet.get_all_values()[1:]
+                model = CommentTableModel()
+                model.sort_column = self.comment_table.sort_column
+                model.descending = self.comment_table.descending
+                model.set_rows(rows, TABLE_COLS, article_title=self._article_title)
+                self.ui.call(self.set_comment_table, model)
+                self.post_status(f"Loaded {model.total():,} comments into the table")
+            except Exception as e:
+                self.post_status(f"Could not load comments: {e}")
+
+        threading.Thread(target=load_thread, daemon=True).start()
+
+    def set_comment_table(self, model):
+        self.comment_table = model
+        if self.table_window is not None:
+            self.table_window.set_model(model)
+
+    def mark_table_row(self, row_num, status, article_title=None):
+        """Update one row's status in the table (Tk thread)"""
+        self.comment_table.set_status(row_num, status, article_title)
+        if self.table_window is not None:
+            self.table_window.request_redraw()
 
-    def start_processing(self, new_only=True):
-        """Start processing comments"""
+    def queue_rows(self, row_nums):
+        """Process the given sheet rows; True if a run was started"""
+        if self.is_processing:
+            messagebox.showinfo("Busy", "A run is already in progress - queue these once it finishes.")
+            return False
+        if self.sheet is None:
+            messagebox.showinfo("Comments", "Connect to the Google Sheet first.")
+            return False
+        items = self.comment_table.items_for(row_nums)
+        for i, row in items:
+            self.mark_table_row(i + 2, STATUS_QUEUED)
+        self.start_processing(items=items)
+        return True
+
+    def cancel_processing(self):
+        """Stop handing out new rows; in-flight replies finish and are saved"""
+        if self.is_processing and not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.cancel_btn.configure(state='disabled')
+            self.update_status("Cancelling - finishing in-flight replies...")
+
+    def start_processing(self, new_only=True, items=None):
+        """Start processing comments on a bounded worker pool (items: explicit (index, row) pairs)"""
         if self.is_processing:
             return
 
         self.is_processing = True
+        self.cancel_event = threading.Event()
+        workers = max(1, min(MAX_GUI_WORKERS, int(self.workers_var.get() or 1)))
         self.process_new_btn.configure(state='disabled')
         self.process_all_btn.configure(state='disabled')
+        self.cancel_btn.configure(state='normal')
 
         def process_thread():
+            writer = None
             try:
-                all_data = self.sheet.get_all_values()
-                rows = all_data[1:]
-
-                if new_only:
+                if items is not None:
+                    rows_to_process = list(items)
+                elif new_only:
+                    rows = self.sheet.get_all_values()[1:]
                     rows_to_process = [(i, row) for i, row in enumerate(rows)
                                        if len(row) <= COL_CHATGPT or not row[COL_CHATGPT] or len(row[COL_CHATGPT]) < 20]
                 else:
+                    rows = self.sheet.get_all_values()[1:]
                     rows_to_process = [(i, row) for i, row in enumerate(rows)]
 
                 total = len(rows_to_process)
 
                 if total == 0:
-                    self.root.after(0, lambda: self.update_status("No comments to process!", 100))
-                    self.root.after(0, lambda: self.update_progress_title("Complete"))
+                    self.post_status("No comments to process!", 100)
+                    self.post_title("Complete")
                     return
 
-                self.root.after(0, lambda: self.update_progress_title(f"Processing {total} Comments"))
-
-                for idx, (i, row) in enumerate(rows_to_process):
-                    progress = ((idx + 1) / total) * 100
-
-                    commenter = row[COL_PROFILE_NAME] if len(row) > COL_PROFILE_NAME else "Unknown"
-                    comment_id = row[COL_ID] if len(row) > COL_ID else ""
-                    comment_type = row[COL_TYPE].lower() if len(row) > COL_TYPE else ""
-                    comment_text = row[COL_TEXT] if len(row) > COL_TEXT else ""
-                    industry = row[COL_INDUSTRY] if len(row) > COL_INDUSTRY else ""
-
-                    if comment_type == 'reaction' and not comment_text:
-                        comment_text = "liked"
-
-                    self.root.after(0, lambda c=commenter: self.update_info('commenter', c))
-                    self.root.after(0, lambda i=industry: self.update_info('industry', i or "Not specified"))
-                    self.root.after(0, lambda t=comment_text: self.update_info('comment', t))
-                    self.root.after(0, lambda: self.update_status(f"Processing comment {idx+1} of {total}...", progress))
-
-                    article = self.find_article_by_id(comment_id)
-                    if article:
-                        self.root.after(0, lambda a=article: self.update_info('article', a.get('title', 'Unknown')))
-                    else:
-                        self.root.after(0, lambda: self.update_info('article', "Not found in RSS feed"))
-
-                    profile_data = {
-                        'industry': row[COL_INDUSTRY] if len(row) > COL_INDUSTRY else "",
-                        'summary': row[COL_SUMMARY] if len(row) > COL_SUMMARY else "",
-                        'location': row[COL_LOCATION] if len(row) > COL_LOCATION else "",
-                        'company': row[COL_COMPANY] if len(row) > COL_COMPANY else "",
-                    }
-
-                    self.root.after(0, lambda: self.update_status(f"Generating AI response...", progress))
-                    response, ai_model = self.generate_ai_response(article, comment_text, commenter, comment_type, profile_data)
+                self.post_title(f"Processing {total} Comments")
+                writer = self.writer = SheetWriteBuffer(self.sheet)
+                done = failed = 0
+
+                def work(row):
+                    if self.cancel_event.is_set():
+                        return None
+                    return self._reply_for_row(row)
+
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {pool.submit(work, row): i for i, row in rows_to_process}
+
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            print(f"Row {i+2} failed: {e}")
+                            self.replies.record_error()
+                            failed += 1
+                            continue
+                        if result is None:          # skipped after Cancel
+                            continue
+
+                        writer.add(i + 2, result['response'], result['article'])
+                        done += 1
+                        article = result['article']
+                        self.ui.call(self.mark_table_row, i + 2, STATUS_REPLIED,
+                                     article.get('title') if article else None)
+                        self.show_result(result)
+
+                        in_flight = sum(1 for f in futures if f.running())
+                        self.post_status(
+                            f"Processed {done} of {total}  |  {in_flight} in flight on {workers} workers"
+                            + (f"  |  {failed} failed" if failed else ""),
+                            (done + failed) / total * 100,
+                        )
+
+                self.post_status(f"Saving to Google Sheet...", (done + failed) / total * 100)
+                writer.close()
 
-                    self.root.after(0, lambda m=ai_model: self.update_info('ai_model', m))
-                    self.root.after(0, lambda r=response: self.update_info('response', r))
-
-                    self.root.after(0, lambda: self.update_status(f"Updating Google Sheet...", progress))
-
-                    try:
-                        self.sheet.update(f"O{i+2}", [[response]])
-
-                        if article:
-                            self.sheet.update(f"P{i+2}", [[article.get('title', '')[:500]]])
-                            self.sheet.update(f"Q{i+2}", [[article.get('description', '')[:2000]]])
-                    except Exception as e:
-                        print(f"Update error: {e}")
-
-                    time.sleep(0.3)
+                try:
+                    self.refresh_counts()
+                    self.snapshot.save()
+                except Exception as e:
+                    print(f"Could not refresh comment counts: {e}")
 
-                self.root.after(0, lambda: self.update_status(f"Complete! Processed {total} comments", 100))
-                self.root.after(0, lambda: self.update_progress_title("Complete"))
+                if self.cancel_event.is_set():
+                    self.post_status(f"Cancelled - saved {done} of {total} comments", (done + failed) / total * 100)
+                    self.post_title("Cancelled")
+                else:
+                    self.post_status(f"Complete! Processed {done} comments", 100)
+                    self.post_title("Complete")
 
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error: {str(e)}", 0))
-                self.root.after(0, lambda: messagebox.showerror("Processing Error", str(e)))
+                if writer is not None:
+                    try:
+                        writer.close()
+                    except Exception as flush_error:
+                        self.replies.record_error()
+                        print(f"Sheet flush error: {flush_error}")
+                self.post_status(f"Error: {str(e)}", 0)
+                self.ui.call(messagebox.showerror, "Processing Error", str(e))
 
             finally:
+                self.writer = None
                 self.is_processing = False
-                self.root.after(0, lambda: self.process_new_btn.configure(state='normal'))
-                self.root.after(0, lambda: self.process_all_btn.configure(state='normal'))
+                self.ui.call(lambda: self.process_new_btn.configure(state='normal'))
+                self.ui.call(lambda: self.process_all_btn.configure(state='normal'))
+                self.ui.call(lambda: self.cancel_btn.configure(state='disabled'))
 
         threading.Thread(target=process_thread, daemon=True).start()
 
@@ -889,39 +1443,32 @@ Write a brief LinkedIn reply (2-3 sentences) that:
 
 Reply only with the response text."""
 
-        # Try each AI in cascade
-        if self.api_keys.get('chatgpt'):
-            self.root.after(0, lambda: self.update_info('ai_model', "Trying ChatGPT..."))
-            self.root.after(0, lambda: self.highlight_active_ai('chatgpt'))
-            response = self.call_chatgpt(prompt)
-            if response:
-                return response, "ChatGPT"
-
-        if self.api_keys.get('claude'):
-            self.root.after(0, lambda: self.update_info('ai_model', "Trying Claude..."))
-            self.root.after(0, lambda: self.highlight_active_ai('claude'))
-            response = self.call_claude(prompt)
-            if response:
-                return response, "Claude"
-
-        if self.api_keys.get('grok'):
-            self.root.after(0, lambda: self.update_info('ai_model', "Trying Grok..."))
-            self.root.after(0, lambda: self.highlight_active_ai('grok'))
-            response = self.call_grok(prompt)
-            if response:
-                return response, "Grok"
-
-        if self.api_keys.get('gemini'):
-            self.root.after(0, lambda: self.update_info('ai_model', "Trying Gemini..."))
-            self.root.after(0, lambda: self.highlight_active_ai('gemini'))
-            response = self.call_gemini(prompt)
-            if response:
-                return response, "Gemini"
+        # Try each AI in cascade (hedged: a slow provider does not stall the chain)
+        response, source = generate_reply(self.ai_providers(), prompt, self.limiter, self.latency,
+                                          on_attempt=self.announce_ai)
+        if not response:
+            source = "Template"
+            if comment_type == 'reaction':
+                response = "Thanks for engaging! I'd love to hear your thoughts on this topic. What aspect resonated most with you?"
+            else:
+                response = "Great point! Thanks for adding to the conversation. What's your experience been with this?"
+        self.replies.record(source)
+        return response, source
+
+    def ai_providers(self):
+        """Cascade order, skipping providers without an API key"""
+        chain = [
+            ("ChatGPT", 'chatgpt', self.call_chatgpt),
+            ("Claude", 'claude', self.call_claude),
+            ("Grok", 'grok', self.call_grok),
+            ("Gemini", 'gemini', self.call_gemini),
+        ]
+        return [(name, call) for name, key, call in chain if self.api_keys.get(key)]
 
-        if comment_type == 'reaction':
-            return "Thanks for engaging! I'd love to hear your thoughts on this topic. What aspect resonated most with you?", "Template"
-        else:
-            return "Great point! Thanks for adding to the conversation. What's your experience been with this?", "Template"
+    def announce_ai(self, name):
+        """Show which provider is being tried"""
+        self.post_info('ai_model', f"Trying {name}...")
+        self.post_highlight(name.lower())
 
     def call_chatgpt(self, prompt):
         try:
@@ -1011,6 +1558,13 @@ Reply only with the response text."""
         self.root.mainloop()
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """news-intel gui: launch the desktop responder"""
+    parser = argparse.ArgumentParser(prog="news-intel gui", description="Desktop comment responder")
+    parser.parse_args(argv)
     app = AppleStyleGUI()
     app.run()
+
+
+if __name__ == "__main__":
+    main()
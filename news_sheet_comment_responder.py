@@ -6,14 +6,23 @@ Google Sheet Comment Responder
 - Updates ChatGPT Suggestion column
 """
 
+import argparse
 import requests
 import json
 import os
-import re
-import xml.etree.ElementTree as ET
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import gspread
 from google.oauth2.service_account import Credentials
+from ai_providers import REPLY_WORKERS, ProviderLimiter, generate_reply
+from comment_watermark import CommentWatermark
+from html_extract import html_to_text
+from metrics import LatencyTracker, ReplyStats
+from reaction_batch import batch_max_tokens, build_batch_prompt, group_reactions, parse_batch_reply
+from rss_feed import RSSFeedCache
+from sheet_writer import SheetWriteBuffer
 
 # ==================== CONFIG ====================
 
@@ -24,6 +33,10 @@ GOOGLE_CREDS_FILE = "/Users/johnshay/jj_shay_takeaways/google_service_account.js
 
 # RSS Feed
 RSS_FEED_URL = "https://rss.app/feeds/bJZbxhVRx0Xx77J3.xml"
+RSS_CACHE_FILE = "/Users/johnshay/jj_shay_takeaways/rss_feed_cache.json"
+
+# Last Comments row already handled (new-comment detection reads only past it)
+COMMENT_WATERMARK_FILE = "/Users/johnshay/jj_shay_takeaways/comment_watermark.json"
 
 # AI APIs - loaded from Google Sheet "API KEY" tab or environment
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
@@ -51,13 +64,40 @@ COL_POST_CONTENT = 16 # Q (Post Content - NEW)
 
 class NewsSheetResponder:
     def __init__(self):
-        self.posts_cache = {}
+        self.feed = RSSFeedCache(RSS_FEED_URL, RSS_CACHE_FILE)
+        self.limiter = ProviderLimiter()
+        self.latency = LatencyTracker()
+        self.replies = ReplyStats()
+        self.http = self.make_http_session()
+        self.watermark = CommentWatermark(COMMENT_WATERMARK_FILE, fingerprint_cols=COL_CHATGPT)
         self.sheet = None
         self.spreadsheet = None
         self.api_keys = {}
         self.connect_sheet()
         self.load_api_keys()
-        self.refresh_rss_feed()
+        self.load_rss_feed()
+
+    @staticmethod
+    def make_http_session():
+        """Pooled keep-alive connections to the AI APIs (sized for parallel replies)"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=max(REPLY_WORKERS, 10))
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def posts_cache(self):
+        """URL / activity ID / guid -> post, from the persistent RSS cache"""
+        return self.feed.posts_cache
+
+    def load_rss_feed(self):
+        """Use the cached RSS index right away and refresh it in the background"""
+        cached = self.feed.load()
+        if cached:
+            print(f"📰 RSS cache: {cached} posts (refreshing in background)")
+            self.feed.refresh_async()
+        else:
+            self.refresh_rss_feed()
 
     def connect_sheet(self):
         """Connect to Google Sheet"""
@@ -123,53 +163,18 @@ class NewsSheetResponder:
             print("   Using environment variables instead")
 
     def refresh_rss_feed(self):
-        """Fetch and parse RSS feed for article context"""
+        """Fetch RSS feed (conditional GET) and merge new posts into the cache"""
         print("📰 Fetching RSS feed...")
         try:
-            response = requests.get(RSS_FEED_URL, timeout=10)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-
-            for item in root.findall('.//item'):
-                title = item.find('title')
-                description = item.find('description')
-                link = item.find('link')
-                guid = item.find('guid')
-
-                if link is not None:
-                    post_url = link.text
-                    post_data = {
-                        "title": title.text if title is not None else "",
-                        "description": self.clean_html(description.text) if description is not None else "",
-                        "link": post_url,
-                        "guid": guid.text if guid is not None else "",
-                    }
-
-                    # Store by URL
-                    self.posts_cache[post_url] = post_data
-
-                    # Extract activity ID from URL and store by that
-                    activity_match = re.search(r'activity[:\-](\d+)', post_url)
-                    if activity_match:
-                        activity_id = activity_match.group(1)
-                        self.posts_cache[activity_id] = post_data
-
-                    # Also store by guid
-                    if guid is not None and guid.text:
-                        self.posts_cache[guid.text] = post_data
-
-            print(f"   Loaded {len([k for k in self.posts_cache if k.isdigit()])} posts")
+            added = self.feed.refresh()
+            print(f"   Loaded {self.feed.post_count()} posts ({added} new)")
 
         except Exception as e:
             print(f"❌ RSS error: {e}")
 
     def clean_html(self, html_text):
-        """Remove HTML tags"""
-        if not html_text:
-            return ""
-        clean = re.sub(r'<[^>]+>', '', html_text)
-        return ' '.join(clean.split())[:2000]
+        """Remove HTML tags, scripts/styles and entities"""
+        return html_to_text(html_text, 2000)
 
     def find_article_by_id(self, comment_id):
         """Find article in RSS by activity ID from comment"""
@@ -181,15 +186,14 @@ class NewsSheetResponder:
         # Try direct activity ID match
         activity_id = comment_id.split('-')[0] if '-' in str(comment_id) else str(comment_id)
 
-        if activity_id in self.posts_cache:
-            return self.posts_cache[activity_id]
+        # Exact match, then partial match via the activity-ID index
+        article = self.feed.lookup(activity_id)
 
-        # Try partial match
-        for key, data in self.posts_cache.items():
-            if activity_id in key or key in activity_id:
-                return data
+        # A brand-new post may only arrive with the background refresh
+        if article is None and self.feed.wait_for_refresh(timeout=15):
+            article = self.feed.lookup(activity_id)
 
-        return None
+        return article
 
     def generate_ai_response(self, article_context, comment_text, commenter_name, comment_type, profile_data=None):
         """Generate contextual AI response with profile data"""
@@ -250,35 +254,29 @@ Write a brief LinkedIn reply (2-3 sentences) that:
 
 Reply only with the response text."""
 
-        # Try ChatGPT (primary - Row 6)
-        response = self.call_chatgpt(prompt)
-        if response:
-            return response, "ChatGPT"
-
-        # Fallback to Claude (Row 5)
-        response = self.call_claude(prompt)
-        if response:
-            return response, "Claude"
-
-        # Fallback to Grok (Row 8)
-        response = self.call_grok(prompt)
-        if response:
-            return response, "Grok"
-
-        # Fallback to Gemini (Row 10)
-        response = self.call_gemini(prompt)
-        if response:
-            return response, "Gemini"
-
-        return self.template_response(comment_text, comment_type), "Template"
-
-    def call_chatgpt(self, prompt):
+        response, source = generate_reply(self.ai_providers(), prompt, self.limiter, self.latency)
+        if not response:
+            response, source = self.template_response(comment_text, comment_type), "Template"
+        self.replies.record(source)
+        return response, source
+
+    def ai_providers(self):
+        """Fallback order: ChatGPT (Row 6) → Claude (Row 5) → Grok (Row 8) → Gemini (Row 10)"""
+        chain = [
+            ("ChatGPT", OPENAI_API_KEY, self.call_chatgpt),
+            ("Claude", CLAUDE_API_KEY, self.call_claude),
+            ("Grok", GROK_API_KEY, self.call_grok),
+            ("Gemini", GEMINI_API_KEY, self.call_gemini),
+        ]
+        return [(name, call) for name, key, call in chain if key]
+
+    def call_chatgpt(self, prompt, max_tokens=250):
         """Call ChatGPT API (Primary - Row 6)"""
         if not OPENAI_API_KEY:
             return None
 
         try:
-            response = requests.post(
+            response = self.http.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -287,7 +285,7 @@ Reply only with the response text."""
                 json={
                     "model": "gpt-4o-mini",
                     "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 250,
+                    "max_tokens": max_tokens,
                     "temperature": 0.7
                 },
                 timeout=30
@@ -301,13 +299,13 @@ Reply only with the response text."""
 
         return None
 
-    def call_claude(self, prompt):
+    def call_claude(self, prompt, max_tokens=250):
         """Call Claude API (Backup - Row 5)"""
         if not CLAUDE_API_KEY:
             return None
 
         try:
-            response = requests.post(
+            response = self.http.post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
                     "x-api-key": CLAUDE_API_KEY,
@@ -316,7 +314,7 @@ Reply only with the response text."""
                 },
                 json={
                     "model": "claude-3-haiku-20240307",
-                    "max_tokens": 250,
+                    "max_tokens": max_tokens,
                     "messages": [{"role": "user", "content": prompt}]
                 },
                 timeout=30
@@ -330,13 +328,13 @@ Reply only with the response text."""
 
         return None
 
-    def call_grok(self, prompt):
+    def call_grok(self, prompt, max_tokens=250):
         """Call Grok/xAI API (Row 8)"""
         if not GROK_API_KEY:
             return None
 
         try:
-            response = requests.post(
+            response = self.http.post(
                 "https://api.x.ai/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {GROK_API_KEY}",
@@ -345,7 +343,7 @@ Reply only with the response text."""
                 json={
                     "model": "grok-3",
                     "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 250,
+                    "max_tokens": max_tokens,
                     "temperature": 0.7
                 },
                 timeout=30
@@ -359,18 +357,18 @@ Reply only with the response text."""
 
         return None
 
-    def call_gemini(self, prompt):
+    def call_gemini(self, prompt, max_tokens=250):
         """Call Gemini API"""
         if not GEMINI_API_KEY:
             return None
 
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={GEMINI_API_KEY}",
                 headers={"Content-Type": "application/json"},
                 json={
                     "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {"maxOutputTokens": 250, "temperature": 0.7}
+                    "generationConfig": {"maxOutputTokens": max_tokens, "temperature": 0.7}
                 },
                 timeout=30
             )
@@ -390,6 +388,42 @@ Reply only with the response text."""
         else:
             return "Great point! Thanks for adding to the conversation. What's your experience been with this?"
 
+    def respond_to_webhook(self, comment_data):
+        """Generate a suggested reply for one webhook payload (see handle_zapier_webhook)"""
+
+        comment_id = comment_data.get('id', '')
+        comment_text = comment_data.get('text', '')
+        commenter_name = comment_data.get('profile_name', 'Someone')
+        comment_type = comment_data.get('type', 'comment')
+
+        # Extract profile data
+        profile_data = {
+            'industry': comment_data.get('profile_industry', ''),
+            'summary': comment_data.get('profile_summary', ''),
+            'location': comment_data.get('profile_location', ''),
+            'company': comment_data.get('profile_company', ''),
+        }
+
+        # Find article
+        article = self.find_article_by_id(comment_id)
+
+        # Generate response with profile context
+        response, source = self.generate_ai_response(
+            article,
+            comment_text,
+            commenter_name,
+            comment_type,
+            profile_data
+        )
+
+        return {
+            "suggested_response": response,
+            "source": source,
+            "article_found": article is not None,
+            "article_title": article.get('title', '') if article else None,
+            "post_content": article.get('description', '')[:500] if article else None
+        }
+
     def process_comments(self, update_sheet=False, limit=None):
         """Process comments and generate contextual responses"""
 
@@ -404,6 +438,7 @@ Reply only with the response text."""
 
         processed = 0
         updated = 0
+        writer = SheetWriteBuffer(self.sheet) if update_sheet and self.sheet else None
 
         for i, row in enumerate(rows):
             if limit and processed >= limit:
@@ -456,109 +491,241 @@ Reply only with the response text."""
             print(f"💬 Response ({source}):")
             print(f"   {response[:100]}...")
 
-            # Update sheet with response AND article context
-            if update_sheet and self.sheet:
-                try:
-                    # Update Column O (ChatGPT Suggestion)
-                    self.sheet.update(f"O{i+2}", [[response]])
-
-                    # Update Column P (Post Title) and Q (Post Content)
-                    if article:
-                        post_title = article.get('title', '')[:500]
-                        post_content = article.get('description', '')[:2000]
-                        self.sheet.update(f"P{i+2}", [[post_title]])
-                        self.sheet.update(f"Q{i+2}", [[post_content]])
-                        print(f"✅ Updated O, P, Q for row {i+2}")
-                    else:
-                        print(f"✅ Updated O{i+2} (no article context for P, Q)")
-
-                    updated += 1
-                except Exception as e:
-                    print(f"❌ Update error: {e}")
+            # Queue response AND article context; written in batches
+            if writer:
+                writer.add(i + 2, response, article)
+                if article:
+                    print(f"📝 Queued O, P, Q for row {i+2}")
+                else:
+                    print(f"📝 Queued O{i+2} (no article context for P, Q)")
+                updated += 1
 
             processed += 1
 
+        if writer:
+            try:
+                writer.close()
+            except Exception as e:
+                print(f"❌ Update error: {e}")
+                updated -= writer.pending_count()
+
         print(f"\n{'='*50}")
         print(f"Processed: {processed} comments")
         print(f"Updated: {updated} rows")
 
-    def process_new_comments_only(self, update_sheet=True):
-        """Only process comments without suggestions"""
-
-        if not self.sheet:
-            print("❌ No sheet connection")
-            return
-
-        all_data = self.sheet.get_all_values()
-        rows = all_data[1:]  # Skip header
-        new_count = 0
-
-        for i, row in enumerate(rows):
-            current_suggestion = row[COL_CHATGPT] if len(row) > COL_CHATGPT else ""
-
-            # Skip if already has suggestion
-            if current_suggestion and len(current_suggestion) > 20:
-                continue
-
-            # Process this row
-            comment_id = row[COL_ID] if len(row) > COL_ID else ""
-            comment_type = row[COL_TYPE].lower() if len(row) > COL_TYPE else ""
-            comment_text = row[COL_TEXT] if len(row) > COL_TEXT else ""
-            commenter_name = row[COL_PROFILE_NAME] if len(row) > COL_PROFILE_NAME else "Someone"
-
-            # Extract profile data
-            profile_data = {
+    def _row_context(self, row):
+        """Comment fields and profile data for one sheet row"""
+        comment_type = row[COL_TYPE].lower() if len(row) > COL_TYPE else ""
+        comment_text = row[COL_TEXT] if len(row) > COL_TEXT else ""
+        if comment_type == 'reaction' and not comment_text:
+            comment_text = "liked"
+
+        return {
+            'comment_id': row[COL_ID] if len(row) > COL_ID else "",
+            'comment_type': comment_type,
+            'comment_text': comment_text,
+            'commenter_name': row[COL_PROFILE_NAME] if len(row) > COL_PROFILE_NAME else "Someone",
+            'profile_data': {
                 'industry': row[COL_INDUSTRY] if len(row) > COL_INDUSTRY else "",
                 'summary': row[COL_SUMMARY] if len(row) > COL_SUMMARY else "",
                 'location': row[COL_LOCATION] if len(row) > COL_LOCATION else "",
                 'company': row[COL_COMPANY] if len(row) > COL_COMPANY else "",
-            }
-
-            if comment_type == 'reaction' and not comment_text:
-                comment_text = "liked"
+            },
+        }
+
+    def stats(self):
+        """Reply counters plus per-provider latency (what the GUI dashboard shows)"""
+        stats = self.replies.snapshot()
+        stats['providers'] = self.latency.snapshot()
+        return stats
+
+    def print_stats(self):
+        stats = self.stats()
+        sources = ", ".join(f"{name} {count}" for name, count in sorted(stats['by_source'].items()))
+        print(f"📊 {stats['per_minute']:.1f} replies/min | fallback {stats['fallback_rate']:.0%} ({sources}) | "
+              f"{stats['errors']} errors")
+        for name, entry in stats['providers'].items():
+            p50 = f"{entry['p50']:.1f}s" if entry['p50'] is not None else "n/a"
+            p95 = f"{entry['p95']:.1f}s" if entry['p95'] is not None else "n/a"
+            print(f"   {name}: p50 {p50} | p95 {p95} | {entry['failures']} failures")
+
+    def _reply_for_row(self, row):
+        """Look up the article and generate a reply for one sheet row (worker thread)"""
+        ctx = self._row_context(row)
+        article = self.find_article_by_id(ctx['comment_id'])
+        response, source = self.generate_ai_response(
+            article,
+            ctx['comment_text'],
+            ctx['commenter_name'],
+            ctx['comment_type'],
+            ctx['profile_data']
+        )
+        return ctx['commenter_name'], ctx['profile_data'], article, response, source
+
+    def _reply_to_reaction_batch(self, article, members):
+        """One LLM request for a group of reactions on the same post: {key: (reply, source)}"""
+        prompt = build_batch_prompt(article, members)
+        max_tokens = batch_max_tokens(members)
+        providers = [
+            (name, lambda p, call=call: call(p, max_tokens=max_tokens))
+            for name, call in self.ai_providers()
+        ]
+        text, source = generate_reply(providers, prompt, self.limiter, self.latency)
+        replies = parse_batch_reply(text, [key for key, _ in members])
+        for _ in replies:
+            self.replies.record(source)
+        return {key: (reply, f"{source} (batch)") for key, reply in replies.items()}
+
+    def _batch_reaction_replies(self, pending, pool):
+        """
+        Answer reactions on the same post in grouped requests.
+        Returns {row index: (commenter_name, profile_data, article, response, source)};
+        rows missing from a batch reply are left for the per-row path.
+        """
+        items = []
+        contexts = {}
+        for i, row in pending:
+            ctx = self._row_context(row)
+            if ctx['comment_type'] != 'reaction':
+                continue
+            article = self.find_article_by_id(ctx['comment_id'])
+            if not article:
+                continue
+            contexts[f"row{i+2}"] = (i, ctx, article)
+            reactor = dict(ctx['profile_data'], name=ctx['commenter_name'], reaction=ctx['comment_text'])
+            items.append((f"row{i+2}", article, reactor))
+
+        batches = group_reactions(items)
+        if not batches:
+            return {}
+
+        print(f"👍 Batching {sum(len(m) for _, m in batches)} reactions into {len(batches)} requests")
+        results = {}
+        for replies in pool.map(lambda batch: self._reply_to_reaction_batch(*batch), batches):
+            for key, (response, source) in replies.items():
+                i, ctx, article = contexts[key]
+                results[i] = (ctx['commenter_name'], ctx['profile_data'], article, response, source)
+        return results
+
+    def _read_rows_after_mark(self, full_scan=False):
+        """
+        Rows to check for new comments, as [(index, row)] with sheet row = index + 2.
+        Reads only past the high-water mark unless a full reconcile is due or the
+        mark row changed (rows deleted/moved). Returns (rows, was_full_scan).
+        """
+        mark = self.watermark.last_row
+        if not full_scan and not self.watermark.needs_reconcile():
+            mark_range, new_rows = self.sheet.batch_get([f"A{mark}:Q{mark}", f"A{mark + 1}:Q"])
+            if self.watermark.matches(mark_range[0] if mark_range else []):
+                print(f"📍 Reading rows after {mark} ({len(new_rows)} new)")
+                return [(mark - 1 + k, list(row)) for k, row in enumerate(new_rows)], False
+            print(f"⚠️ Row {mark} changed since last run - full reconcile")
+
+        print("🔄 Full scan of Comments sheet")
+        rows = self.sheet.get_all_values()[1:]  # Skip header
+        return list(enumerate(rows)), True
+
+    def process_new_comments_only(self, update_sheet=True, max_workers=REPLY_WORKERS, batch_reactions=True,
+                                  full_scan=False):
+        """
+        Only process comments without suggestions.
+        Reads only the rows appended since the last run (see _read_rows_after_mark);
+        full_scan=True forces a reconcile pass over the whole sheet.
+        Replies are generated for up to max_workers comments at once (each AI
+        provider is still capped by PROVIDER_LIMITS); results are written in row order.
+        With batch_reactions, reactions on the same post share one LLM request.
+        Returns {'pending', 'processed', 'full_scan', 'reply_seconds'} (seconds from the
+        start of the run until each reply was queued).
+        """
 
-            print(f"\n🆕 New comment Row {i+2}: {commenter_name}")
-            if profile_data.get('industry') or profile_data.get('company'):
-                print(f"   👤 {profile_data.get('industry', '')} | {profile_data.get('company', '')}")
+        if not self.sheet:
+            print("❌ No sheet connection")
+            return
 
-            article = self.find_article_by_id(comment_id)
-            if article:
-                print(f"   📰 {article.get('title', '')[:50]}...")
+        start = time.perf_counter()
+        indexed_rows, full_scan = self._read_rows_after_mark(full_scan)
+        new_count = 0
+        reply_seconds = []
+        writer = SheetWriteBuffer(self.sheet) if update_sheet else None
+
+        # Skip rows that already have a suggestion
+        pending = [
+            (i, row) for i, row in indexed_rows
+            if not (len(row) > COL_CHATGPT and len(row[COL_CHATGPT]) > 20)
+        ]
+        if pending:
+            print(f"🆕 {len(pending)} new comments, generating with up to {max_workers} in parallel")
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            batched = self._batch_reaction_replies(pending, pool) if batch_reactions else {}
+
+            def reply(item):
+                i, row = item
+                return batched[i] if i in batched else self._reply_for_row(row)
+
+            # map() yields in submission order, so rows are reported and queued in order
+            results = pool.map(reply, pending)
+
+            for (i, row), (commenter_name, profile_data, article, response, source) in zip(pending, results):
+                print(f"\n🆕 New comment Row {i+2}: {commenter_name}")
+                if profile_data.get('industry') or profile_data.get('company'):
+                    print(f"   👤 {profile_data.get('industry', '')} | {profile_data.get('company', '')}")
+                if article:
+                    print(f"   📰 {article.get('title', '')[:50]}...")
+
+                print(f"   💬 Response ({source}): {response[:80]}...")
+                reply_seconds.append(time.perf_counter() - start)
+
+                if writer:
+                    writer.add(i + 2, response, article)
+                    if article:
+                        print(f"   📝 Queued O, P, Q")
+                    else:
+                        print(f"   📝 Queued O (no article found)")
+                    new_count += 1
 
-            response, source = self.generate_ai_response(
-                article,
-                comment_text,
-                commenter_name,
-                comment_type,
-                profile_data
-            )
+        if writer:
+            try:
+                writer.close()
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
+                self.replies.record_error()
+                new_count -= writer.pending_count()
+            else:
+                # Everything up to the last row read is handled; the next run starts after it
+                if indexed_rows:
+                    last_index, last_row = indexed_rows[-1]
+                    self.watermark.advance(last_index + 2, last_row, reconciled=full_scan)
+                elif full_scan:
+                    self.watermark.advance(1, self.sheet.row_values(1), reconciled=True)
+
+        if pending:
+            print(f"\n{'='*50}")
+            print(f"Processed {new_count} new comments")
+            self.print_stats()
 
-            print(f"   💬 Response ({source}): {response[:80]}...")
+        return {
+            'pending': len(pending),
+            'processed': new_count,
+            'full_scan': full_scan,
+            'reply_seconds': reply_seconds,
+        }
 
-            if update_sheet:
-                try:
-                    # Update Column O (ChatGPT Suggestion)
-                    self.sheet.update(f"O{i+2}", [[response]])
 
-                    # Update Column P (Post Title) and Q (Post Content)
-                    if article:
-                        post_title = article.get('title', '')[:500]
-                        post_content = article.get('description', '')[:2000]
-                        self.sheet.update(f"P{i+2}", [[post_title]])
-                        self.sheet.update(f"Q{i+2}", [[post_content]])
-                        print(f"   ✅ Updated O, P, Q")
-                    else:
-                        print(f"   ✅ Updated O (no article found)")
+# ==================== ZAPIER WEBHOOK HANDLER ====================
 
-                    new_count += 1
-                except Exception as e:
-                    print(f"   ❌ Error: {e}")
+_warm_responder = None
+_warm_lock = threading.Lock()
 
-        print(f"\n{'='*50}")
-        print(f"Processed {new_count} new comments")
 
+def get_responder():
+    """Process-wide responder, built once (sheet auth, API keys, RSS index) and reused"""
+    global _warm_responder
+    with _warm_lock:
+        if _warm_responder is None:
+            _warm_responder = NewsSheetResponder()
+        return _warm_responder
 
-# ==================== ZAPIER WEBHOOK HANDLER ====================
 
 def handle_zapier_webhook(comment_data):
     """
@@ -575,40 +742,7 @@ def handle_zapier_webhook(comment_data):
     - profile_location: Location
     - profile_company: Company name
     """
-    responder = NewsSheetResponder()
-
-    comment_id = comment_data.get('id', '')
-    comment_text = comment_data.get('text', '')
-    commenter_name = comment_data.get('profile_name', 'Someone')
-    comment_type = comment_data.get('type', 'comment')
-
-    # Extract profile data
-    profile_data = {
-        'industry': comment_data.get('profile_industry', ''),
-        'summary': comment_data.get('profile_summary', ''),
-        'location': comment_data.get('profile_location', ''),
-        'company': comment_data.get('profile_company', ''),
-    }
-
-    # Find article
-    article = responder.find_article_by_id(comment_id)
-
-    # Generate response with profile context
-    response, source = responder.generate_ai_response(
-        article,
-        comment_text,
-        commenter_name,
-        comment_type,
-        profile_data
-    )
-
-    return {
-        "suggested_response": response,
-        "source": source,
-        "article_found": article is not None,
-        "article_title": article.get('title', '') if article else None,
-        "post_content": article.get('description', '')[:500] if article else None
-    }
+    return get_responder().respond_to_webhook(comment_data)
 
 
 # ==================== MAIN ====================
@@ -644,7 +778,11 @@ def setup_sheet_headers(responder):
         print(f"❌ Error setting headers: {e}")
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """news-intel respond: interactive menu for the comment responder"""
+    parser = argparse.ArgumentParser(prog="news-intel respond", description="Generate replies for the Comments sheet")
+    parser.parse_args(argv)
+
     print("\n" + "="*50)
     print("NEWS SHEET COMMENT RESPONDER")
     print("="*50)
@@ -658,6 +796,8 @@ if __name__ == "__main__":
     print("3. Process NEW comments only (update sheet)")
     print("4. Test with single row")
     print("5. Setup new columns (Post Title, Post Content)")
+    print("6. Process NEW comments with a full sheet reconcile")
+    print("7. Watch mode (reply to new comments as they arrive)")
 
     choice = input("\nChoice: ").strip()
 
@@ -679,3 +819,19 @@ if __name__ == "__main__":
     elif choice == "5":
         setup_sheet_headers(responder)
         print("\nNow run option 2 or 3 to populate the new columns")
+
+    elif choice == "6":
+        responder.process_new_comments_only(update_sheet=True, full_scan=True)
+
+    elif choice == "7":
+        from comment_daemon import CommentDaemon
+
+        daemon = CommentDaemon(responder)
+        try:
+            daemon.run()
+        except KeyboardInterrupt:
+            print(f"\n👋 Stopped: {daemon.stats()}")
+
+
+if __name__ == "__main__":
+    main()
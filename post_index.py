@@ -0,0 +1,117 @@
+"""
+Activity-ID index over the RSS posts cache
+- Exact hash lookup on every cache key (URL, activity ID, guid)
+- Sorted suffix array over the digit runs in those keys, so
+  "activity_id in key" is a binary search instead of a scan
+- All-digit keys grouped by length, so "key in activity_id" only checks
+  windows of the lengths actually stored (one length for activity IDs)
+- Same match semantics as the original linear fallback:
+  the first key (in cache insertion order) where
+  activity_id in key or key in activity_id
+"""
+
+import re
+from bisect import bisect_left
+
+DIGITS_RE = re.compile(r'\d+')
+
+# Queries longer than this fall back to the linear scan for "key in activity_id"
+MAX_SUBSTRING_QUERY = 64
+
+
+class ActivityIndex:
+    """Answers find_article_by_id lookups without scanning posts_cache"""
+
+    def __init__(self, posts_cache=None):
+        self.posts = None
+        self.size = 0
+        self.keys = []          # cache keys in insertion order
+        self.digit_keys = {}    # length -> {all-digit key (or ''): insertion position}
+        self.suffixes = []      # sorted suffixes of every digit run
+        self.suffix_pos = []    # insertion position of the key each suffix came from
+        if posts_cache is not None:
+            self.build(posts_cache)
+
+    def build(self, posts_cache):
+        """(Re)build the index - called whenever the RSS feed is loaded"""
+        self.posts = posts_cache
+        self.size = len(posts_cache)
+        self.keys = list(posts_cache)
+        self.digit_keys = {}
+        entries = []
+        last_post, seen_runs = None, set()
+
+        for pos, key in enumerate(self.keys):
+            if not isinstance(key, str):
+                continue
+            if key.isdigit() or not key:
+                self.digit_keys.setdefault(len(key), {}).setdefault(key, pos)
+
+            # A post's URL, activity ID and guid usually repeat the same digits;
+            # a run already indexed for the same post would never win the min()
+            post = posts_cache[key]
+            if post is not last_post:
+                last_post, seen_runs = post, set()
+
+            for run in DIGITS_RE.findall(key):
+                if run in seen_runs:
+                    continue
+                seen_runs.add(run)
+                for start in range(len(run)):
+                    entries.append((run[start:], pos))
+
+        entries.sort()
+        self.suffixes = [suffix for suffix, _ in entries]
+        self.suffix_pos = [pos for _, pos in entries]
+        return self
+
+    def _is_stale(self, posts_cache):
+        return posts_cache is not self.posts or len(posts_cache) != self.size
+
+    def _linear(self, activity_id):
+        """Original fallback scan (used only for unusual query forms)"""
+        for pos, key in enumerate(self.keys):
+            if isinstance(key, str) and (activity_id in key or key in activity_id):
+                return pos
+        return None
+
+    def _keys_within(self, activity_id):
+        """
+        Earliest key that is a substring of a numeric activity_id.
+        Only all-digit keys can be, so just the query's windows of the stored
+        digit-key lengths are looked up.
+        """
+        best = None
+        n = len(activity_id)
+        for length, keys in self.digit_keys.items():
+            last = n - length if length else 0       # the empty key needs one check, not n
+            for start in range(last + 1):
+                pos = keys.get(activity_id[start:start + length])
+                if pos is not None and (best is None or pos < best):
+                    best = pos
+        return best
+
+    def _keys_containing(self, activity_id):
+        """Earliest key containing a numeric activity_id (binary search on digit suffixes)"""
+        lo = bisect_left(self.suffixes, activity_id)
+        hi = bisect_left(self.suffixes, activity_id + ':', lo)  # ':' sorts right after '9'
+        if lo == hi:
+            return None
+        return min(self.suffix_pos[lo:hi])
+
+    def lookup(self, posts_cache, activity_id):
+        """Return the cached post for an activity ID, or None"""
+        if activity_id in posts_cache:
+            return posts_cache[activity_id]
+
+        if self._is_stale(posts_cache):
+            self.build(posts_cache)
+
+        if not activity_id.isdigit() or len(activity_id) > MAX_SUBSTRING_QUERY:
+            pos = self._linear(activity_id)
+        else:
+            candidates = [p for p in (self._keys_within(activity_id), self._keys_containing(activity_id))
+                          if p is not None]
+            pos = min(candidates) if candidates else None
+
+        return posts_cache[self.keys[pos]] if pos is not None else None
@@ -0,0 +1,87 @@
+"""
+Posting pipeline for process_news_in
+- prepare_ahead: articles are prepared on a worker pool while earlier ones are
+  handed back (in order) for posting
+- LinkedInPostScheduler: minimum gap between carousel posts, rolling hourly cap
+  and backoff after failed posts; nothing else is throttled
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# LinkedIn posting limits (only create_carousel_post is throttled)
+POST_MIN_INTERVAL = 5     # seconds between carousel posts
+POST_MAX_PER_HOUR = 25    # rolling hourly cap
+POST_MAX_BACKOFF = 120    # max extra delay after failed posts
+
+
+def prepare_ahead(items, prepare, workers):
+    """
+    Run prepare(*item) for every item on a pool of `workers` threads.
+    Yields (item, result, error) in item order as each becomes ready, so later
+    items keep preparing while the caller posts earlier ones.
+    If the caller stops early (exception, Ctrl-C, closing the generator), queued
+    preparations are cancelled instead of waited for: each one costs AI and Gamma calls.
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = [(item, pool.submit(prepare, *item)) for item in items]
+        for item, future in futures:
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class LinkedInPostScheduler:
+    """
+    Rate-aware gate for LinkedInAPI.create_carousel_post.
+    Enforces a minimum gap between posts and a rolling hourly cap,
+    and backs off after failed posts. Nothing else is throttled.
+    """
+
+    def __init__(self, min_interval=POST_MIN_INTERVAL, max_per_hour=POST_MAX_PER_HOUR,
+                 max_backoff=POST_MAX_BACKOFF, clock=time.monotonic, sleep=time.sleep):
+        self.min_interval = min_interval
+        self.max_per_hour = max_per_hour
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.sleep = sleep
+        self.backoff = 0
+        self.post_times = deque()
+        self.lock = threading.Lock()
+
+    def _delay(self, now):
+        """Seconds to wait before the next post is allowed"""
+        while self.post_times and now - self.post_times[0] >= 3600:
+            self.post_times.popleft()
+
+        delay = 0
+        if self.post_times:
+            delay = self.post_times[-1] + self.min_interval + self.backoff - now
+        if self.max_per_hour and len(self.post_times) >= self.max_per_hour:
+            delay = max(delay, self.post_times[0] + 3600 - now)
+        return max(0, delay)
+
+    def post(self, linkedin, pdf_path, title, caption):
+        """Wait for a posting slot, then create the carousel post"""
+        with self.lock:
+            delay = self._delay(self.clock())
+            if delay > 0:
+                print(f"   ⏳ LinkedIn scheduler: waiting {delay:.1f}s")
+                self.sleep(delay)
+
+            try:
+                post_urn = linkedin.create_carousel_post(pdf_path, title, caption)
+            finally:
+                self.post_times.append(self.clock())
+
+            if post_urn:
+                self.backoff = 0
+            else:
+                self.backoff = min(self.max_backoff, max(self.min_interval, self.backoff * 2))
+            return post_urn
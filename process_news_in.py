@@ -2,19 +2,40 @@
 Process checked articles from NEWS IN with AI scores
 """
 
+import argparse
+import os
 import time
-import requests
 from datetime import datetime
+
+import requests
 from sheet_manager import SheetManager
 from gamma_carousel_generator import GammaCarouselGenerator, classify_topic, JJSHAY_TEMPLATE_ID
 from linkedin_api import LinkedInAPI, build_new_caption
 from evernote_auto_poster import add_logo_to_pdf, shorten_url, log_post, extract_article_info_with_ai, generate_grok_teaser, generate_grok_keywords
 from ai_rationale_generator import generate_all_rationales
+from archive_batch import Archive3Batch
+from html_extract import html_to_text
+from job_journal import JobJournal
+from post_pipeline import LinkedInPostScheduler, prepare_ahead
+from step_graph import StepGraph
 
 LOGO_PATH = "/Users/johnshay/jj_shay_takeaways/jjshayt.png"
 
-# Archive sheet for fully processed articles
-ARCHIVE3_SHEET = 'ARCHIVE3'
+# Carousel PDF with logo - one file per NEWS IN row so concurrent preparations don't collide
+PDF_WITH_LOGO_TEMPLATE = "/Users/johnshay/jj_shay_takeaways/carousel_with_logo_{row_num}.pdf"
+
+# Pipeline: articles prepared ahead of posting (AI extraction, Gamma, PDF logo)
+PREP_WORKERS = 3
+
+# Concurrent enrichment calls within one article (see StepGraph in prepare_news_in_article)
+STEP_WORKERS = 4
+
+# Per-article stage journal - a rerun resumes after the last completed stage
+JOB_JOURNAL_DB = "/Users/johnshay/jj_shay_takeaways/news_in_journal.sqlite3"
+JOB_JOURNAL_MAX_AGE_DAYS = 30
+
+# Articles posted but not yet committed to ARCHIVE3 survive crashes here
+ARCHIVE_PENDING_FILE = "/Users/johnshay/jj_shay_takeaways/archive3_pending.json"
 
 # NEWS IN column indices (0-based)
 # Headers: TOPIC, SELECT, SCORE, DATE, TITLE, LINK, PUBLIHER, GPT Score, Claude Score, Gemini Score, Grok Score, Perplexity Score, Source Score, AI Avg, GPT POV
@@ -52,93 +73,86 @@ def get_cell(row, col_name):
     return ''
 
 
-def archive_to_archive3(sm, row, row_num, short_link, short_linkedin_url, gamma_url, topic_display=''):
+def archive_to_archive3(sm, row, row_num, short_link, short_linkedin_url, gamma_url, topic_display='',
+                        journal=None, key=None):
     """Move processed article from NEWS IN to ARCHIVE3 with completion data and topic"""
-    try:
-        # Get or create ARCHIVE3 sheet
-        try:
-            archive_sheet = sm.spreadsheet.worksheet(ARCHIVE3_SHEET)
-        except:
-            archive_sheet = sm.spreadsheet.add_worksheet(ARCHIVE3_SHEET, rows=1000, cols=30)
-            # Add headers with Topic column
-            headers = ['x', 'SCORE', 'Date', 'Title', 'Link', 'Publisher', 'Author',
-                      'GPT Score', 'Claude Score', 'Gemini Score', 'Grok Score', 'Perplexity Score',
-                      'AI Avg', 'Source Score', 'GPT POV', 'Claude POV', 'Gemini POV', 'Grok POV',
-                      'Perplexity POV', 'Source', 'Bit.ly Link', 'LinkedIn URL', 'Gamma URL', 'Topic', 'Posted Date']
-            archive_sheet.append_row(headers)
-
-        # Ensure headers exist
-        if archive_sheet.row_count == 0 or not archive_sheet.cell(1, 1).value:
-            headers = ['x', 'SCORE', 'Date', 'Title', 'Link', 'Publisher', 'Author',
-                      'GPT Score', 'Claude Score', 'Gemini Score', 'Grok Score', 'Perplexity Score',
-                      'AI Avg', 'Source Score', 'GPT POV', 'Claude POV', 'Gemini POV', 'Grok POV',
-                      'Perplexity POV', 'Source', 'Bit.ly Link', 'LinkedIn URL', 'Gamma URL', 'Topic', 'Posted Date']
-            archive_sheet.append_row(headers)
-
-        # Build archive row: original data + completion columns
-        archive_row = list(row)
-        # Pad to ensure we have enough columns
-        while len(archive_row) < 20:
-            archive_row.append('')
-
-        # Add completion data including topic
-        archive_row.append(short_link)           # Bit.ly Link (article)
-        archive_row.append(short_linkedin_url)   # LinkedIn URL
-        archive_row.append(gamma_url)            # Gamma URL
-        archive_row.append(topic_display)        # Topic (e.g., "41 Artificial Intelligence")
-        archive_row.append(datetime.now().strftime('%Y-%m-%d %H:%M'))  # Posted Date
-
-        # Append to ARCHIVE3
-        archive_sheet.append_row(archive_row)
-
-        # Delete from NEWS IN
-        source_sheet = sm.spreadsheet.worksheet('NEWS IN')
-        source_sheet.delete_rows(row_num)
-
-        print(f"✓ Archived to {ARCHIVE3_SHEET} and removed from NEWS IN")
-        return True
+    batch = Archive3Batch(sm, COL['link'], commit_every=1, pending_file=ARCHIVE_PENDING_FILE, journal=journal)
+    # Shares the pending file with process_all_checked: leftovers from a crashed
+    # batch run are committed together with this article, in one grouped delete,
+    # so row_num is not shifted by deleting them first
+    batch.recover(commit=False)
+    return batch.add(row, row_num, short_link, short_linkedin_url, gamma_url, topic_display, key=key)
+
+
+def article_key(row):
+    """
+    Stable journal key for a NEWS IN row (row numbers shift as rows are archived).
+    None without a link: titles aren't unique, so such rows run without the journal.
+    """
+    return get_cell(row, 'link') or None
 
+
+def open_journal(path=JOB_JOURNAL_DB):
+    """Open the job journal, or run without resume support if it can't be opened"""
+    try:
+        journal = JobJournal(path)
+        journal.prune(JOB_JOURNAL_MAX_AGE_DAYS)
+        return journal
     except Exception as e:
-        print(f"Archive error: {e}")
-        return False
+        print(f"⚠️  Job journal unavailable ({e}) - reruns will redo every stage")
+        return None
 
 
-def process_news_in_article(sm, row, row_num):
-    """Process a single article from NEWS IN sheet with AI scores"""
+def prepare_news_in_article(row, row_num, journal=None):
+    """
+    Preparation stage for one NEWS IN article: validation, AI extraction,
+    rationales, Gamma carousel (with vision review), logo PDF, teaser and keywords.
+    Returns the prepared post dict, None if skipped, or False on failure.
+    Touches no shared state, so several articles can be prepared concurrently.
+    With a journal, stages completed by an earlier (failed) run are reused.
+    """
 
     title = get_cell(row, 'title') or 'News Update'
     link = get_cell(row, 'link') or ''
     publisher = get_cell(row, 'publisher') or 'News'
     author = get_cell(row, 'author') or ''
+    key = article_key(row)
+    journal = journal if key else None
 
     # ========================================
     # CONTENT VALIDATION - Skip incomplete articles
     # ========================================
-    try:
-        from content_validator import ContentValidator, INSUFFICIENT_CONTENT_PENALTY
-
-        print(f"\n📋 Validating content for: {title[:40]}...")
-        validator = ContentValidator()
-        validation = validator.validate_article(link)
-
-        if not validation.is_sufficient:
-            print(f"⚠️  SKIPPING - Insufficient content:")
-            print(f"   Reason: {validation.reason}")
-            print(f"   Word count: {validation.word_count} (min: 300)")
-            print(f"   Data points: {validation.data_points_count} (min: 2)")
-            print(f"   → Article would receive -{INSUFFICIENT_CONTENT_PENALTY} penalty")
-            print(f"   → Skipping to prevent hallucinated 'By The Numbers' data")
-            return None  # Skip this article
-        else:
-            print(f"✅ Content validated: {validation.word_count} words, {validation.data_points_count} data points")
-            # Store extracted data points for use in carousel
-            row_data_points = validation.data_points_found[:3] if validation.data_points_found else []
-    except ImportError:
-        print("⚠️  Content validator not available - proceeding without validation")
-        row_data_points = []
-    except Exception as e:
-        print(f"⚠️  Content validation error: {e} - proceeding anyway")
-        row_data_points = []
+    row_data_points = journal.get(key, 'validation') if journal else None
+    if row_data_points is not None:
+        print(f"\n↺ validation: resumed from journal for {title[:40]}...")
+    else:
+        try:
+            from content_validator import ContentValidator, INSUFFICIENT_CONTENT_PENALTY
+
+            print(f"\n📋 Validating content for: {title[:40]}...")
+            validator = ContentValidator()
+            validation = validator.validate_article(link)
+
+            if not validation.is_sufficient:
+                print(f"⚠️  SKIPPING - Insufficient content:")
+                print(f"   Reason: {validation.reason}")
+                print(f"   Word count: {validation.word_count} (min: 300)")
+                print(f"   Data points: {validation.data_points_count} (min: 2)")
+                print(f"   → Article would receive -{INSUFFICIENT_CONTENT_PENALTY} penalty")
+                print(f"   → Skipping to prevent hallucinated 'By The Numbers' data")
+                return None  # Skip this article
+            else:
+                print(f"✅ Content validated: {validation.word_count} words, {validation.data_points_count} data points")
+                # Store extracted data points for use in carousel
+                row_data_points = validation.data_points_found[:3] if validation.data_points_found else []
+                if journal:
+                    journal.record(key, 'validation', row_data_points)
+        except ImportError:
+            print("⚠️  Content validator not available - proceeding without validation")
+            row_data_points = []
+        except Exception as e:
+            print(f"⚠️  Content validation error: {e} - proceeding anyway")
+            row_data_points = []
 
     # Get AI scores and POVs - 5 AI models (80% weighting) + 2 news sources (20% weighting)
     # Each AI model contributes 16% (80% / 5 models)
@@ -222,32 +236,11 @@ def process_news_in_article(sm, row, row_num):
 
     consensus_score = str(consensus_score)
 
-    # Classify topic into second-level category
-    topic = classify_topic(title)
-    topic_display = topic['display'] if topic else 'Uncategorized'
-    topic_section = topic['section_name'] if topic else ''
-
     print(f"\n{'='*60}")
     print(f"Processing: {title[:50]}...")
-    print(f"Topic: {topic_display} ({topic_section})")
     print(f"AI Radar Score: {consensus_score}")
     print(f"{'='*60}")
 
-    # Fetch article content for AI extraction
-    print("Fetching article content...")
-    try:
-        response = requests.get(link, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
-        content = response.text[:5000]
-    except:
-        content = title
-
-    # Use AI to extract key info
-    print("Extracting info with AI...")
-    extracted = extract_article_info_with_ai(title, content, author)
-
-    # Generate fresh rationales from each AI model (GPT-4o, Claude 3.5, Gemini 1.5, Grok)
-    print("Generating AI rationales from latest models...")
-    summary_text = extracted.get('summary', title)
     ai_input_scores = {
         'claude': get_cell(row, 'claude_score') or '90',
         'chatgpt': get_cell(row, 'gpt_score') or '90',
@@ -255,129 +248,282 @@ def process_news_in_article(sm, row, row_num):
         'gemini': get_cell(row, 'gemini_score') or '90'
     }
 
-    consensus_explanation = ''  # Initialize before try block
-    try:
-        rationale_results = generate_all_rationales(title, summary_text, ai_input_scores)
-
-        # Update ai_scores with fresh rationales
-        if rationale_results:
-            if 'Claude' in ai_scores and rationale_results.get('claude', {}).get('rationale'):
-                ai_scores['Claude']['rationale'] = rationale_results['claude']['rationale']
-            if 'ChatGPT' in ai_scores and rationale_results.get('chatgpt', {}).get('rationale'):
-                ai_scores['ChatGPT']['rationale'] = rationale_results['chatgpt']['rationale']
-            if 'Grok' in ai_scores and rationale_results.get('grok', {}).get('rationale'):
-                ai_scores['Grok']['rationale'] = rationale_results['grok']['rationale']
-            if 'Gemini' in ai_scores and rationale_results.get('gemini', {}).get('rationale'):
-                ai_scores['Gemini']['rationale'] = rationale_results['gemini']['rationale']
-
-            # Get consensus explanation
-            consensus_explanation = rationale_results.get('consensus', {}).get('explanation', '')
-            if rationale_results.get('consensus', {}).get('score'):
-                consensus_score = str(rationale_results['consensus']['score'])
-    except Exception as e:
-        print(f"Warning: AI rationale generation failed: {e}")
-
-    # Shorten article link with custom title slug
-    short_link = shorten_url(link, title) if link else ''
-
-    # Prepare article data for carousel WITH AI SCORES and TOPIC
-    article_data = {
-        'title': title,
-        'publication': publisher,
-        'author': author,
-        'link': short_link,
-        'summary': extracted.get('summary', ''),
-        'data_points': extracted.get('data_points', []),
-        'quote': extracted.get('quote', ''),
-        'quote2': extracted.get('quote2', ''),
-        'key_insights': extracted.get('key_insights', []),
-        'strategic_take': extracted.get('strategic_take', ''),
-        'ai_scores': ai_scores,
-        'consensus_score': consensus_score,
-        'consensus_explanation': consensus_explanation,
-        'topic': topic  # Second-level category (e.g., "41 Artificial Intelligence")
-    }
+    # ========================================
+    # ENRICHMENT STEPS - independent calls run concurrently
+    # ========================================
 
-    # Generate carousel from JJ Shay v3 template (with logos)
-    # Uses Claude Vision review loop - regenerates if issues found
-    print("Generating carousel from template (with vision review)...")
-    generator = GammaCarouselGenerator()
-    result = generator.generate_with_review(JJSHAY_TEMPLATE_ID, article_data, export_format="pdf", max_attempts=2)
+    def step_topic():
+        # Classify topic into second-level category
+        topic = classify_topic(title)
+        topic_display = topic['display'] if topic else 'Uncategorized'
+        topic_section = topic['section_name'] if topic else ''
+        print(f"Topic: {topic_display} ({topic_section})")
+        return topic
+
+    def step_content():
+        # Fetch article content for AI extraction. None on failure: the journal
+        # doesn't record it, so a rerun fetches again instead of replaying the title
+        print("Fetching article content...")
+        try:
+            response = requests.get(link, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
+            return html_to_text(response.text, 5000) or None
+        except Exception:
+            return None
+
+    def step_extracted(content):
+        # Use AI to extract key info (from the title alone if the fetch failed)
+        print("Extracting info with AI...")
+        return extract_article_info_with_ai(title, content or title, author)
+
+    def step_rationales(extracted):
+        # Generate fresh rationales from each AI model (GPT-4o, Claude 3.5, Gemini 1.5, Grok)
+        print("Generating AI rationales from latest models...")
+        summary_text = extracted.get('summary', title)
+        scores = {name: dict(data) for name, data in ai_scores.items()}
+        score = consensus_score
+        consensus_explanation = ''
+        try:
+            rationale_results = generate_all_rationales(title, summary_text, ai_input_scores)
+
+            # Update ai_scores with fresh rationales
+            if rationale_results:
+                if 'Claude' in scores and rationale_results.get('claude', {}).get('rationale'):
+                    scores['Claude']['rationale'] = rationale_results['claude']['rationale']
+                if 'ChatGPT' in scores and rationale_results.get('chatgpt', {}).get('rationale'):
+                    scores['ChatGPT']['rationale'] = rationale_results['chatgpt']['rationale']
+                if 'Grok' in scores and rationale_results.get('grok', {}).get('rationale'):
+                    scores['Grok']['rationale'] = rationale_results['grok']['rationale']
+                if 'Gemini' in scores and rationale_results.get('gemini', {}).get('rationale'):
+                    scores['Gemini']['rationale'] = rationale_results['gemini']['rationale']
+
+                # Get consensus explanation
+                consensus_explanation = rationale_results.get('consensus', {}).get('explanation', '')
+                if rationale_results.get('consensus', {}).get('score'):
+                    score = str(rationale_results['consensus']['score'])
+        except Exception as e:
+            print(f"Warning: AI rationale generation failed: {e}")
+
+        return {'ai_scores': scores, 'consensus_score': score, 'consensus_explanation': consensus_explanation}
+
+    def step_short_link():
+        # Shorten article link with custom title slug
+        return shorten_url(link, title) if link else ''
+
+    def step_carousel(extracted, rationales, short_link, topic):
+        # Prepare article data for carousel WITH AI SCORES and TOPIC
+        article_data = {
+            'title': title,
+            'publication': publisher,
+            'author': author,
+            'link': short_link,
+            'summary': extracted.get('summary', ''),
+            'data_points': extracted.get('data_points', []),
+            'quote': extracted.get('quote', ''),
+            'quote2': extracted.get('quote2', ''),
+            'key_insights': extracted.get('key_insights', []),
+            'strategic_take': extracted.get('strategic_take', ''),
+            'ai_scores': rationales['ai_scores'],
+            'consensus_score': rationales['consensus_score'],
+            'consensus_explanation': rationales['consensus_explanation'],
+            'topic': topic  # Second-level category (e.g., "41 Artificial Intelligence")
+        }
 
+        # Generate carousel from JJ Shay v3 template (with logos)
+        # Uses Claude Vision review loop - regenerates if issues found
+        print("Generating carousel from template (with vision review)...")
+        generator = GammaCarouselGenerator()
+        return generator.generate_with_review(JJSHAY_TEMPLATE_ID, article_data, export_format="pdf", max_attempts=2)
+
+    def step_pdf_with_logo(carousel, rationales):
+        if not carousel:
+            return None
+        # Add logo to PDF and AI scores table on slide 7
+        print("Adding logo to PDF...")
+        pdf_with_logo = PDF_WITH_LOGO_TEMPLATE.format(row_num=row_num)
+        add_logo_to_pdf(carousel.get('export_url'), pdf_with_logo, ai_scores=rationales['ai_scores'])
+        return pdf_with_logo
+
+    def step_teaser(extracted):
+        # Generate Grok teaser (2 sentences, executive-level, 100% truthful)
+        print("Generating Grok teaser...")
+        teaser = generate_grok_teaser(title, extracted.get('summary', ''))
+        print(f"Teaser: {teaser[:100]}...")
+        return teaser
+
+    def step_keywords(extracted):
+        # Generate keywords with Grok (3 only, no hashtags)
+        print("Generating keywords...")
+        keywords = generate_grok_keywords(title, extracted.get('summary', ''))
+        print(f"Keywords: {keywords}")
+        return keywords
+
+    def step_caption(teaser, short_link, keywords):
+        # Build caption: Grok teaser, article link, Recent Posts, 3 keywords (NO consensus)
+        return build_new_caption(teaser, short_link, keywords)
+
+    def checkpoint(stage, fn, is_valid=None):
+        # Replay stages completed by a previous run from the journal
+        return journal.step(key, stage, fn, is_valid) if journal else fn
+
+    graph = StepGraph(f"row {row_num}")
+    graph.add('topic', checkpoint('topic', step_topic))
+    graph.add('content', checkpoint('content', step_content))
+    graph.add('short_link', checkpoint('short_link', step_short_link))
+    graph.add('extracted', checkpoint('extracted', step_extracted), inputs=['content'])
+    graph.add('rationales', checkpoint('rationales', step_rationales), inputs=['extracted'])
+    graph.add('teaser', checkpoint('teaser', step_teaser), inputs=['extracted'])
+    graph.add('keywords', checkpoint('keywords', step_keywords), inputs=['extracted'])
+    graph.add('carousel', checkpoint('carousel', step_carousel),
+              inputs=['extracted', 'rationales', 'short_link', 'topic'])
+    graph.add('pdf_with_logo', checkpoint('pdf_with_logo', step_pdf_with_logo, is_valid=os.path.exists),
+              inputs=['carousel', 'rationales'])
+    graph.add('caption', step_caption, inputs=['teaser', 'short_link', 'keywords'])
+
+    results = graph.run(max_workers=STEP_WORKERS)
+    print(f"⏱  {graph.report()}")
+
+    result = results['carousel']
     if not result:
         print("ERROR: Carousel generation failed")
         return False
 
     gamma_url = result.get('gamma_url')
-    pdf_url = result.get('export_url')
     print(f"Gamma URL: {gamma_url}")
 
-    # Add logo to PDF and AI scores table on slide 7
-    print("Adding logo to PDF...")
-    pdf_with_logo = "/Users/johnshay/jj_shay_takeaways/carousel_with_logo.pdf"
-    add_logo_to_pdf(pdf_url, pdf_with_logo, ai_scores=ai_scores)
+    topic = results['topic']
+    topic_display = topic['display'] if topic else 'Uncategorized'
+    short_link = results['short_link']
+    summary = results['extracted'].get('summary', '')
+    consensus_score = results['rationales']['consensus_score']
+    pdf_with_logo = results['pdf_with_logo']
+    caption = results['caption']
+
+    return {
+        'row': row,
+        'row_num': row_num,
+        'title': title,
+        'publisher': publisher,
+        'short_link': short_link,
+        'summary': summary,
+        'consensus_score': consensus_score,
+        'topic': topic,
+        'topic_display': topic_display,
+        'gamma_url': gamma_url,
+        'pdf_with_logo': pdf_with_logo,
+        'caption': caption,
+        'step_timings': dict(graph.timings),
+        'journal_key': key,
+    }
 
-    # Generate Grok teaser (2 sentences, executive-level, 100% truthful)
-    summary = extracted.get('summary', '')
-    print("Generating Grok teaser...")
-    teaser = generate_grok_teaser(title, summary)
-    print(f"Teaser: {teaser[:100]}...")
 
-    # Generate keywords with Grok (3 only, no hashtags)
-    print("Generating keywords...")
-    keywords = generate_grok_keywords(title, summary)
-    print(f"Keywords: {keywords}")
+def publish_news_in_article(sm, prepared, linkedin=None, scheduler=None, archive=None, journal=None):
+    """Posting stage: LinkedIn carousel post, post log and ARCHIVE3 archiving"""
+    title = prepared['title']
+    row_num = prepared['row_num']
+    topic = prepared['topic']
+    key = prepared.get('journal_key')
+    journal = journal if key else None
 
-    # Build caption: Grok teaser, article link, Recent Posts, 3 keywords (NO consensus)
-    caption = build_new_caption(teaser, short_link, keywords)
+    posted = journal.get(key, 'post') if journal else None
+    if posted:
+        # Already on LinkedIn from an earlier run - never post twice
+        post_urn = posted['post_urn']
+        print(f"↺ post: resumed from journal ({post_urn})")
+    else:
+        # Post to LinkedIn
+        print(f"Posting to LinkedIn: {title[:50]}...")
+        linkedin = linkedin or LinkedInAPI()
 
-    # Post to LinkedIn
-    print("Posting to LinkedIn...")
-    linkedin = LinkedInAPI()
+        if not linkedin.access_token:
+            print("ERROR: LinkedIn not authenticated")
+            return False
 
-    if not linkedin.access_token:
-        print("ERROR: LinkedIn not authenticated")
-        return False
+        if scheduler:
+            post_urn = scheduler.post(linkedin, prepared['pdf_with_logo'], title, prepared['caption'])
+        else:
+            post_urn = linkedin.create_carousel_post(prepared['pdf_with_logo'], title, prepared['caption'])
 
-    post_urn = linkedin.create_carousel_post(pdf_with_logo, title, caption)
+        if not post_urn:
+            print("ERROR: LinkedIn post failed")
+            return False
 
-    if not post_urn:
-        print("ERROR: LinkedIn post failed")
-        return False
+        if journal:
+            journal.record(key, 'post', {'post_urn': post_urn})
 
     linkedin_url = f"https://www.linkedin.com/feed/update/{post_urn}"
-    short_linkedin_url = shorten_url(linkedin_url)
+    short_linkedin_url = (posted or {}).get('short_linkedin_url') or shorten_url(linkedin_url)
+    if journal:
+        journal.record(key, 'post', {'post_urn': post_urn, 'short_linkedin_url': short_linkedin_url})
     print(f"Posted! {linkedin_url}")
     print(f"Short URL: {short_linkedin_url}")
 
+    if journal and journal.has(key, 'archive'):
+        print(f"↺ archive: row {row_num} already queued for ARCHIVE3")
+        return True
+
     # Log the post with topic tracking
-    log_post({
-        "date_posted": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "title": title,
-        "publication": publisher,
-        "linkedin_urn": post_urn,
-        "linkedin_url": linkedin_url,
-        "short_url": short_linkedin_url,
-        "article_link": short_link,  # Article bitly for Recent News section
-        "gamma_url": gamma_url,
-        "summary": extracted.get('summary', '')[:200],
-        "consensus_score": consensus_score,
-        "topic_code": topic['code'] if topic else None,
-        "topic_name": topic['name'] if topic else 'Uncategorized',
-        "topic_section": topic['section_name'] if topic else '',
-        "status": "Posted"
-    })
-
-    # Archive to ARCHIVE3 (moves row from NEWS OUT, adds bit.ly links, gamma URL, and topic)
-    archive_to_archive3(sm, row, row_num, short_link, short_linkedin_url, gamma_url, topic_display)
-
-    print(f"✓ Complete! Archived row {row_num} to ARCHIVE3")
+    if journal and journal.has(key, 'logged'):
+        print("↺ log_post: resumed from journal")
+    else:
+        log_post({
+            "date_posted": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "title": title,
+            "publication": prepared['publisher'],
+            "linkedin_urn": post_urn,
+            "linkedin_url": linkedin_url,
+            "short_url": short_linkedin_url,
+            "article_link": prepared['short_link'],  # Article bitly for Recent News section
+            "gamma_url": prepared['gamma_url'],
+            "summary": prepared['summary'][:200],
+            "consensus_score": prepared['consensus_score'],
+            "topic_code": topic['code'] if topic else None,
+            "topic_name": topic['name'] if topic else 'Uncategorized',
+            "topic_section": topic['section_name'] if topic else '',
+            "status": "Posted"
+        })
+        if journal:
+            journal.record(key, 'logged', True)
+
+    # Archive to ARCHIVE3 (moves row from NEWS IN, adds bit.ly links, gamma URL, and topic).
+    # The batch marks the journal 'archive' when queued and forgets the article once committed.
+    if archive is not None:
+        archive.add(prepared['row'], row_num, prepared['short_link'], short_linkedin_url,
+                    prepared['gamma_url'], prepared['topic_display'], key=key)
+        print(f"✓ Complete! Row {row_num} queued for ARCHIVE3")
+    else:
+        if not archive_to_archive3(sm, prepared['row'], row_num, prepared['short_link'], short_linkedin_url,
+                                   prepared['gamma_url'], prepared['topic_display'], journal=journal, key=key):
+            return False
+        print(f"✓ Complete! Archived row {row_num} to ARCHIVE3")
     return True
 
 
-def process_all_checked():
-    """Process all checked articles from NEWS IN"""
+def process_news_in_article(sm, row, row_num, journal=None):
+    """Process a single article from NEWS IN sheet with AI scores"""
+    journal = journal or open_journal()
+    prepared = prepare_news_in_article(row, row_num, journal)
+    if not prepared:
+        return prepared  # None = skipped, False = failed
+    return publish_news_in_article(sm, prepared, journal=journal)
+
+
+def process_all_checked(prep_workers=PREP_WORKERS):
+    """
+    Process all checked articles from NEWS IN as a two-stage pipeline:
+    preparation runs ahead on a worker pool while finished articles are
+    posted one at a time through the LinkedIn scheduler.
+    """
+    start_time = time.time()
     sm = SheetManager()
+
+    # Finish any archive commit interrupted by a crash before reading NEWS IN,
+    # so already-posted rows are not picked up (and posted) again
+    journal = open_journal()
+    archive = Archive3Batch(sm, COL['link'], pending_file=ARCHIVE_PENDING_FILE, journal=journal)
+    if not archive.recover():
+        print("ERROR: Could not recover pending ARCHIVE3 rows - aborting to avoid double posts")
+        return
+
     sheet = sm.spreadsheet.worksheet('NEWS IN')
     all_rows = sheet.get_all_values()
 
@@ -389,23 +535,58 @@ def process_all_checked():
             checked_articles.append((i, row))
 
     print(f"Found {len(checked_articles)} checked articles to process")
+    if not checked_articles:
+        return
 
-    # Process in REVERSE order (highest row first) so deletions don't shift remaining indices
+    # Fail fast before spending any AI/Gamma calls
+    linkedin = LinkedInAPI()
+    if not linkedin.access_token:
+        print("ERROR: LinkedIn not authenticated")
+        return
+
+    scheduler = LinkedInPostScheduler()
+
+    # Post in REVERSE order (highest row first) so batched deletions every
+    # ARCHIVE_COMMIT_EVERY articles never shift the rows still waiting
     processed = 0
     skipped = 0
-    for row_num, row in reversed(checked_articles):
-        result = process_news_in_article(sm, row, row_num)
-        if result is None:
-            skipped += 1
-            print(f"   → Skipped (insufficient content)")
-        else:
-            processed += 1
-        time.sleep(5)  # Brief pause between posts
+    failed = 0
+    items = [(row, row_num, journal) for row_num, row in reversed(checked_articles)]
+    pipeline = prepare_ahead(items, prepare_news_in_article, prep_workers)
+    try:
+        for (_, row_num, _), prepared, error in pipeline:
+            if error:
+                print(f"ERROR: Preparation failed for row {row_num}: {error}")
+                prepared = False
+
+            if prepared is None:
+                skipped += 1
+                print(f"   → Skipped row {row_num} (insufficient content)")
+                continue
+
+            if prepared and publish_news_in_article(sm, prepared, linkedin, scheduler, archive, journal):
+                processed += 1
+            else:
+                failed += 1
+    finally:
+        # Stop preparing (queued articles are cancelled, not run) and commit
+        # whatever is still queued, even if the loop was interrupted
+        pipeline.close()
+        archive.commit()
 
     print("\n" + "="*60)
-    print(f"ALL DONE! Processed: {processed}, Skipped: {skipped}")
+    print(f"ALL DONE! Processed: {processed}, Skipped: {skipped}, Failed: {failed}")
+    print(f"Total time: {time.time() - start_time:.1f}s")
     print("="*60)
 
 
+def main(argv=None):
+    """news-intel post: build and post every checked NEWS IN article"""
+    parser = argparse.ArgumentParser(prog="news-intel post", description="Process checked NEWS IN articles and post them to LinkedIn")
+    parser.add_argument("--prep-workers", type=int, default=PREP_WORKERS, help="articles prepared in parallel")
+    args = parser.parse_args(argv)
+    process_all_checked(prep_workers=args.prep_workers)
+
+
 if __name__ == "__main__":
-    process_all_checked()
+    main()
@@ -0,0 +1,104 @@
+"""
+Batched replies for reactions on the same post
+- Groups pending reactions by the article they reacted to
+- One LLM request per group asks for a distinct, personalized short reply per
+  reactor (keyed by sheet row), using their industry / company / location
+- Replies are parsed back from JSON; anything missing, empty or duplicated is
+  left for the normal per-row path
+"""
+
+import json
+import re
+
+# Reactors per LLM request, and the token budget given to each reply
+REACTION_BATCH_SIZE = 20
+TOKENS_PER_REPLY = 90
+MIN_BATCH = 2            # smaller groups are cheaper to answer one by one
+
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def group_reactions(items, min_batch=MIN_BATCH, batch_size=REACTION_BATCH_SIZE):
+    """
+    items: iterable of (key, article, reactor) for reactions with a known article.
+    Returns [(article, [(key, reactor), ...]), ...], chunked to batch_size,
+    for articles with at least min_batch reactions.
+    """
+    groups = {}
+    for key, article, reactor in items:
+        article_key = article.get('link') or article.get('title', '')
+        if article_key not in groups:
+            groups[article_key] = (article, [])
+        groups[article_key][1].append((key, reactor))
+
+    batches = []
+    for article, members in groups.values():
+        if len(members) < min_batch:
+            continue
+        for start in range(0, len(members), batch_size):
+            chunk = members[start:start + batch_size]
+            if len(chunk) >= min_batch:
+                batches.append((article, chunk))
+    return batches
+
+
+def _describe(reactor):
+    parts = [reactor.get('name') or 'Someone']
+    for label in ('industry', 'company', 'location'):
+        if reactor.get(label):
+            parts.append(f"{label}: {reactor[label]}")
+    parts.append(f'reaction: "{reactor.get("reaction") or "like"}"')
+    return ", ".join(parts)
+
+
+def build_batch_prompt(article, members):
+    """One prompt asking for a distinct reply per reactor, returned as JSON keyed by id"""
+    people = "\n".join(f'- id "{key}": {_describe(reactor)}' for key, reactor in members)
+    return f"""You are JJ Shay, a business AI influencer on LinkedIn.
+
+ORIGINAL ARTICLE/POST:
+Title: {article.get('title', 'N/A')}
+Content: {article.get('description', 'N/A')[:1500]}
+
+These {len(members)} people reacted to this post:
+{people}
+
+For EACH person write a brief, personalized LinkedIn comment (2-3 sentences) that:
+1. Thanks them by first name for engaging
+2. References something specific from the article
+3. Asks a follow-up question tailored to their industry/company if known
+4. Sounds authentic and conversational
+Every reply must be different - do not reuse sentences between people.
+
+Return ONLY a JSON object mapping each id to its reply text, e.g. {{"{members[0][0]}": "..."}}"""
+
+
+def batch_max_tokens(members):
+    return TOKENS_PER_REPLY * len(members) + 100
+
+
+def parse_batch_reply(text, keys):
+    """{key: reply} for the keys answered with a distinct, non-empty reply"""
+    if not text:
+        return {}
+    match = _JSON_OBJECT_RE.search(text)
+    if not match:
+        return {}
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    replies, seen = {}, set()
+    for key in keys:
+        reply = data.get(str(key))
+        if not isinstance(reply, str) or not reply.strip():
+            continue
+        reply = reply.strip()
+        if reply in seen:
+            continue
+        seen.add(reply)
+        replies[key] = reply
+    return replies
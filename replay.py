@@ -0,0 +1,123 @@
+"""
+Headless replay of the scoring pipeline against simulated providers
+- Runs the real fetch_news path (score_article -> create_peer_pairs ->
+  calculate_consensus) over an article file, with no API keys
+- Each simulated provider sleeps for a configurable latency (with jitter and an
+  optional failure rate) and returns a deterministic score for the prompt
+- Reports measured wall time, per-stage timings and call counts per provider
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+PROVIDERS = ('ChatGPT', 'Claude', 'Gemini', 'Grok', 'Perplexity')
+DEFAULT_LATENCY = 0.4      # seconds per simulated call
+DEFAULT_JITTER = 0.25      # +/- fraction of the latency
+
+
+class SimulatedProvider:
+    """Stand-in for one call_* function: fn(prompt) -> {'score', 'rationale'} or None"""
+
+    def __init__(self, name, latency=DEFAULT_LATENCY, jitter=DEFAULT_JITTER, fail_rate=0.0, seed=0,
+                 sleep=time.sleep):
+        self.name = name
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.rng = random.Random(f"{seed}:{name}")
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+
+    def __call__(self, prompt):
+        with self.lock:
+            delay = max(0.0, self.latency * (1 + self.rng.uniform(-self.jitter, self.jitter)))
+            failed = self.rng.random() < self.fail_rate
+            self.calls += 1
+            self.failures += failed
+            self.busy_seconds += delay
+        self.sleep(delay)
+        if failed:
+            return None
+
+        digest = hashlib.sha1(f"{self.name}\x1f{prompt}".encode("utf-8")).digest()
+        score = 55 + digest[0] % 41          # 55-95, stable for a given article
+        return {
+            'score': score,
+            'rationale': f"Simulated {self.name} review: sourcing and clarity rated {score}%.",
+        }
+
+
+class StageTimer:
+    """Accumulated wall time per pipeline stage"""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.counts = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+            self.counts[name] += 1
+
+
+def load_articles(path):
+    """Articles from a JSON array file; `summary` feeds the scoring prompt's description"""
+    with open(path) as f:
+        articles = json.load(f)
+    for article in articles:
+        article.setdefault('description', article.get('summary', ''))
+    return articles
+
+
+def simulated_callers(latency=DEFAULT_LATENCY, jitter=DEFAULT_JITTER, fail_rate=0.0, seed=0):
+    return {name: SimulatedProvider(name, latency, jitter, fail_rate, seed) for name in PROVIDERS}
+
+
+def replay(articles, callers):
+    """
+    Score every article through the real pipeline functions using callers.
+    Returns {'results', 'wall_seconds', 'stages', 'calls', 'failures', 'busy_seconds'}.
+    """
+    from fetch_news import calculate_consensus, create_peer_pairs, score_article
+
+    timer = StageTimer()
+    results = []
+    start = time.perf_counter()
+    for i, article in enumerate(articles, 1):
+        print(f"\n[{i}/{len(articles)}] {article.get('title', '')[:50]}...")
+        with timer.stage('score'):
+            scores = score_article(article, callers=callers)
+        with timer.stage('pair'):
+            pairs = create_peer_pairs(scores)
+        with timer.stage('consensus'):
+            consensus, llm_count, contributing, confidence, std_dev = calculate_consensus(scores, len(callers))
+        results.append({
+            'title': article.get('title', ''),
+            'source': article.get('source', ''),
+            'consensus': consensus,
+            'llm_count': llm_count,
+            'confidence': confidence,
+            'pairs': pairs,
+        })
+    wall = time.perf_counter() - start
+
+    return {
+        'results': results,
+        'wall_seconds': wall,
+        'stages': {name: {'seconds': timer.seconds[name], 'count': timer.counts[name]} for name in timer.seconds},
+        'calls': {name: getattr(call, 'calls', None) for name, call in callers.items()},
+        'failures': {name: getattr(call, 'failures', None) for name, call in callers.items()},
+        'busy_seconds': sum(getattr(call, 'busy_seconds', 0.0) for call in callers.values()),
+    }
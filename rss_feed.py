@@ -0,0 +1,265 @@
+"""
+Persistent, conditionally refreshed RSS feed cache
+- Parsed posts are stored on disk with the feed's ETag / Last-Modified
+- Startup loads the cached index immediately; refresh can run in the background
+- Refresh sends a conditional GET: 304 costs nothing, 200 merges only new items
+- Posts that drop off the RSS window stay resolvable from the cache
+- Feeds are parsed with iterparse (items cleared as they are read) into one
+  compact PostRecord per post; URL / activity ID / guid are secondary keys
+"""
+
+import io
+import json
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+
+import requests
+
+from html_extract import html_to_text
+from post_index import ActivityIndex
+
+ACTIVITY_RE = re.compile(r'activity[:\-](\d+)')
+
+
+class PostRecord:
+    """One cached post; supports post['title'] / post.get('title') like the old dicts"""
+
+    __slots__ = ('title', 'description', 'link', 'guid', 'activity_id')
+
+    FIELDS = ('title', 'description', 'link', 'guid')
+
+    def __init__(self, title, description, link, guid=""):
+        self.title = title or ""
+        self.description = description or ""
+        self.link = link
+        self.guid = guid or ""
+        activity_match = ACTIVITY_RE.search(link)
+        self.activity_id = activity_match.group(1) if activity_match else None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('title'), data.get('description'), data['link'], data.get('guid'))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def keys(self):
+        """URL, activity ID and guid - every key the post can be looked up by"""
+        keys = [self.link]
+        if self.activity_id:
+            keys.append(self.activity_id)
+        if self.guid:
+            keys.append(self.guid)
+        return keys
+
+    def __getitem__(self, field):
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in self.FIELDS else default
+
+    def __repr__(self):
+        return f"PostRecord({self.link!r})"
+
+
+class PostStore(Mapping):
+    """
+    Read-only key -> PostRecord mapping with one canonical record per post.
+    records holds the posts (oldest first); key_index maps URL / activity ID /
+    guid to a position in records.
+    """
+
+    __slots__ = ('records', 'key_index')
+
+    def __init__(self, records=(), key_index=None):
+        self.records = list(records)
+        self.key_index = dict(key_index) if key_index is not None else {}
+
+    def add(self, record):
+        """Append a record unless its URL is already known; True if added"""
+        if record.link in self.key_index:
+            return False
+        pos = len(self.records)
+        self.records.append(record)
+        for key in record.keys():
+            self.key_index[key] = pos
+        return True
+
+    def copy(self):
+        return PostStore(self.records, self.key_index)
+
+    def __getitem__(self, key):
+        return self.records[self.key_index[key]]
+
+    def __contains__(self, key):
+        return key in self.key_index
+
+    def __iter__(self):
+        return iter(self.key_index)
+
+    def __len__(self):
+        return len(self.key_index)
+
+
+class RSSFeedCache:
+    """posts_cache (URL / activity ID / guid -> PostRecord) backed by a JSON file"""
+
+    def __init__(self, feed_url, cache_file=None, timeout=10):
+        self.feed_url = feed_url
+        self.cache_file = cache_file
+        self.timeout = timeout
+        self.etag = None
+        self.last_modified = None
+        self.posts_cache = PostStore()
+        self.index = ActivityIndex(self.posts_cache)
+        self.lock = threading.Lock()
+        self.refresh_thread = None
+
+    # ---------- cache contents ----------
+
+    def _merge(self, new_records):
+        """Add posts not seen before; swap in the new store and index atomically"""
+        with self.lock:
+            fresh = [r for r in new_records if r.link not in self.posts_cache]
+            if not fresh:
+                return 0
+
+            posts_cache = self.posts_cache.copy()
+            added = sum(posts_cache.add(record) for record in fresh)
+            index = ActivityIndex(posts_cache)
+
+            self.posts_cache = posts_cache
+            self.index = index
+        return added
+
+    def post_count(self):
+        return len(self.posts_cache.records)
+
+    def lookup(self, activity_id):
+        """Find a post by activity ID (same semantics as find_article_by_id)"""
+        with self.lock:
+            posts_cache, index = self.posts_cache, self.index
+        return index.lookup(posts_cache, activity_id)
+
+    # ---------- disk ----------
+
+    def load(self):
+        """Load the on-disk cache; returns the number of posts available"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return 0
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ RSS cache unreadable, ignoring: {e}")
+            return 0
+
+        self._merge(PostRecord.from_dict(item) for item in data.get('items', []))
+        self.etag = data.get('etag')
+        self.last_modified = data.get('last_modified')
+        return self.post_count()
+
+    def save(self):
+        if not self.cache_file:
+            return
+        with self.lock:
+            records = self.posts_cache.records
+        data = {
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'items': [record.to_dict() for record in records],
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            tmp_path = self.cache_file + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            print(f"⚠️ Could not save RSS cache: {e}")
+
+    # ---------- network ----------
+
+    @staticmethod
+    def parse(content):
+        """
+        Stream RSS XML (bytes or a file object) into PostRecords.
+        Each <item> is cleared and detached from its parent once read, so
+        neither the items nor their emptied shells accumulate under <channel>.
+        """
+        source = io.BytesIO(content) if isinstance(content, (bytes, bytearray)) else content
+        records = []
+        open_elements = []       # ancestors of the current element (parents of finished items)
+
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if elem.tag.rpartition('}')[2] != 'item':
+                continue
+
+            fields = {child.tag.rpartition('}')[2]: child.text for child in elem}
+            link = fields.get('link')
+            if link:
+                description = fields.get('description')
+                records.append(PostRecord(
+                    fields.get('title'),
+                    html_to_text(description) if description else "",
+                    link,
+                    fields.get('guid'),
+                ))
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
+
+        return records
+
+    def refresh(self):
+        """Conditional GET; returns the number of new posts merged"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        response = requests.get(self.feed_url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return 0
+        response.raise_for_status()
+
+        added = self._merge(self.parse(response.content))
+        self.etag = response.headers.get('ETag') or self.etag
+        self.last_modified = response.headers.get('Last-Modified') or self.last_modified
+        self.save()
+        return added
+
+    def refresh_async(self):
+        """Refresh on a background thread (no-op if one is already running)"""
+        if self.refresh_thread and self.refresh_thread.is_alive():
+            return self.refresh_thread
+
+        def run():
+            try:
+                added = self.refresh()
+                if added:
+                    print(f"📰 RSS refreshed: {added} new posts ({self.post_count()} total)")
+            except Exception as e:
+                print(f"❌ RSS refresh error: {e}")
+
+        self.refresh_thread = threading.Thread(target=run, daemon=True)
+        self.refresh_thread.start()
+        return self.refresh_thread
+
+    def wait_for_refresh(self, timeout=None):
+        """Block until a background refresh (if any) finishes; True if one was running"""
+        thread = self.refresh_thread
+        if thread and thread.is_alive():
+            thread.join(timeout)
+            return True
+        return False
@@ -0,0 +1,147 @@
+"""
+Buffered Google Sheets writes for comment responses
+- Collects the O (response), P (post title) and Q (post content) cells for many rows
+- Flushes them in one worksheet.batch_update call every N rows or T seconds,
+  and on close()
+- Anything still pending is flushed at interpreter exit (e.g. after Ctrl+C)
+- Retries with exponential backoff when the Sheets write quota is hit (HTTP 429)
+"""
+
+import atexit
+import threading
+import time
+
+FLUSH_ROWS = 25          # flush once this many rows are pending
+FLUSH_SECONDS = 10       # ...or once the oldest pending row is this old
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 2     # seconds; doubles on each quota retry
+
+RESPONSE_COL = 'O'
+CONTEXT_END_COL = 'Q'
+
+
+def is_quota_error(error):
+    """True for Sheets rate-limit errors (gspread APIError with status 429)"""
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+    text = str(error)
+    return '429' in text or 'RATE_LIMIT_EXCEEDED' in text or 'Quota exceeded' in text
+
+
+class SheetWriteBuffer:
+    """Queue per-row O/P/Q values and write them to the sheet in batches"""
+
+    def __init__(self, sheet, flush_rows=FLUSH_ROWS, flush_seconds=FLUSH_SECONDS,
+                 max_retries=MAX_RETRIES, retry_delay=RETRY_BASE_DELAY):
+        self.sheet = sheet
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.pending = {}            # sheet row number -> range update
+        self.oldest = None           # monotonic time of the oldest pending row
+        self.written = 0
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.timer_thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(self, row_num, response, article=None):
+        """Queue the response (O) and, if known, the article title/content (P, Q) for a sheet row"""
+        if article:
+            update = {
+                'range': f"{RESPONSE_COL}{row_num}:{CONTEXT_END_COL}{row_num}",
+                'values': [[response, article.get('title', '')[:500], article.get('description', '')[:2000]]],
+            }
+        else:
+            update = {'range': f"{RESPONSE_COL}{row_num}", 'values': [[response]]}
+
+        with self.lock:
+            self.pending[row_num] = update
+            if self.oldest is None:
+                self.oldest = time.monotonic()
+            due = len(self.pending) >= self.flush_rows
+
+        self._start_timer()
+        if due:
+            try:
+                self.flush()
+            except Exception as e:
+                # Rows stay queued; the next flush (timer or close) retries them
+                print(f"   ❌ Sheet flush error (will retry): {e}")
+
+    def pending_count(self):
+        with self.lock:
+            return len(self.pending)
+
+    def flush(self):
+        """Write all pending rows in one batch_update; returns the number of rows written"""
+        with self.flush_lock:
+            with self.lock:
+                batch, self.pending = self.pending, {}
+                self.oldest = None
+            if not batch:
+                return 0
+
+            try:
+                self._write(sorted(batch.items()))
+            except Exception:
+                # Put the rows back (newer values queued meanwhile win) so nothing is lost
+                with self.lock:
+                    batch.update(self.pending)
+                    self.pending = batch
+                    self.oldest = self.oldest or time.monotonic()
+                raise
+
+            self.written += len(batch)
+            return len(batch)
+
+    def _write(self, items):
+        data = [update for _, update in items]
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.sheet.batch_update(data)
+                return
+            except Exception as e:
+                if not is_quota_error(e) or attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay * (2 ** attempt)
+                print(f"   ⏳ Sheets quota hit, retrying {len(data)} rows in {delay}s...")
+                time.sleep(delay)
+
+    def _start_timer(self):
+        """Background thread that flushes rows older than flush_seconds"""
+        if self.flush_seconds is None or (self.timer_thread and self.timer_thread.is_alive()):
+            return
+
+        def run():
+            interval = min(1.0, self.flush_seconds / 2)
+            while not self.stop_event.wait(interval):
+                with self.lock:
+                    due = self.oldest is not None and time.monotonic() - self.oldest >= self.flush_seconds
+                if due:
+                    try:
+                        self.flush()
+                    except Exception as e:
+                        print(f"   ❌ Sheet flush error (will retry): {e}")
+
+        self.stop_event.clear()
+        self.timer_thread = threading.Thread(target=run, daemon=True)
+        self.timer_thread.start()
+        atexit.register(self.close)
+
+    def close(self):
+        """Stop the timer and write whatever is still pending"""
+        self.stop_event.set()
+        if self.timer_thread:
+            self.timer_thread.join()
+            self.timer_thread = None
+            atexit.unregister(self.close)
+        return self.flush()
@@ -0,0 +1,106 @@
+"""
+Small dependency-graph executor
+- Each step declares the steps it needs as inputs
+- Steps whose inputs are ready run concurrently on a thread pool
+- Results are passed to dependents as keyword arguments
+- Per-step timings are recorded for every run
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class StepGraph:
+    """Run named steps in dependency order, independent steps in parallel"""
+
+    def __init__(self, name="pipeline"):
+        self.name = name
+        self.steps = {}      # name -> (fn, inputs)
+        self.results = {}
+        self.timings = {}    # name -> seconds spent inside the step
+        self.wall_time = 0.0
+
+    def add(self, name, fn, inputs=()):
+        """Register a step. fn is called as fn(**{input_name: input_result})"""
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        self.steps[name] = (fn, tuple(inputs))
+        return self
+
+    def _validate(self):
+        """Reject unknown inputs and cycles before running anything"""
+        for name, (_, inputs) in self.steps.items():
+            for dep in inputs:
+                if dep not in self.steps:
+                    raise ValueError(f"Step '{name}' depends on unknown step '{dep}'")
+
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at step '{name}'")
+            visiting.add(name)
+            for dep in self.steps[name][1]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.steps:
+            visit(name)
+
+    def _timed(self, name, fn, kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(**kwargs)
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def run(self, max_workers=None):
+        """
+        Execute all steps and return {step_name: result}.
+        If a step raises, no new steps are started and the first error is re-raised
+        once the steps already running have finished.
+        """
+        self._validate()
+        self.results = {}
+        self.timings = {}
+        waiting = dict(self.steps)
+        running = {}
+        error = None
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.steps))) as pool:
+
+            def launch_ready():
+                for name, (fn, inputs) in list(waiting.items()):
+                    if all(dep in self.results for dep in inputs):
+                        kwargs = {dep: self.results[dep] for dep in inputs}
+                        running[pool.submit(self._timed, name, fn, kwargs)] = name
+                        del waiting[name]
+
+            launch_ready()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    exc = future.exception()
+                    if exc is not None:
+                        error = error or exc
+                    else:
+                        self.results[name] = future.result()
+                if error is None:
+                    launch_ready()
+
+        self.wall_time = time.perf_counter() - start
+        if error is not None:
+            raise error
+        return self.results
+
+    def report(self):
+        """One-line timing summary, slowest steps first"""
+        steps = sorted(self.timings.items(), key=lambda kv: kv[1], reverse=True)
+        serial = sum(self.timings.values())
+        parts = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in steps)
+        return f"{self.name}: wall {self.wall_time:.1f}s vs serial {serial:.1f}s ({parts})"
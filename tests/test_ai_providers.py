@@ -0,0 +1,131 @@
+"""
+Tests for the shared AI provider limits, fallback cascade and hedging
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ai_providers
+from ai_providers import ProviderLimiter, cascade, hedged_cascade
+from metrics import LatencyTracker
+
+
+class TestProviderLimiter:
+    """Test per-provider concurrency caps"""
+
+    def test_caps_in_flight_calls_per_provider(self):
+        """No more than the provider's limit run at once"""
+        limiter = ProviderLimiter({"ChatGPT": 2})
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def call(prompt):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return "ok"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: cascade([("ChatGPT", call)], "p", limiter), range(8)))
+
+        assert results == [("ok", "ChatGPT")] * 8
+        assert state["peak"] == 2
+
+
+class TestCascade:
+    """Test fallback order"""
+
+    def test_first_non_empty_response_wins(self):
+        calls = []
+
+        def provider(name, result):
+            def call(prompt):
+                calls.append(name)
+                return result
+            return name, call
+
+        chain = [provider("ChatGPT", None), provider("Claude", ""), provider("Grok", "hi"), provider("Gemini", "x")]
+        assert cascade(chain, "prompt", ProviderLimiter()) == ("hi", "Grok")
+        assert calls == ["ChatGPT", "Claude", "Grok"]
+
+    def test_all_failed(self):
+        assert cascade([("ChatGPT", lambda p: None)], "prompt") == (None, None)
+
+
+class TestHedgedCascade:
+    """Test hedging to the next provider after the primary's p95"""
+
+    def test_slow_primary_is_hedged(self, monkeypatch):
+        """Backup answers while the primary is still running past its p95"""
+        monkeypatch.setattr(ai_providers, "MIN_HEDGE_AFTER", 0.01)
+        latency = LatencyTracker(min_samples=1)
+        latency.record("ChatGPT", 0.02)
+        release = threading.Event()
+
+        def slow_primary(prompt):
+            release.wait(2)
+            return "late"
+
+        attempts = []
+        start = time.perf_counter()
+        result = hedged_cascade(
+            [("ChatGPT", slow_primary), ("Claude", lambda p: "fast")],
+            "prompt", ProviderLimiter(), latency, on_attempt=attempts.append,
+        )
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        assert result == ("fast", "Claude")
+        assert attempts == ["ChatGPT", "Claude"]
+        assert elapsed < 1
+
+    def test_time_queued_for_a_slot_is_not_hedged(self, monkeypatch):
+        """A primary waiting behind a full limiter is not hedged until its call starts"""
+        monkeypatch.setattr(ai_providers, "MIN_HEDGE_AFTER", 0.01)
+        latency = LatencyTracker(min_samples=1)
+        latency.record("ChatGPT", 0.05)
+        limiter = ProviderLimiter({"ChatGPT": 1})
+        busy = threading.Event()
+        release = threading.Event()
+
+        def hold_slot():
+            with limiter.slot("ChatGPT"):
+                busy.set()
+                release.wait(2)
+
+        holder = threading.Thread(target=hold_slot)
+        holder.start()
+        busy.wait(1)
+        threading.Timer(0.3, release.set).start()     # queued 6x longer than the p95
+
+        attempts = []
+        result = hedged_cascade(
+            [("ChatGPT", lambda p: "primary"), ("Claude", lambda p: "backup")],
+            "prompt", limiter, latency, on_attempt=attempts.append,
+        )
+        holder.join()
+
+        assert result == ("primary", "ChatGPT")
+        assert attempts == ["ChatGPT"]
+
+    def test_fast_primary_is_not_hedged(self):
+        """A primary answering within its p95 wins without starting backups"""
+        attempts = []
+        result = hedged_cascade(
+            [("ChatGPT", lambda p: "primary"), ("Claude", lambda p: "backup")],
+            "prompt", latency=LatencyTracker(), on_attempt=attempts.append,
+        )
+        assert result == ("primary", "ChatGPT")
+        assert attempts == ["ChatGPT"]
+
+    def test_failure_falls_through_in_order(self):
+        result = hedged_cascade(
+            [("ChatGPT", lambda p: None), ("Claude", lambda p: None), ("Grok", lambda p: "grok")],
+            "prompt",
+        )
+        assert result == ("grok", "Grok")
+        assert hedged_cascade([("ChatGPT", lambda p: None)], "prompt") == (None, None)
+
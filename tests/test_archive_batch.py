@@ -0,0 +1,237 @@
+"""
+Tests for batched ARCHIVE3 archiving and its crash recovery
+"""
+import json
+
+from archive_batch import ARCHIVE3_LINKEDIN_COL, Archive3Batch, group_row_ranges
+from job_journal import JobJournal
+
+LINK_COL = 4
+
+
+class WorksheetNotFound(Exception):
+    pass
+
+
+class FakeWorksheet:
+    def __init__(self, rows, sheet_id=0):
+        self.rows = rows
+        self.id = sheet_id
+        self.appended = []
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    def cell(self, row, col):
+        value = self.rows[row - 1][col - 1] if row <= len(self.rows) else ''
+        return type('Cell', (), {'value': value})()
+
+    def col_values(self, col):
+        return [row[col - 1] if col <= len(row) else '' for row in self.rows]
+
+    def append_row(self, row):
+        self.rows.append(list(row))
+
+    def append_rows(self, rows):
+        self.appended.append(rows)
+        self.rows.extend(list(row) for row in rows)
+
+
+class FakeSpreadsheet:
+    """NEWS IN and ARCHIVE3; batch_update applies deleteDimension requests"""
+
+    def __init__(self, news_in, archive=None, fail_delete=False):
+        self.sheets = {'NEWS IN': FakeWorksheet(news_in, sheet_id=1)}
+        if archive is not None:
+            self.sheets['ARCHIVE3'] = FakeWorksheet(archive, sheet_id=2)
+        self.fail_delete = fail_delete
+        self.updates = []
+
+    def worksheet(self, name):
+        if name not in self.sheets:
+            raise WorksheetNotFound(name)
+        return self.sheets[name]
+
+    def add_worksheet(self, name, rows, cols):
+        self.sheets[name] = FakeWorksheet([])
+        return self.sheets[name]
+
+    def batch_update(self, body):
+        if self.fail_delete:
+            raise RuntimeError("APIError: [503]: backend error")
+        self.updates.append(body)
+        news_in = self.sheets['NEWS IN'].rows
+        for request in body['requests']:
+            r = request['deleteDimension']['range']
+            del news_in[r['startIndex']:r['endIndex']]
+
+
+class FakeSheetManager:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+
+
+def news_in_row(n):
+    return ['AI', 'TRUE', '80', f"Title {n}", f"https://example.com/{n}", 'Pub', 'Author']
+
+
+def news_in(count):
+    """Header plus rows 2..count+1 whose links are example.com/1..count"""
+    return [['TOPIC', 'SELECT', 'SCORE', 'DATE', 'TITLE', 'LINK', 'PUBLISHER']] + \
+        [news_in_row(n) for n in range(1, count + 1)]
+
+
+def make_batch(spreadsheet, tmp_path, commit_every=10, journal=None):
+    return Archive3Batch(FakeSheetManager(spreadsheet), LINK_COL, commit_every=commit_every,
+                         pending_file=str(tmp_path / "pending.json"), journal=journal)
+
+
+class TestGroupRowRanges:
+    """Test grouping of rows for deletion"""
+
+    def test_contiguous_rows_collapse_highest_first(self):
+        assert group_row_ranges([9, 8, 7, 5, 3, 2]) == [(7, 9), (5, 5), (2, 3)]
+
+    def test_duplicates_and_order_are_ignored(self):
+        assert group_row_ranges([2, 4, 3, 4]) == [(2, 4)]
+
+
+class TestArchive3Batch:
+    """Test queueing, commit and the pending file"""
+
+    def test_commit_appends_deletes_and_removes_pending_file(self, tmp_path):
+        spreadsheet = FakeSpreadsheet(news_in(5), archive=[['x']])
+        batch = make_batch(spreadsheet, tmp_path)
+        for row_num in (6, 5, 3):                  # posted highest row first
+            batch.add(news_in_row(row_num - 1), row_num, 'bit.ly/a', f"lnkd.in/{row_num}", 'gamma')
+        assert (tmp_path / "pending.json").exists()
+
+        assert batch.commit()
+        assert len(spreadsheet.sheets['ARCHIVE3'].appended) == 1
+        assert [r['deleteDimension']['range']['startIndex'] for r in spreadsheet.updates[0]['requests']] == [4, 2]
+        assert [row[LINK_COL] for row in spreadsheet.sheets['NEWS IN'].rows[1:]] == \
+            ["https://example.com/1", "https://example.com/3"]
+        assert not (tmp_path / "pending.json").exists()
+
+    def test_state_advances_to_appended_when_delete_fails(self, tmp_path):
+        spreadsheet = FakeSpreadsheet(news_in(2), archive=[['x']], fail_delete=True)
+        batch = make_batch(spreadsheet, tmp_path)
+        batch.add(news_in_row(2), 3, 'bit.ly/a', 'lnkd.in/3', 'gamma')
+        assert json.loads((tmp_path / "pending.json").read_text())[0]['state'] == 'pending'
+
+        assert not batch.commit()
+        assert json.loads((tmp_path / "pending.json").read_text())[0]['state'] == 'appended'
+
+        # Retrying does not append the row a second time
+        spreadsheet.fail_delete = False
+        assert batch.commit()
+        assert len(spreadsheet.sheets['ARCHIVE3'].appended) == 1
+
+    def test_creates_archive_sheet_when_missing(self, tmp_path):
+        spreadsheet = FakeSpreadsheet(news_in(1))
+        batch = make_batch(spreadsheet, tmp_path, commit_every=1)
+        assert batch.add(news_in_row(1), 2, 'bit.ly/a', 'lnkd.in/2', 'gamma')
+        assert spreadsheet.sheets['ARCHIVE3'].rows[0][0] == 'x'
+        assert len(spreadsheet.sheets['ARCHIVE3'].rows) == 2
+
+
+class TestJournal:
+    """Test that archived articles leave the job journal"""
+
+    def test_archive_stage_is_recorded_then_forgotten_on_commit(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        key = "https://example.com/1"
+        journal.record(key, 'post', {'post_urn': 'urn:li:share:1'})
+        batch = make_batch(FakeSpreadsheet(news_in(1), archive=[['x']]), tmp_path, journal=journal)
+
+        batch.add(news_in_row(1), 2, 'bit.ly/a', 'lnkd.in/2', 'gamma', key=key)
+        assert journal.has(key, 'archive')
+
+        assert batch.commit()
+        assert journal.stages(key) == {}
+
+    def test_failed_commit_keeps_the_journal(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        key = "https://example.com/1"
+        batch = make_batch(FakeSpreadsheet(news_in(1), archive=[['x']], fail_delete=True), tmp_path,
+                           journal=journal)
+        batch.add(news_in_row(1), 2, 'bit.ly/a', 'lnkd.in/2', 'gamma', key=key)
+
+        assert not batch.commit()
+        assert journal.has(key, 'archive')
+
+    def test_recovered_entries_are_forgotten(self, tmp_path):
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        key = "https://example.com/1"
+        crashed = make_batch(FakeSpreadsheet(news_in(1), archive=[['x']]), tmp_path, journal=journal)
+        crashed.add(news_in_row(1), 2, 'bit.ly/a', 'lnkd.in/2', 'gamma', key=key)
+
+        assert make_batch(FakeSpreadsheet(news_in(1), archive=[['x']]), tmp_path, journal=journal).recover()
+        assert journal.stages(key) == {}
+
+
+class TestRecover:
+    """Test finishing a commit interrupted by a crash"""
+
+    def crashed_run(self, tmp_path, entries):
+        """Pending file as left by a run that crashed before committing"""
+        spreadsheet = FakeSpreadsheet(news_in(6), archive=[['x']])
+        batch = make_batch(spreadsheet, tmp_path)
+        for row_num in entries:
+            batch.add(news_in_row(row_num - 1), row_num, 'bit.ly/a', f"lnkd.in/{row_num}", 'gamma')
+        return json.loads((tmp_path / "pending.json").read_text())
+
+    def test_rows_are_found_by_link_after_shifting(self, tmp_path):
+        self.crashed_run(tmp_path, [7, 5])
+        # Two rows above them were removed by hand since the crash: rows moved up by 2
+        rows = news_in(6)
+        del rows[1:3]
+        spreadsheet = FakeSpreadsheet(rows, archive=[['x']])
+
+        assert make_batch(spreadsheet, tmp_path).recover()
+        assert [row[LINK_COL] for row in spreadsheet.sheets['NEWS IN'].rows[1:]] == \
+            ["https://example.com/3", "https://example.com/5"]
+        assert not (tmp_path / "pending.json").exists()
+
+    def test_rows_already_in_archive3_are_not_appended_again(self, tmp_path):
+        entries = self.crashed_run(tmp_path, [7, 5])
+        # The crash came after append_rows for row 7 but before its state was saved
+        spreadsheet = FakeSpreadsheet(news_in(6), archive=[['x'], entries[0]['archive_row']])
+
+        assert make_batch(spreadsheet, tmp_path).recover()
+        appended = spreadsheet.sheets['ARCHIVE3'].appended
+        assert [[row[ARCHIVE3_LINKEDIN_COL] for row in rows] for rows in appended] == [["lnkd.in/5"]]
+
+    def test_rows_already_deleted_are_skipped(self, tmp_path):
+        self.crashed_run(tmp_path, [7])
+        spreadsheet = FakeSpreadsheet(news_in(5), archive=[['x']])     # example.com/6 is gone
+
+        assert make_batch(spreadsheet, tmp_path).recover()
+        assert spreadsheet.updates == []
+        assert len(spreadsheet.sheets['NEWS IN'].rows) == 6
+
+    def test_single_article_archive_keeps_leftovers(self, tmp_path):
+        """A commit_every=1 batch on the shared file finishes leftovers instead of overwriting them"""
+        self.crashed_run(tmp_path, [7])
+        spreadsheet = FakeSpreadsheet(news_in(6), archive=[['x']])
+        batch = make_batch(spreadsheet, tmp_path, commit_every=1)
+        batch.recover(commit=False)
+        assert batch.add(news_in_row(2), 3, 'bit.ly/a', 'lnkd.in/3', 'gamma')
+
+        archived = [row[ARCHIVE3_LINKEDIN_COL] for row in spreadsheet.sheets['ARCHIVE3'].rows[1:]]
+        assert archived == ["lnkd.in/7", "lnkd.in/3"]
+        assert not (tmp_path / "pending.json").exists()
+
+    def test_leftover_above_the_current_row_does_not_shift_it(self, tmp_path):
+        """The single-article path deletes exactly the leftover's row and its own"""
+        self.crashed_run(tmp_path, [3])                     # example.com/2, above the current article
+        spreadsheet = FakeSpreadsheet(news_in(6), archive=[['x']])
+        batch = make_batch(spreadsheet, tmp_path, commit_every=1)
+        batch.recover(commit=False)
+        assert batch.add(news_in_row(4), 5, 'bit.ly/a', 'lnkd.in/5', 'gamma')    # row read before recover
+
+        remaining = [row[LINK_COL] for row in spreadsheet.sheets['NEWS IN'].rows[1:]]
+        assert remaining == ["https://example.com/1", "https://example.com/3",
+                             "https://example.com/5", "https://example.com/6"]
+        assert len(spreadsheet.updates) == 1
@@ -0,0 +1,116 @@
+"""
+Tests for the news-intel command line entry point
+"""
+import ast
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+import cli
+
+REPO_ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = (
+    'requests', 'dotenv', 'gspread', 'rich', 'PIL', 'tkinter',
+    'fetch_news', 'news_sheet_comment_responder', 'process_news_in', 'sheet_manager',
+)
+
+
+class TestHelp:
+    """Test that help stays light"""
+
+    def test_help_imports_no_subcommand_modules(self):
+        code = (
+            "import sys, cli\n"
+            "try:\n"
+            "    cli.main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+        )
+        out = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        assert out.strip().splitlines()[-1] == "[]"
+
+    def test_help_lists_every_command(self, capsys):
+        with pytest.raises(SystemExit):
+            cli.main(['--help'])
+        out = capsys.readouterr().out
+        assert all(name in out for name in cli.COMMANDS)
+
+    def test_no_command_prints_help(self, capsys):
+        assert cli.main([]) == 2
+        assert "<command>" in capsys.readouterr().out
+
+
+class TestDispatch:
+    """Test subcommand loading and argument pass-through"""
+
+    def test_every_target_names_a_module_function(self):
+        for target, help_text in cli.COMMANDS.values():
+            module_name, function_name = target.split(':')
+            assert module_name and function_name and help_text
+
+    def test_arguments_after_command_are_passed_through(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(cli, 'load', lambda target: lambda argv: seen.append((target, argv)) or 0)
+        assert cli.main(['demo', '--input', 'articles.json', '--help']) == 0
+        assert seen == [("demo:main", ['--input', 'articles.json', '--help'])]
+
+    def test_missing_dependency_is_reported(self, monkeypatch, capsys):
+        def load(target):
+            raise ImportError("No module named 'gspread'")
+        monkeypatch.setattr(cli, 'load', load)
+        assert cli.main(['post']) == 1
+        assert "missing dependency" in capsys.readouterr().err
+
+    def test_subcommand_help_names_the_subcommand(self, capsys):
+        for name in ('demo', 'watch', 'serve'):
+            with pytest.raises(SystemExit):
+                cli.main([name, '--help'])
+            assert capsys.readouterr().out.startswith(f"usage: news-intel {name}")
+
+    def test_unknown_command_exits(self):
+        with pytest.raises(SystemExit):
+            cli.main(['nope'])
+
+
+def local_imports(module_name):
+    """Repo modules imported anywhere in module_name (including lazy imports inside functions)"""
+    path = REPO_ROOT / (module_name.replace('.', '/') + '.py')
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", SyntaxWarning)       # ASCII-art banners in demo.py
+        warnings.simplefilter("ignore", DeprecationWarning)
+        tree = ast.parse(path.read_text())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return {name for name in names if (REPO_ROOT / (name.replace('.', '/') + '.py')).exists()}
+
+
+class TestPackaging:
+    """Test that an installed news-intel has every module its commands import"""
+
+    def test_command_modules_are_packaged(self):
+        tomllib = pytest.importorskip("tomllib")
+        config = tomllib.loads((REPO_ROOT / "pyproject.toml").read_text())
+        packaged = set(config['tool']['setuptools']['py-modules'])
+        packages = config['tool']['setuptools']['packages']['find']['include']
+
+        seen = set()
+        todo = ['cli'] + [target.split(':')[0] for target, _ in cli.COMMANDS.values()]
+        while todo:
+            name = todo.pop()
+            if name not in seen:
+                seen.add(name)
+                todo.extend(local_imports(name))
+
+        top_level = {name for name in seen if '.' not in name}
+        assert top_level - packaged == set()
+        assert all(any(name.startswith(p.rstrip('*')) for p in packages) for name in seen - top_level)
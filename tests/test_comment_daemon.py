@@ -0,0 +1,56 @@
+"""
+Tests for the comment responder watch mode
+"""
+import json
+
+from comment_daemon import CommentDaemon
+
+
+class FakeResponder:
+    """Returns a scripted sequence of process_new_comments_only summaries"""
+
+    def __init__(self, summaries):
+        self.summaries = list(summaries)
+        self.refreshes = 0
+
+    def process_new_comments_only(self, update_sheet=True):
+        summary = self.summaries.pop(0)
+        if isinstance(summary, Exception):
+            raise summary
+        return summary
+
+
+def summary(pending, processed=None, seconds=()):
+    return {'pending': pending, 'processed': pending if processed is None else processed,
+            'full_scan': False, 'reply_seconds': list(seconds)}
+
+
+class TestCommentDaemon:
+    """Test adaptive polling and counters"""
+
+    def test_interval_backs_off_when_quiet_and_tightens_on_activity(self):
+        daemon = CommentDaemon(FakeResponder([]), min_interval=10, max_interval=40, backoff=2)
+        assert [daemon.next_interval(0) for _ in range(4)] == [20, 40, 40, 40]
+        assert daemon.next_interval(3) == 10
+
+    def test_counters_track_queue_depth_and_latency(self, tmp_path):
+        responder = FakeResponder([summary(3, 2, [1.0, 2.0]), summary(0), RuntimeError("quota")])
+        status_file = str(tmp_path / "status.json")
+        daemon = CommentDaemon(responder, min_interval=0, max_interval=0, status_file=status_file)
+        daemon.run(max_polls=3)
+
+        stats = daemon.stats()
+        assert stats['polls'] == 3
+        assert stats['active_polls'] == 1
+        assert stats['replies'] == 2
+        assert stats['errors'] == 1
+        assert stats['reply_p95'] == 2.0
+        with open(status_file) as f:
+            assert json.load(f)['replies'] == 2
+
+    def test_queue_depth_reflects_latest_poll(self):
+        daemon = CommentDaemon(FakeResponder([summary(5, 1), summary(4, 4)]), min_interval=0, max_interval=0)
+        daemon.poll_once()
+        assert daemon.stats()['queue_depth'] == 4
+        daemon.poll_once()
+        assert daemon.stats()['queue_depth'] == 0
@@ -0,0 +1,72 @@
+"""
+Tests for the comment table model behind the GUI's virtualized table
+"""
+from comment_table import STATUS_PENDING, STATUS_REPLIED, CommentTableModel
+
+COLS = {'date': 0, 'commenter': 1, 'id': 2, 'industry': 3, 'response': 4, 'post_title': 5}
+
+ROWS = [
+    ["2025-09-03", "Cara Diaz", "111", "Finance", "", ""],
+    ["2025-09-01", "Ann Lee", "222", "Tech", "Thanks Ann, great point about agents!", "AI agents"],
+    ["2025-09-02", "Bob Stone", "333", "Technology", "", ""],
+]
+
+
+def make_model(rows=ROWS, **kwargs):
+    model = CommentTableModel()
+    model.set_rows(rows, COLS, **kwargs)
+    return model
+
+
+class TestCommentTableModel:
+    """Test loading, sorting, filtering and selection helpers"""
+
+    def test_rows_are_numbered_and_classified(self):
+        model = make_model()
+        assert [r[0] for r in model.window(0, 10)] == [2, 3, 4]
+        assert [r[5] for r in model.window(0, 10)] == [STATUS_PENDING, STATUS_REPLIED, STATUS_PENDING]
+
+    def test_missing_titles_come_from_resolver(self):
+        model = make_model(article_title=lambda row: f"Post {row[2]}")
+        assert [r[4] for r in model.window(0, 10)] == ["Post 111", "AI agents", "Post 333"]
+
+    def test_sort_toggles_direction(self):
+        model = make_model()
+        model.sort('commenter')
+        assert [r[2] for r in model.window(0, 10)] == ["Ann Lee", "Bob Stone", "Cara Diaz"]
+        model.sort('commenter')
+        assert [r[2] for r in model.window(0, 10)] == ["Cara Diaz", "Bob Stone", "Ann Lee"]
+
+    def test_incremental_filter_and_widening(self):
+        model = make_model()
+        assert model.filter("tech") == 2
+        assert model.filter("techn") == 1
+        assert model.window(0, 10)[0][2] == "Bob Stone"
+        # shortening the query searches all rows again
+        assert model.filter("te") == 2
+        assert model.filter("") == 3
+
+    def test_filter_survives_sort(self):
+        model = make_model()
+        model.filter("tech")
+        model.sort('row', descending=True)
+        assert [r[0] for r in model.window(0, 10)] == [4, 3]
+
+    def test_window_only_returns_requested_slice(self):
+        rows = [["", f"Person {n}", str(n), "", "", ""] for n in range(50000)]
+        model = make_model(rows)
+        window = model.window(25000, 30)
+        assert len(window) == 30
+        assert window[0][0] == 25002
+
+    def test_selection_maps_back_to_sheet_rows(self):
+        model = make_model()
+        model.sort('commenter')
+        assert model.rows_between(2, 0) == [3, 4, 2]
+        assert model.items_for([4, 2]) == [(0, ROWS[0]), (2, ROWS[2])]
+
+    def test_set_status_updates_record_and_search(self):
+        model = make_model()
+        model.set_status(2, STATUS_REPLIED, "Quantum chips")
+        assert model.window(0, 1)[0][4:] == ["Quantum chips", STATUS_REPLIED]
+        assert model.filter("quantum") == 1
@@ -0,0 +1,38 @@
+"""
+Tests for the new-comment high-water mark
+"""
+from comment_watermark import CommentWatermark
+
+ROW = ["2025-09-01", "Ann Lee", "7402396743583338497", "", "comment", "Great read"]
+
+
+class TestCommentWatermark:
+    """Test persistence, fingerprint matching and reconcile scheduling"""
+
+    def test_fresh_mark_needs_full_scan(self, tmp_path):
+        mark = CommentWatermark(str(tmp_path / "mark.json"))
+        assert mark.last_row is None
+        assert mark.needs_reconcile()
+
+    def test_advance_persists_and_matches(self, tmp_path):
+        path = str(tmp_path / "mark.json")
+        CommentWatermark(path).advance(42, ROW, reconciled=True, now=1000.0)
+
+        mark = CommentWatermark(path, reconcile_every=3600)
+        assert mark.last_row == 42
+        assert mark.matches(ROW)
+        assert not mark.matches(["2025-09-02", "Bob", "1"])
+        assert not mark.needs_reconcile(now=1000.0 + 60)
+        assert mark.needs_reconcile(now=1000.0 + 3600)
+
+    def test_written_columns_do_not_change_fingerprint(self, tmp_path):
+        """Filling in the response columns of the mark row keeps it matching"""
+        mark = CommentWatermark(str(tmp_path / "mark.json"), fingerprint_cols=6)
+        mark.advance(10, ROW)
+        assert mark.matches(ROW + ["AI reply", "Post title", "Post body"])
+        assert mark.matches(ROW + [""])
+
+    def test_unreadable_file_resets(self, tmp_path):
+        path = tmp_path / "mark.json"
+        path.write_text("{not json")
+        assert CommentWatermark(str(path)).last_row is None
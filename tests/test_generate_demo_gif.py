@@ -0,0 +1,39 @@
+"""
+Tests for the demo GIF generator
+"""
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from generate_demo_gif import create_frame, generate_demo_gif, hold_durations, shared_palette  # noqa: E402
+
+
+class TestFrames:
+    """Test frame merging and palette sharing"""
+
+    def test_identical_frames_are_held(self):
+        a = create_frame((120, 90), 0, 3)
+        b = create_frame((120, 90), 1, 3)
+        frames, durations = hold_durations([a, a.copy(), b, b], [100, 100, 100, 300])
+        assert frames == [a, b]
+        assert durations == [200, 400]
+
+    def test_frames_share_one_palette(self):
+        frames = shared_palette([create_frame((120, 90), step, 3) for step in range(3)], colors=32)
+        assert all(frame.mode == 'P' for frame in frames)
+        assert len({bytes(frame.getpalette()) for frame in frames}) == 1
+
+
+class TestGenerate:
+    """Test the written GIF"""
+
+    def test_one_frame_per_step_with_hold_durations(self, tmp_path):
+        path = generate_demo_gif(size=(240, 180), total_steps=4, frames_per_step=3, hold_frames=5,
+                                 frame_ms=100, workers=1, output_path=tmp_path / "demo.gif")
+        with Image.open(path) as gif:
+            assert gif.size == (240, 180)
+            durations = []
+            for i in range(gif.n_frames):
+                gif.seek(i)
+                durations.append(gif.info['duration'])
+        assert durations == [300, 300, 300, 800]
@@ -0,0 +1,51 @@
+"""
+Tests for the GUI's local state snapshot
+"""
+import json
+
+from gui_snapshot import GUISnapshot, count_pending
+
+
+class TestGUISnapshot:
+    """Test persistence, key redaction and age formatting"""
+
+    def test_missing_file_starts_cold(self, tmp_path):
+        snapshot = GUISnapshot(str(tmp_path / "snapshot.json"))
+        assert not snapshot.load()
+        assert snapshot.total_rows is None
+        assert snapshot.age_text() is None
+
+    def test_save_and_restore(self, tmp_path):
+        path = str(tmp_path / "snapshot.json")
+        snapshot = GUISnapshot(path)
+        snapshot.update(total_rows=120, new_rows=7, providers={'chatgpt': 'sk-1', 'grok': ''})
+        snapshot.save(now=1000.0)
+
+        restored = GUISnapshot(path)
+        assert restored.load()
+        assert (restored.total_rows, restored.new_rows) == (120, 7)
+        assert restored.providers == {'chatgpt': True, 'grok': False}
+        assert restored.age_text(now=1000.0 + 300) == "5 min ago"
+
+    def test_api_keys_are_not_written(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        snapshot = GUISnapshot(str(path))
+        snapshot.update(providers={'claude': 'sk-ant-secret'})
+        snapshot.save()
+        assert 'sk-ant-secret' not in path.read_text()
+
+    def test_unreadable_or_old_version_is_ignored(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text("{not json")
+        assert not GUISnapshot(str(path)).load()
+        path.write_text(json.dumps({'version': 0, 'total_rows': 5}))
+        assert not GUISnapshot(str(path)).load()
+
+
+class TestCountPending:
+    """Test counting unanswered rows from the response column"""
+
+    def test_short_and_missing_replies_are_pending(self):
+        cells = ["x" * 40, "", "too short", "y" * 25]
+        # two trailing rows have no response cell at all
+        assert count_pending(cells, total_rows=6) == 4
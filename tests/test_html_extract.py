@@ -0,0 +1,55 @@
+"""
+Tests for the shared HTML-to-text extraction engine
+"""
+import re
+
+from html_extract import extract_many, html_to_text
+
+
+def regex_clean_html(html_text):
+    """Previous clean_html behaviour, used as a reference"""
+    clean = re.sub(r'<[^>]+>', '', html_text)
+    return ' '.join(clean.split())[:2000]
+
+
+class TestHtmlToText:
+    """Test single document extraction"""
+
+    def test_empty_input(self):
+        """None and empty strings return empty text"""
+        assert html_to_text(None) == ""
+        assert html_to_text("") == ""
+
+    def test_matches_regex_on_plain_markup(self):
+        """Simple inline markup gives the same text as the old regex"""
+        html = "<p>AI <b>breakthrough</b>  announced\n today</p>"
+        assert html_to_text(html) == regex_clean_html(html)
+
+    def test_decodes_entities(self):
+        """Entities are decoded"""
+        assert html_to_text("<p>R&amp;D &#8217;24 &lt;3</p>") == "R&D ’24 <3"
+
+    def test_drops_script_and_style(self):
+        """Script and style contents never reach the text"""
+        html = "<style>p{color:red}</style><script>var a = '<b>x</b>';</script><p>Visible</p>"
+        assert html_to_text(html) == "Visible"
+
+    def test_block_tags_separate_words(self):
+        """Block-level tags act as word separators"""
+        assert html_to_text("one<br>two<p>three</p>") == "one two three"
+
+    def test_limit_truncates(self):
+        """Only the first N characters are returned"""
+        html = "<p>" + "word " * 10000 + "</p>"
+        text = html_to_text(html, 50)
+        assert len(text) == 50
+        assert text == regex_clean_html(html)[:50]
+
+
+class TestExtractMany:
+    """Test bulk extraction"""
+
+    def test_preserves_order(self):
+        """Results come back in input order"""
+        docs = [f"<p>doc {i}</p>" for i in range(20)]
+        assert extract_many(docs, max_workers=2) == [f"doc {i}" for i in range(20)]
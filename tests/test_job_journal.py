@@ -0,0 +1,55 @@
+"""
+Tests for the durable per-article job journal
+"""
+from job_journal import JobJournal
+
+
+class TestJobJournal:
+    """Test stage recording and resume"""
+
+    def test_record_and_get(self, tmp_path):
+        """Recorded outputs round-trip through JSON"""
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        journal.record("https://example.com/a", "carousel", {"gamma_url": "g", "export_url": "p"})
+        assert journal.get("https://example.com/a", "carousel") == {"gamma_url": "g", "export_url": "p"}
+        assert journal.get("https://example.com/a", "post") is None
+        assert journal.has("https://example.com/a", "carousel")
+
+    def test_survives_reopen(self, tmp_path):
+        """Completed stages are still there after a restart"""
+        path = str(tmp_path / "journal.sqlite3")
+        journal = JobJournal(path)
+        journal.record("key", "teaser", "Two sentences.")
+        journal.close()
+
+        reopened = JobJournal(path)
+        assert reopened.stages("key") == {"teaser": "Two sentences."}
+
+    def test_step_skips_completed_work(self, tmp_path):
+        """A journaled step runs once, then replays its output"""
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        calls = []
+
+        def expensive(summary):
+            calls.append(summary)
+            return ["ai", "radar", "news"]
+
+        step = journal.step("key", "keywords", expensive)
+        assert step(summary="s") == ["ai", "radar", "news"]
+        assert step(summary="s") == ["ai", "radar", "news"]
+        assert calls == ["s"]
+
+    def test_step_does_not_record_failures(self, tmp_path):
+        """None results are retried on the next run"""
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        step = journal.step("key", "carousel", lambda: None)
+        assert step() is None
+        assert not journal.has("key", "carousel")
+
+    def test_step_revalidates_output(self, tmp_path):
+        """is_valid can force a redo, e.g. when a PDF file was deleted"""
+        journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+        journal.record("key", "pdf_with_logo", str(tmp_path / "missing.pdf"))
+        step = journal.step("key", "pdf_with_logo", lambda: "fresh.pdf", is_valid=lambda p: False)
+        assert step() == "fresh.pdf"
+        assert journal.get("key", "pdf_with_logo") == "fresh.pdf"
@@ -0,0 +1,56 @@
+"""
+Tests for the GUI logo thumbnail cache
+"""
+import os
+import sys
+
+import pytest
+
+from logo_cache import LogoCache
+
+
+def touch(path, mtime):
+    with open(path, 'wb') as f:
+        f.write(b"x")
+    os.utime(path, (mtime, mtime))
+
+
+class TestLogoCache:
+    """Test thumbnail naming, mtime invalidation and lazy PIL use"""
+
+    def test_missing_source_gives_no_logo(self, tmp_path):
+        cache = LogoCache({'claude': str(tmp_path / "missing.png")}, str(tmp_path / "cache"))
+        assert cache.path('claude') is None
+        assert cache.path('unknown') is None
+
+    def test_fresh_thumbnail_is_used_without_pil(self, tmp_path, monkeypatch):
+        source = tmp_path / "claude.png"
+        touch(source, 1000)
+        cache = LogoCache({'claude': str(source)}, str(tmp_path), sizes={'claude': (70, 70)})
+        assert cache.thumb_path('claude').endswith("claude_70x70.png")
+        touch(cache.thumb_path('claude'), 2000)
+
+        monkeypatch.setitem(sys.modules, 'PIL', None)     # any PIL import would fail
+        assert cache.path('claude') == cache.thumb_path('claude')
+        assert cache.generated == 0
+
+    def test_newer_source_invalidates_thumbnail(self, tmp_path):
+        source = tmp_path / "grok.png"
+        touch(source, 3000)
+        cache = LogoCache({'grok': str(source)}, str(tmp_path))
+        touch(cache.thumb_path('grok'), 2000)
+        assert not cache.is_fresh('grok')
+
+    def test_generates_resized_png(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        source = tmp_path / "gemini.jpeg"
+        Image.new('RGB', (400, 300), (10, 20, 30)).save(source)
+
+        cache = LogoCache({'gemini': str(source)}, str(tmp_path / "cache"))
+        path = cache.path('gemini')
+        assert path == cache.thumb_path('gemini') and cache.generated == 1
+        with Image.open(path) as thumb:
+            assert thumb.size == (50, 50) and thumb.format == 'PNG'
+
+        assert cache.path('gemini') == path
+        assert cache.generated == 1
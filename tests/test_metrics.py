@@ -0,0 +1,48 @@
+"""
+Tests for rolling per-provider latency metrics
+"""
+from metrics import LatencyTracker, ReplyStats
+
+
+class TestLatencyTracker:
+    """Test rolling percentiles"""
+
+    def test_percentiles_need_min_samples(self):
+        tracker = LatencyTracker(window=10, min_samples=3)
+        tracker.record("ChatGPT", 1.0)
+        assert tracker.p95("ChatGPT") is None
+
+        for seconds in (2.0, 3.0, 4.0):
+            tracker.record("ChatGPT", seconds)
+        tracker.record("ChatGPT", 99.0, ok=False)
+        assert tracker.percentile("ChatGPT", 50) == 2.0
+        assert tracker.p95("ChatGPT") == 4.0
+        assert tracker.snapshot()["ChatGPT"]["failures"] == 1
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=3, min_samples=1)
+        for seconds in (10.0, 1.0, 1.0, 1.0):
+            tracker.record("Claude", seconds)
+        assert tracker.p95("Claude") == 1.0
+
+
+class TestReplyStats:
+    """Test fallback rate, replies per minute and error counts"""
+
+    def test_fallback_rate_counts_non_primary_sources(self):
+        stats = ReplyStats(primary="ChatGPT")
+        for source in ("ChatGPT", "ChatGPT", "Claude (batch)", "Template"):
+            stats.record(source, now=100.0)
+        snap = stats.snapshot(now=100.0)
+        assert snap['replies'] == 4
+        assert snap['by_source'] == {'ChatGPT': 2, 'Claude': 1, 'Template': 1}
+        assert snap['fallback_rate'] == 0.5
+
+    def test_per_minute_uses_trailing_window(self):
+        stats = ReplyStats(rate_window=60)
+        for t in (0.0, 30.0, 50.0):
+            stats.record("ChatGPT", now=t)
+        assert stats.snapshot(now=55.0)['per_minute'] == 3
+        assert stats.snapshot(now=95.0)['per_minute'] == 1
+        stats.record_error(2)
+        assert stats.snapshot(now=95.0)['errors'] == 2
@@ -0,0 +1,92 @@
+"""
+Tests for the activity-ID index behind find_article_by_id
+"""
+import random
+
+from post_index import ActivityIndex
+
+
+def linear_lookup(posts_cache, activity_id):
+    """Original find_article_by_id matching, used as the reference"""
+    if activity_id in posts_cache:
+        return posts_cache[activity_id]
+    for key, data in posts_cache.items():
+        if activity_id in key or key in activity_id:
+            return data
+    return None
+
+
+def build_cache(count, seed=7):
+    """posts_cache shaped like refresh_rss_feed builds it (URL, activity ID, guid)"""
+    rng = random.Random(seed)
+    cache = {}
+    for i in range(count):
+        activity_id = str(rng.randrange(10**18, 10**19))
+        url = f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_id}"
+        post = {"title": f"Post {i}", "link": url}
+        cache[url] = post
+        cache[activity_id] = post
+        cache[f"guid-{i}"] = post
+    return cache
+
+
+class TestActivityIndex:
+    """Index lookups must match the original linear scan"""
+
+    def test_exact_activity_id(self):
+        """Comment IDs resolve through the exact hash"""
+        cache = build_cache(50)
+        activity_id = [k for k in cache if k.isdigit()][10]
+        assert ActivityIndex(cache).lookup(cache, activity_id) is cache[activity_id]
+
+    def test_matches_linear_scan(self):
+        """Prefixes, suffixes, longer IDs and misses agree with the linear scan"""
+        cache = build_cache(200)
+        index = ActivityIndex(cache)
+        ids = [k for k in cache if k.isdigit()]
+        rng = random.Random(1)
+
+        queries = []
+        for activity_id in rng.sample(ids, 40):
+            queries.append(activity_id[:12])          # truncated ID
+            queries.append(activity_id[5:])           # suffix of an ID
+            queries.append(activity_id + "99")        # key inside the query
+            queries.append("7" + activity_id[3:9])    # arbitrary fragment
+        queries += ["0", "12", "999999999999999999999", "guid-3x", "activity", ""]
+
+        for query in queries:
+            assert index.lookup(cache, query) is linear_lookup(cache, query), query
+
+    def test_rebuilds_when_cache_grows(self):
+        """New feed items are found even if build() was not called again"""
+        cache = build_cache(5)
+        index = ActivityIndex(cache)
+        cache["1234567890123456789"] = {"title": "late"}
+        assert index.lookup(cache, "12345678901234") == {"title": "late"}
+
+    def test_short_numeric_keys_inside_the_query(self):
+        """Digit keys of several lengths (numeric guids) are found inside longer queries"""
+        cache = build_cache(20)
+        cache["4242"] = {"title": "short guid"}
+        cache["90"] = {"title": "tiny guid"}
+        index = ActivityIndex(cache)
+        for query in ("1114242", "9090", "4249", "0000000000000000000000424200"):
+            assert index.lookup(cache, query) is linear_lookup(cache, query), query
+
+    def test_key_in_query_checks_only_stored_lengths(self):
+        """A long query looks up one window per position for 19-digit keys, not every substring"""
+        class CountingDict(dict):
+            calls = 0
+
+            def get(self, key, default=None):
+                CountingDict.calls += 1
+                return super().get(key, default)
+
+        cache = build_cache(100)
+        index = ActivityIndex(cache)
+        assert list(index.digit_keys) == [19]
+        index.digit_keys[19] = CountingDict(index.digit_keys[19])
+
+        query = "5" * 64
+        assert index.lookup(cache, query) is linear_lookup(cache, query)
+        assert CountingDict.calls == 64 - 19 + 1
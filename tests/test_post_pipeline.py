@@ -0,0 +1,160 @@
+"""
+Tests for the LinkedIn posting scheduler and the prepare-ahead pipeline
+"""
+import threading
+import time
+
+from post_pipeline import LinkedInPostScheduler, prepare_ahead
+
+
+class FakeLinkedIn:
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.posts = []
+
+    def create_carousel_post(self, pdf_path, title, caption):
+        self.posts.append(title)
+        return self.results.pop(0) if self.results else f"urn:li:share:{len(self.posts)}"
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestSchedulerDelay:
+    """Test _delay(now): minimum gap, hourly cap and backoff"""
+
+    def test_first_post_is_immediate(self):
+        assert LinkedInPostScheduler()._delay(1000) == 0
+
+    def test_minimum_gap_since_last_post(self):
+        scheduler = LinkedInPostScheduler(min_interval=5)
+        scheduler.post_times.extend([1000])
+        assert scheduler._delay(1002) == 3
+        assert scheduler._delay(1005) == 0
+        assert scheduler._delay(1100) == 0
+
+    def test_rolling_hourly_cap(self):
+        """A full hour waits for the oldest post to age out, which then drops from the window"""
+        scheduler = LinkedInPostScheduler(min_interval=5, max_per_hour=3)
+        scheduler.post_times.extend([1000, 1500, 2000])
+        assert scheduler._delay(2100) == 1000 + 3600 - 2100
+
+        assert scheduler._delay(4600) == 0
+        assert list(scheduler.post_times) == [1500, 2000]
+
+    def test_backoff_adds_to_the_gap(self):
+        scheduler = LinkedInPostScheduler(min_interval=5)
+        scheduler.post_times.extend([1000])
+        scheduler.backoff = 20
+        assert scheduler._delay(1000) == 25
+
+
+class TestSchedulerPost:
+    """Test post(): waiting, backoff doubling and reset"""
+
+    def make(self, linkedin_results=(), **limits):
+        clock = FakeClock()
+        scheduler = LinkedInPostScheduler(clock=clock, sleep=clock.sleep, **limits)
+        return scheduler, clock, FakeLinkedIn(linkedin_results)
+
+    def test_waits_for_the_gap_between_posts(self):
+        scheduler, clock, linkedin = self.make(min_interval=5)
+        scheduler.post(linkedin, "a.pdf", "A", "caption")
+        clock.now += 2
+        scheduler.post(linkedin, "b.pdf", "B", "caption")
+        assert clock.slept == [3]
+        assert linkedin.posts == ["A", "B"]
+
+    def test_backoff_doubles_up_to_the_cap_and_resets(self):
+        scheduler, clock, linkedin = self.make([None, None, None, None, "urn:ok"],
+                                               min_interval=5, max_backoff=15)
+        backoffs = []
+        for title in "ABCDE":
+            scheduler.post(linkedin, "x.pdf", title, "caption")
+            backoffs.append(scheduler.backoff)
+        assert backoffs == [5, 10, 15, 15, 0]
+        # each retry waited the gap plus the backoff accumulated so far
+        assert clock.slept == [10, 15, 20, 20]
+
+    def test_failed_call_still_counts_toward_the_gap(self):
+        class Broken:
+            def create_carousel_post(self, *args):
+                raise RuntimeError("HTTP 500")
+
+        scheduler, clock, _ = self.make(min_interval=5)
+        try:
+            scheduler.post(Broken(), "x.pdf", "A", "caption")
+        except RuntimeError:
+            pass
+        assert list(scheduler.post_times) == [clock.now]
+
+
+class TestPrepareAhead:
+    """Test that preparation runs ahead while results come back in order"""
+
+    def test_results_in_item_order_despite_finish_order(self):
+        def prepare(name, seconds):
+            time.sleep(seconds)
+            return name.upper()
+
+        items = [("a", 0.05), ("b", 0.0), ("c", 0.02)]
+        results = [(item[0], result) for item, result, error in prepare_ahead(items, prepare, 3)]
+        assert results == [("a", "A"), ("b", "B"), ("c", "C")]
+
+    def test_later_items_prepare_while_earlier_ones_post(self):
+        prepared = []
+        lock = threading.Lock()
+
+        def prepare(n):
+            with lock:
+                prepared.append(n)
+            return n
+
+        seen_while_posting_first = None
+        for (n,), result, error in prepare_ahead([(1,), (2,), (3,)], prepare, 2):
+            if n == 1:
+                time.sleep(0.05)         # "posting" the first article
+                with lock:
+                    seen_while_posting_first = sorted(prepared)
+        assert seen_while_posting_first == [1, 2, 3]
+
+    def test_preparation_errors_are_returned_in_place(self):
+        def prepare(n):
+            if n == 2:
+                raise ValueError("Gamma export failed")
+            return n
+
+        results = list(prepare_ahead([(1,), (2,), (3,)], prepare, 2))
+        assert [result for _, result, _ in results] == [1, None, 3]
+        assert isinstance(results[1][2], ValueError)
+
+    def test_stopping_early_cancels_queued_preparations(self):
+        started = []
+        release = threading.Event()
+
+        def prepare(n):
+            started.append(n)
+            if n:
+                release.wait(1)
+            return n
+
+        pipeline = prepare_ahead([(n,) for n in range(10)], prepare, 2)
+        next(pipeline)
+        start = time.perf_counter()
+        pipeline.close()                 # e.g. posting raised
+        elapsed = time.perf_counter() - start
+        release.set()
+        time.sleep(0.05)
+
+        assert elapsed < 0.5
+        assert len(started) <= 3         # at most two in flight when closed, never the queued rest
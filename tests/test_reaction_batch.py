@@ -0,0 +1,59 @@
+"""
+Tests for batched reaction replies
+"""
+import json
+
+from reaction_batch import build_batch_prompt, group_reactions, parse_batch_reply
+
+POST_A = {"link": "https://www.linkedin.com/feed/update/urn:li:activity:111", "title": "Post A", "description": "A"}
+POST_B = {"link": "https://www.linkedin.com/feed/update/urn:li:activity:222", "title": "Post B", "description": "B"}
+
+
+def reactor(name, **profile):
+    return dict(profile, name=name, reaction="liked")
+
+
+class TestGroupReactions:
+    """Test grouping by article and chunking"""
+
+    def test_groups_by_article_and_skips_singletons(self):
+        items = [
+            ("row2", POST_A, reactor("Ann")),
+            ("row3", POST_B, reactor("Bob")),
+            ("row4", POST_A, reactor("Cy")),
+        ]
+        batches = group_reactions(items)
+        assert len(batches) == 1
+        article, members = batches[0]
+        assert article is POST_A
+        assert [key for key, _ in members] == ["row2", "row4"]
+
+    def test_large_groups_are_chunked(self):
+        items = [(f"row{n}", POST_A, reactor(f"P{n}")) for n in range(45)]
+        sizes = [len(members) for _, members in group_reactions(items, batch_size=20)]
+        assert sizes == [20, 20, 5]
+
+
+class TestBatchPrompt:
+    def test_prompt_lists_every_reactor_with_profile(self):
+        members = [("row2", reactor("Ann", industry="Fintech", company="Acme")), ("row3", reactor("Bob"))]
+        prompt = build_batch_prompt(POST_A, members)
+        assert 'id "row2": Ann, industry: Fintech, company: Acme' in prompt
+        assert 'id "row3": Bob' in prompt
+        assert "Post A" in prompt
+
+
+class TestParseBatchReply:
+    """Test mapping replies back to rows"""
+
+    def test_parses_json_wrapped_in_prose(self):
+        text = 'Sure! ```json\n' + json.dumps({"row2": "Thanks Ann!", "row3": "Thanks Bob!"}) + "\n```"
+        assert parse_batch_reply(text, ["row2", "row3"]) == {"row2": "Thanks Ann!", "row3": "Thanks Bob!"}
+
+    def test_missing_empty_and_duplicate_replies_fall_back(self):
+        text = json.dumps({"row2": "Thanks!", "row3": "Thanks!", "row4": "  ", "row9": "stray"})
+        assert parse_batch_reply(text, ["row2", "row3", "row4", "row5"]) == {"row2": "Thanks!"}
+
+    def test_unparseable_reply(self):
+        assert parse_batch_reply("no json here", ["row2"]) == {}
+        assert parse_batch_reply(None, ["row2"]) == {}
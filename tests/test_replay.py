@@ -0,0 +1,49 @@
+"""
+Tests for the headless scoring replay
+"""
+from pathlib import Path
+
+import pytest
+
+from replay import SimulatedProvider, load_articles, simulated_callers
+
+SAMPLE_ARTICLES = Path(__file__).parent.parent / "examples" / "sample_articles.json"
+
+
+class TestSimulatedProvider:
+    """Test deterministic simulated scoring"""
+
+    def test_scores_are_stable_per_prompt(self):
+        slept = []
+        provider = SimulatedProvider("Claude", latency=0.5, jitter=0.2, sleep=slept.append)
+        first = provider("Title: A")
+        assert first == provider("Title: A")
+        assert 55 <= first['score'] <= 95
+        assert provider.calls == 2
+        assert all(0.4 <= s <= 0.6 for s in slept)
+
+    def test_failure_rate(self):
+        provider = SimulatedProvider("Grok", latency=0, fail_rate=1.0)
+        assert provider("prompt") is None
+        assert provider.failures == 1
+
+
+class TestReplay:
+    """Test the real pipeline over the sample articles"""
+
+    def test_load_articles_maps_summary_to_description(self):
+        articles = load_articles(SAMPLE_ARTICLES)
+        assert all(a['description'] == a['summary'] for a in articles)
+
+    def test_replay_runs_real_pipeline(self):
+        pytest.importorskip("requests")
+        pytest.importorskip("dotenv")
+        from replay import replay
+
+        articles = load_articles(SAMPLE_ARTICLES)
+        report = replay(articles, simulated_callers(latency=0))
+
+        assert len(report['results']) == len(articles)
+        assert set(report['calls'].values()) == {len(articles)}
+        assert set(report['stages']) == {'score', 'pair', 'consensus'}
+        assert all(55 <= r['consensus'] <= 95 for r in report['results'])
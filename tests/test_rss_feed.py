@@ -0,0 +1,87 @@
+"""
+Tests for the persistent, conditionally refreshed RSS feed cache
+"""
+import pytest
+
+pytest.importorskip("requests")
+
+import rss_feed  # noqa: E402
+from rss_feed import RSSFeedCache  # noqa: E402
+
+
+def make_feed(activity_ids):
+    """Minimal rss.app style feed"""
+    items = "".join(
+        f"<item><title>Post {a}</title>"
+        f"<description>&lt;p&gt;Body {a}&lt;/p&gt;</description>"
+        f"<link>https://www.linkedin.com/feed/update/urn:li:activity:{a}</link>"
+        f"<guid>guid-{a}</guid></item>"
+        for a in activity_ids
+    )
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class TestRSSFeedCache:
+    """Test parsing, persistence and conditional refresh"""
+
+    def test_parse_indexes_all_key_forms(self, monkeypatch, tmp_path):
+        """Posts resolve by activity ID, URL and guid"""
+        monkeypatch.setattr(rss_feed.requests, "get",
+                            lambda *a, **k: FakeResponse(200, make_feed(["7402396743583338497"])))
+        feed = RSSFeedCache("https://feed", str(tmp_path / "cache.json"))
+        assert feed.refresh() == 1
+        post = feed.lookup("7402396743583338497")
+        assert post["title"] == "Post 7402396743583338497"
+        assert post["description"] == "Body 7402396743583338497"
+        assert feed.posts_cache["guid-7402396743583338497"] is post
+
+    def test_conditional_get_and_persistence(self, monkeypatch, tmp_path):
+        """ETag is stored, sent back, and a 304 keeps the cached posts"""
+        cache_file = str(tmp_path / "cache.json")
+        sent_headers = []
+
+        def fake_get(url, headers=None, timeout=None):
+            sent_headers.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(200, make_feed(["111", "222"]), {"ETag": '"v1"'})
+
+        monkeypatch.setattr(rss_feed.requests, "get", fake_get)
+        RSSFeedCache("https://feed", cache_file).refresh()
+
+        restarted = RSSFeedCache("https://feed", cache_file)
+        assert restarted.load() == 2
+        assert restarted.refresh() == 0
+        assert sent_headers[-1]["If-None-Match"] == '"v1"'
+        assert restarted.lookup("222")["title"] == "Post 222"
+
+    def test_dropped_posts_stay_resolvable(self, monkeypatch, tmp_path):
+        """Only new items are merged; old ones are kept"""
+        feeds = iter([make_feed(["111"]), make_feed(["222"])])
+        monkeypatch.setattr(rss_feed.requests, "get", lambda *a, **k: FakeResponse(200, next(feeds)))
+        feed = RSSFeedCache("https://feed", str(tmp_path / "cache.json"))
+        feed.refresh()
+        assert feed.refresh() == 1
+        assert feed.lookup("111") is not None
+        assert feed.post_count() == 2
+
+    def test_one_canonical_record_per_post(self):
+        """Alternate keys point at the same record; post_count needs no key scan"""
+        feed = RSSFeedCache("https://feed")
+        feed._merge(RSSFeedCache.parse(make_feed(["111", "222", "111"])))
+        store = feed.posts_cache
+        assert feed.post_count() == 2
+        assert len(store.records) == 2
+        assert store["111"] is store["guid-111"] is store[store["111"].link]
+        assert store["222"].to_dict()["guid"] == "guid-222"
@@ -182,3 +182,35 @@ class TestMetadata:
         metadata = report["metadata"]
         assert "processing_time_seconds" in metadata, "Metadata should have processing_time_seconds"
         assert "timestamp" in metadata, "Metadata should have timestamp"
+
+
+class TestPipelineFunctions:
+    """Test the fetch_news helpers the benchmark suite times"""
+
+    @pytest.fixture
+    def fetch_news(self):
+        pytest.importorskip("requests")
+        pytest.importorskip("dotenv")
+        import fetch_news
+        return fetch_news
+
+    def test_extract_json_from_provider_text(self, fetch_news):
+        text = 'Sure! ```json\n{"score": 82, "rationale": "Named sources."}\n``` Hope this helps.'
+        assert fetch_news.extract_json(text) == {"score": 82, "rationale": "Named sources."}
+        assert fetch_news.extract_json("no json here") is None
+
+    def test_dedupe_articles_is_case_insensitive(self, fetch_news):
+        articles = [{'title': 'AI Act Passes'}, {'title': 'ai act passes'}, {'title': ''}, {'title': 'Other'}]
+        assert [a['title'] for a in fetch_news.dedupe_articles(articles)] == ['AI Act Passes', 'Other']
+
+    def test_peer_pairs_always_include_perplexity(self, fetch_news):
+        scores = {name: {'score': 80} for name in ["ChatGPT", "Claude", "Gemini", "Grok", "Perplexity"]}
+        pairs = fetch_news.create_peer_pairs(scores)
+        assert pairs[0][0] == 'Perplexity'
+        assert sorted(name for pair in pairs for name in pair) == sorted(list(scores) + ['Perplexity'])
+
+    def test_consensus_trims_outliers(self, fetch_news):
+        scores = {'ChatGPT': {'score': 80}, 'Claude': {'score': 70}, 'Gemini': {'score': 90},
+                  'Grok': {'score': 20}}
+        consensus, count, contributing, confidence, std_dev = fetch_news.calculate_consensus(scores)
+        assert (consensus, count) == (75, 4)
@@ -0,0 +1,73 @@
+"""
+Tests for the batched Google Sheets write buffer
+"""
+import pytest
+
+import sheet_writer
+from sheet_writer import SheetWriteBuffer
+
+
+class FakeSheet:
+    def __init__(self, failures=()):
+        self.calls = []
+        self.failures = list(failures)
+
+    def batch_update(self, data):
+        if self.failures:
+            raise self.failures.pop(0)
+        self.calls.append(data)
+
+
+class QuotaError(Exception):
+    def __init__(self):
+        super().__init__("APIError: [429]: Quota exceeded for quota metric 'Write requests'")
+
+
+ARTICLE = {"title": "AI news", "description": "Body text"}
+
+
+class TestSheetWriteBuffer:
+    """Test batching, flush triggers and quota retries"""
+
+    def test_rows_are_written_in_one_batch_on_close(self):
+        """O-only and O:Q rows go out together, in row order"""
+        sheet = FakeSheet()
+        writer = SheetWriteBuffer(sheet, flush_rows=10, flush_seconds=None)
+        writer.add(5, "reply five", ARTICLE)
+        writer.add(3, "reply three")
+        assert sheet.calls == []
+
+        assert writer.close() == 2
+        assert sheet.calls == [[
+            {"range": "O3", "values": [["reply three"]]},
+            {"range": "O5:Q5", "values": [["reply five", "AI news", "Body text"]]},
+        ]]
+
+    def test_flushes_every_n_rows(self):
+        """Reaching flush_rows triggers a write without waiting for close"""
+        sheet = FakeSheet()
+        writer = SheetWriteBuffer(sheet, flush_rows=2, flush_seconds=None)
+        for row in range(2, 7):
+            writer.add(row, f"reply {row}")
+        assert [len(batch) for batch in sheet.calls] == [2, 2]
+        writer.close()
+        assert [len(batch) for batch in sheet.calls] == [2, 2, 1]
+
+    def test_quota_errors_are_retried(self, monkeypatch):
+        """429 responses back off and retry; the batch is written once"""
+        monkeypatch.setattr(sheet_writer.time, "sleep", lambda seconds: None)
+        sheet = FakeSheet(failures=[QuotaError(), QuotaError()])
+        writer = SheetWriteBuffer(sheet, flush_seconds=None)
+        writer.add(2, "reply")
+        assert writer.close() == 1
+        assert len(sheet.calls) == 1
+
+    def test_failed_rows_stay_pending(self):
+        """Non-quota errors propagate and keep the rows queued for the next flush"""
+        sheet = FakeSheet(failures=[RuntimeError("network down")])
+        writer = SheetWriteBuffer(sheet, flush_seconds=None)
+        writer.add(2, "reply")
+        with pytest.raises(RuntimeError):
+            writer.flush()
+        assert writer.pending_count() == 1
+        assert writer.close() == 1
@@ -0,0 +1,62 @@
+"""
+Tests for the dependency-graph step executor
+"""
+import threading
+import time
+
+import pytest
+
+from step_graph import StepGraph
+
+
+class TestStepGraph:
+    """Test dependency ordering, concurrency and timings"""
+
+    def test_passes_inputs_by_name(self):
+        """Dependent steps receive their inputs as keyword arguments"""
+        graph = StepGraph()
+        graph.add('a', lambda: 2)
+        graph.add('b', lambda: 3)
+        graph.add('product', lambda a, b: a * b, inputs=['a', 'b'])
+        assert graph.run()['product'] == 6
+
+    def test_independent_steps_run_concurrently(self):
+        """Two independent steps overlap instead of running back to back"""
+        barrier = threading.Barrier(2, timeout=2)
+        graph = StepGraph()
+        graph.add('left', lambda: barrier.wait() is not None)
+        graph.add('right', lambda: barrier.wait() is not None)
+        results = graph.run(max_workers=2)
+        assert results == {'left': True, 'right': True}
+
+    def test_records_timings(self):
+        """Every step gets a timing entry"""
+        graph = StepGraph()
+        graph.add('sleep', lambda: time.sleep(0.01))
+        graph.add('after', lambda sleep: 'done', inputs=['sleep'])
+        graph.run()
+        assert set(graph.timings) == {'sleep', 'after'}
+        assert graph.timings['sleep'] >= 0.01
+
+    def test_error_stops_dependents(self):
+        """A failing step is re-raised and its dependents never run"""
+        ran = []
+        graph = StepGraph()
+        graph.add('boom', lambda: 1 / 0)
+        graph.add('child', lambda boom: ran.append(boom), inputs=['boom'])
+        with pytest.raises(ZeroDivisionError):
+            graph.run()
+        assert ran == []
+
+    def test_rejects_cycles_and_unknown_inputs(self):
+        """Invalid graphs fail before any step runs"""
+        graph = StepGraph()
+        graph.add('a', lambda b: b, inputs=['b'])
+        graph.add('b', lambda a: a, inputs=['a'])
+        with pytest.raises(ValueError):
+            graph.run()
+
+        graph = StepGraph()
+        graph.add('a', lambda missing: missing, inputs=['missing'])
+        with pytest.raises(ValueError):
+            graph.run()
@@ -0,0 +1,83 @@
+"""
+Tests for the coalescing GUI event queue
+"""
+import threading
+
+from ui_queue import UIEventQueue
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+        self.redraws = 0
+
+    def after(self, ms, fn):
+        self.scheduled.append((ms, fn))
+
+    def update_idletasks(self):
+        self.redraws += 1
+
+
+class TestUIEventQueue:
+    """Test merging, ordering and frame-based draining"""
+
+    def test_updates_to_same_widget_are_merged(self):
+        queue = UIEventQueue()
+        applied = []
+        for n in range(100):
+            queue.post(('info', 'commenter'), applied.append, f"commenter {n}")
+        queue.post('status', applied.append, "status")
+
+        assert queue.pending() == 2
+        assert queue.drain() == 2
+        assert applied == ["commenter 99", "status"]
+        assert queue.drain() == 0
+
+    def test_latest_post_moves_to_the_end(self):
+        queue = UIEventQueue()
+        applied = []
+        queue.post('a', applied.append, "a1")
+        queue.post('b', applied.append, "b")
+        queue.post('a', applied.append, "a2")
+        queue.drain()
+        assert applied == ["b", "a2"]
+
+    def test_one_off_calls_are_never_merged(self):
+        queue = UIEventQueue()
+        applied = []
+        queue.call(applied.append, 1)
+        queue.call(applied.append, 2)
+        queue.drain()
+        assert applied == [1, 2]
+
+    def test_concurrent_posts_from_workers(self):
+        queue = UIEventQueue()
+        applied = {}
+
+        def worker(n):
+            for i in range(200):
+                queue.post(('info', n), applied.__setitem__, n, i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert queue.drain() == 8
+        assert applied == {n: 199 for n in range(8)}
+
+    def test_one_redraw_per_frame(self):
+        root = FakeRoot()
+        queue = UIEventQueue()
+        queue.start(root, fps=50)
+        assert root.scheduled[0][0] == 20
+
+        for n in range(10):
+            queue.post(('info', n), lambda: None)
+        _, tick = root.scheduled.pop()
+        tick()
+        assert root.redraws == 1
+        _, tick = root.scheduled.pop()
+        tick()                       # empty frame: no redraw
+        assert root.redraws == 1
@@ -0,0 +1,148 @@
+"""
+Tests for the resident webhook service
+"""
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from webhook_server import InvalidPayload, WebhookService, parse_row, serve
+
+
+class FakeSheet:
+    def __init__(self):
+        self.batches = []
+
+    def batch_update(self, data):
+        self.batches.append(data)
+
+
+class FakeResponder:
+    """Stands in for a warm NewsSheetResponder"""
+
+    def __init__(self):
+        self.sheet = FakeSheet()
+        self.calls = 0
+        self.article = {"title": "AI news", "description": "Body"}
+
+    def find_article_by_id(self, comment_id):
+        return self.article if comment_id == "123" else None
+
+    def respond_to_webhook(self, comment_data):
+        self.calls += 1
+        article = self.find_article_by_id(comment_data.get("id", ""))
+        return {
+            "suggested_response": f"Thanks {comment_data.get('profile_name', 'Someone')}!",
+            "source": "ChatGPT",
+            "article_found": article is not None,
+            "article_title": article["title"] if article else None,
+            "post_content": article["description"] if article else None,
+        }
+
+
+def post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode(),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+class TestWebhookService:
+    """Test request handling against one warm responder"""
+
+    def test_concurrent_requests_share_one_responder(self):
+        responder = FakeResponder()
+        service = WebhookService(responder)
+        server = serve(service, "127.0.0.1", 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            threads = [
+                threading.Thread(target=post, args=(f"{url}/webhook", {"id": "123", "profile_name": f"P{n}", "row": n + 2}))
+                for n in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            result = post(f"{url}/webhook", {"id": "999", "profile_name": "Ada"})
+            assert result["suggested_response"] == "Thanks Ada!"
+            assert result["article_found"] is False
+
+            with urllib.request.urlopen(f"{url}/health", timeout=5) as response:
+                health = json.loads(response.read())
+            assert health["handled"] == 6
+            assert health["pending_writes"] == 5
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+        assert responder.calls == 6
+        # The five row write-backs went out as one micro-batch
+        assert len(responder.sheet.batches) == 1
+        assert sorted(u["range"] for u in responder.sheet.batches[0]) == [f"O{n}:Q{n}" for n in range(2, 7)]
+
+    def test_invalid_row_is_rejected_before_the_reply(self):
+        """A non-numeric row is a 400, and no AI reply is generated for it"""
+        responder = FakeResponder()
+        service = WebhookService(responder)
+        server = serve(service, "127.0.0.1", 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            with pytest.raises(urllib.error.HTTPError) as error:
+                post(f"{url}/webhook", {"id": "123", "profile_name": "Ada", "row": "five"})
+            assert error.value.code == 400
+            assert "invalid row" in json.loads(error.value.read())["error"]
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+        assert responder.calls == 0
+        assert service.errors == 0
+
+    def test_invalid_content_length_is_a_400(self):
+        service = WebhookService(FakeResponder())
+        server = serve(service, "127.0.0.1", 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        try:
+            statuses = []
+            for length in ("abc", "-5"):
+                conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+                conn.putrequest("POST", "/webhook")
+                conn.putheader("Content-Type", "application/json")
+                conn.putheader("Content-Length", length)
+                conn.endheaders()
+                response = conn.getresponse()
+                statuses.append((response.status, json.loads(response.read())["error"]))
+                conn.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+        assert statuses == [(400, "invalid Content-Length")] * 2
+
+
+class TestParseRow:
+    """Test validation of the payload's sheet row"""
+
+    def test_valid_rows(self):
+        assert parse_row(None) is None
+        assert parse_row("") is None
+        assert parse_row(7) == 7
+        assert parse_row(" 12 ") == 12
+
+    @pytest.mark.parametrize("value", ["five", "3.5", 3.5, True, [4], 1, "0", -3])
+    def test_invalid_rows(self, value):
+        with pytest.raises(InvalidPayload):
+            parse_row(value)
@@ -0,0 +1,63 @@
+"""
+Coalescing UI event queue for the Tk GUI
+- Worker threads post state changes instead of scheduling root.after callbacks
+- Updates to the same widget (same key) are merged: only the latest one runs
+- The Tk main loop drains the queue at a fixed frame rate and redraws once per frame
+"""
+
+import threading
+from collections import OrderedDict
+from itertools import count
+
+UI_FPS = 30
+
+
+class UIEventQueue:
+    """Thread-safe {key: (fn, args)} drained on the Tk thread"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = OrderedDict()
+        self.sequence = count()
+        self.posted = 0
+        self.applied = 0
+        self.root = None
+        self.interval_ms = int(1000 / UI_FPS)
+
+    def post(self, key, fn, *args):
+        """Queue fn(*args); a later post with the same key replaces this one"""
+        with self.lock:
+            self.events.pop(key, None)
+            self.events[key] = (fn, args)
+            self.posted += 1
+
+    def call(self, fn, *args):
+        """Queue a one-off call that is never merged (dialogs, button states)"""
+        self.post(('call', next(self.sequence)), fn, *args)
+
+    def pending(self):
+        with self.lock:
+            return len(self.events)
+
+    def drain(self):
+        """Run every queued update (latest per key, in posting order); returns how many ran"""
+        with self.lock:
+            events, self.events = self.events, OrderedDict()
+        for fn, args in events.values():
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"UI update error: {e}")
+        self.applied += len(events)
+        return len(events)
+
+    def start(self, root, fps=UI_FPS):
+        """Drain on the Tk thread every 1/fps seconds, with one redraw per frame"""
+        self.root = root
+        self.interval_ms = max(1, int(1000 / fps))
+        root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        if self.drain():
+            self.root.update_idletasks()
+        self.root.after(self.interval_ms, self._tick)
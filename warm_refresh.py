@@ -0,0 +1,50 @@
+"""
+Background refresh for a long-lived responder
+- Re-fetches the RSS index (conditional GET) and re-reads the API KEY tab on
+  a timer, so the webhook server and watch mode stay warm without blocking replies
+"""
+
+import threading
+import time
+
+RSS_REFRESH_SECONDS = 300
+API_KEY_REFRESH_SECONDS = 900
+
+
+class WarmRefresher:
+    """Daemon thread calling responder.feed.refresh_async() and responder.load_api_keys()"""
+
+    def __init__(self, responder, rss_every=RSS_REFRESH_SECONDS, keys_every=API_KEY_REFRESH_SECONDS):
+        self.responder = responder
+        self.rss_every = rss_every
+        self.keys_every = keys_every
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+
+        def run():
+            last_rss = last_keys = time.monotonic()
+            while not self.stop_event.wait(1.0):
+                now = time.monotonic()
+                if now - last_rss >= self.rss_every:
+                    last_rss = now
+                    self.responder.feed.refresh_async()
+                if now - last_keys >= self.keys_every:
+                    last_keys = now
+                    try:
+                        self.responder.load_api_keys()
+                    except Exception as e:
+                        print(f"⚠️ API key refresh failed: {e}")
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Resident webhook service for the comment responder
+- One warm NewsSheetResponder (sheet auth, API keys, RSS index and pooled
+  HTTP connections are set up once, not per webhook)
+- RSS index and API keys refresh on a background thread
+- Concurrent requests via ThreadingHTTPServer
+- Optional sheet write-back: payloads carrying a "row" are micro-batched
+  through a SheetWriteBuffer instead of written one by one
+
+Usage: python webhook_server.py [--host 127.0.0.1] [--port 8787]
+
+    POST /webhook   JSON body as documented in handle_zapier_webhook (+ optional "row")
+    GET  /health    warm-state and counters
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sheet_writer import SheetWriteBuffer
+from warm_refresh import API_KEY_REFRESH_SECONDS, RSS_REFRESH_SECONDS, WarmRefresher
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+WRITE_FLUSH_ROWS = 10
+WRITE_FLUSH_SECONDS = 2
+MAX_BODY_BYTES = 1_000_000
+
+
+class InvalidPayload(ValueError):
+    """Webhook payload rejected before any AI call (HTTP 400)"""
+
+
+def parse_row(value):
+    """Sheet row from the payload's "row": None if absent, else an int >= 2 (row 1 is the header)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        row = value
+    elif isinstance(value, str) and value.strip().isdigit():
+        row = int(value)
+    else:
+        raise InvalidPayload(f"invalid row: {value!r}")
+    if row < 2:
+        raise InvalidPayload(f"invalid row: {value!r} (data rows start at 2)")
+    return row
+
+
+class WebhookService:
+    """Keeps a responder warm and turns webhook payloads into suggested replies"""
+
+    def __init__(self, responder, rss_refresh=RSS_REFRESH_SECONDS, key_refresh=API_KEY_REFRESH_SECONDS):
+        self.responder = responder
+        self.writer = None
+        if getattr(responder, 'sheet', None) is not None:
+            self.writer = SheetWriteBuffer(
+                responder.sheet, flush_rows=WRITE_FLUSH_ROWS, flush_seconds=WRITE_FLUSH_SECONDS
+            )
+        self.refresher = WarmRefresher(responder, rss_refresh, key_refresh)
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.handled = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+
+    def handle(self, comment_data):
+        """Generate a reply; queue the sheet write if the payload names a row"""
+        row = parse_row(comment_data.get('row'))     # reject a bad row before paying for a reply
+        with self.lock:
+            self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            result = self.responder.respond_to_webhook(comment_data)
+            if row and self.writer is not None:
+                article = None
+                if result.get('article_found'):
+                    article = self.responder.find_article_by_id(comment_data.get('id', ''))
+                self.writer.add(row, result['suggested_response'], article)
+                result['queued_row'] = row
+            with self.lock:
+                self.handled += 1
+            return result
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.in_flight -= 1
+                self.total_seconds += elapsed
+
+    def health(self):
+        with self.lock:
+            handled, errors, in_flight, total = self.handled, self.errors, self.in_flight, self.total_seconds
+        feed = getattr(self.responder, 'feed', None)
+        latency = getattr(self.responder, 'latency', None)
+        replies = getattr(self.responder, 'replies', None)
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started),
+            "handled": handled,
+            "errors": errors,
+            "in_flight": in_flight,
+            "avg_seconds": round(total / handled, 3) if handled else None,
+            "rss_posts": feed.post_count() if feed is not None else None,
+            "pending_writes": self.writer.pending_count() if self.writer else 0,
+            "providers": latency.snapshot() if latency is not None else {},
+            "replies": replies.snapshot() if replies is not None else {},
+        }
+
+    def start_background_refresh(self):
+        """Refresh the RSS index and API keys periodically, off the request path"""
+        self.refresher.start()
+
+    def close(self):
+        self.refresher.stop()
+        if self.writer:
+            self.writer.close()
+
+
+def make_handler(service):
+    """Request handler class bound to a WebhookService"""
+
+    class WebhookHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip('/') == "/health":
+                self._send_json(200, service.health())
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path.rstrip('/') != "/webhook":
+                self._send_json(404, {"error": "not found"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                self.close_connection = True     # the body can't be delimited; don't reuse the socket
+                self._send_json(400, {"error": "invalid Content-Length"})
+                return
+            if length > MAX_BODY_BYTES:
+                self._send_json(413, {"error": "payload too large"})
+                return
+            try:
+                comment_data = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(comment_data, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:
+                self._send_json(400, {"error": f"invalid JSON: {e}"})
+                return
+
+            try:
+                self._send_json(200, service.handle(comment_data))
+            except InvalidPayload as e:
+                self._send_json(400, {"error": str(e)})
+            except Exception as e:
+                print(f"❌ Webhook error: {e}")
+                self._send_json(500, {"error": str(e)})
+
+        def log_message(self, format, *args):
+            print(f"🌐 {self.address_string()} {format % args}")
+
+    return WebhookHandler
+
+
+def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Build the HTTP server (call serve_forever() on the result)"""
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="news-intel serve", description="Resident webhook service for the comment responder")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    from news_sheet_comment_responder import get_responder
+
+    print("🔥 Warming up responder (sheet, API keys, RSS index)...")
+    service = WebhookService(get_responder())
+    service.start_background_refresh()
+
+    server = serve(service, args.host, args.port)
+    print(f"✅ Listening on http://{args.host}:{args.port}/webhook")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()